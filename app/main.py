@@ -2,17 +2,19 @@ import streamlit as st
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Ensure the root directory is in the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.nlp.clean_text import clean_srs_text
 from src.nlp.parser import SRSParser
-from src.nlp.extractor import UMLExtractor
-from src.logic.classifier import RelationshipClassifier
 from src.generators.plantuml import PlantUMLGenerator
 from src.generators.xmi import XMIGenerator
 from src.utils.graph_ui import render_interactive_graph
+from src.utils.background import ExtractionJob, run_extraction_job
+from src.utils.data_views import build_model_tables, render_table_panel
+from src.logic.analytics import ModelAnalytics
+from src.core.config import UI_WORKER_THREADS
 
 # --- Page Configuration ---
 st.set_page_config(page_title="UML Generator Pro", page_icon="⚡", layout="wide", initial_sidebar_state="expanded")
@@ -53,17 +55,29 @@ if 'components' not in st.session_state:
     st.session_state.components = {"classes": [], "attributes": [], "methods": []}
 if 'relationships' not in st.session_state:
     st.session_state.relationships = []
+if 'job' not in st.session_state:
+    st.session_state.job = None
+if 'analytics' not in st.session_state:
+    st.session_state.analytics = ModelAnalytics()
 if 'srs_text' not in st.session_state:
     st.session_state.srs_text = "The Library Management System shall allow a User to borrow books.\nA Librarian is a User.\nThe Library contains Books."
 
-# --- Cached NLP Model Loading ---
+# --- Cached NLP Model Loading (one per processing engine) ---
+ENGINE_OPTIONS = {
+    "spaCy en_core_web_sm (Accurate)": "spacy",
+    "Rule-based shallow parser (Fast)": "fast"
+}
+
+@st.cache_resource
+def load_parser(engine):
+    return SRSParser(engine)
+
+# --- Shared Worker Pool (bounded, shared by all sessions) ---
 @st.cache_resource
-def load_parser():
-    return SRSParser()
+def get_worker_pool():
+    return ThreadPoolExecutor(max_workers=UI_WORKER_THREADS, thread_name_prefix="uml-extract")
 
-parser = load_parser()
-extractor = UMLExtractor()
-classifier = RelationshipClassifier()
+worker_pool = get_worker_pool()
 puml_gen = PlantUMLGenerator()
 xmi_gen = XMIGenerator()
 
@@ -95,8 +109,10 @@ with st.sidebar:
         st.slider("Confidence Threshold", min_value=0.50, max_value=1.00, value=0.85, step=0.05, 
                   help="Adjust how strict the AI is when identifying relationships.")
         st.toggle("Strict Inheritance Mode", value=True, help="Only use 'is a' exact lexical matching.")
-        st.selectbox("Processing Engine", ["spaCy en_core_web_sm (Fast)", "Transformers (Pro Only)"], disabled=True)
-        st.caption("Upgrade your plan to unlock transformer-based extraction.")
+        engine_label = st.selectbox("Processing Engine", list(ENGINE_OPTIONS))
+        st.caption("The fast engine previews large documents an order of magnitude quicker, at some cost in recall.")
+
+    parser = load_parser(ENGINE_OPTIONS[engine_label])
 
     st.markdown("---")
     
@@ -108,6 +124,9 @@ with st.sidebar:
         reset_btn = st.button("🗑️", help="Purge Session Memory")
         
     if reset_btn:
+        if st.session_state.job is not None:
+            st.session_state.job.cancel()
+        st.session_state.job = None
         st.session_state.extracted = False
         st.session_state.components = {"classes": [], "attributes": [], "methods": []}
         st.session_state.relationships = []
@@ -117,23 +136,37 @@ with st.sidebar:
         if not user_input.strip():
             st.error("Input buffer empty.")
         else:
-            with st.status("Initializing NLP Pipeline...", expanded=True) as status:
-                st.write("Sanitizing text buffer...")
-                cleaned_text = clean_srs_text(user_input)
-                time.sleep(0.3)
-                
-                st.write("Loading semantic parser...")
-                doc = parser.parse(cleaned_text)
-                
-                st.write("Extracting component entities...")
-                st.session_state.components = extractor.extract_components(doc)
-                time.sleep(0.3)
-                
-                st.write("Mapping relational topologies...")
-                st.session_state.relationships = classifier.classify_relationships(doc, st.session_state.components['classes'])
-                
-                st.session_state.extracted = True
-                status.update(label="Extraction Complete!", state="complete", expanded=False)
+            # Replace any running job of this session, then hand the work to the shared pool
+            if st.session_state.job is not None:
+                st.session_state.job.cancel()
+            job = ExtractionJob()
+            worker_pool.submit(run_extraction_job, job, user_input, parser)
+            st.session_state.job = job
+
+    job = st.session_state.job
+    if job is not None:
+        # Publish whatever the worker has produced so far
+        components, relationships = job.snapshot()
+        if components['classes'] or not job.active:
+            st.session_state.components = components
+            st.session_state.relationships = relationships
+            st.session_state.extracted = True
+
+        if job.active:
+            label = "Queued: waiting for a free worker..." if job.state == "queued" else \
+                f"Extracting... {job.done}/{job.total} sentences"
+            with st.status(label, expanded=True, state="running"):
+                st.progress(job.progress())
+                st.write(f"Classes so far: {len(components['classes'])} | Relationships: {len(relationships)}")
+                if st.button("⏹️ Cancel Extraction", use_container_width=True):
+                    job.cancel()
+        elif job.state == "done":
+            st.status("Extraction Complete!", state="complete", expanded=False)
+        elif job.state == "cancelled":
+            st.status(f"Cancelled after {job.done}/{job.total} sentences (partial results shown).",
+                      state="error", expanded=False)
+        elif job.state == "failed":
+            st.status(f"Extraction failed: {job.error}", state="error", expanded=False)
 
     # --- SIDEBAR FOOTER ---
     st.markdown("<br><br><br>", unsafe_allow_html=True) # Push to bottom
@@ -165,6 +198,19 @@ else:
     m2.metric("Attributes Found", len(st.session_state.components['attributes']))
     m3.metric("Methods Found", len(st.session_state.components['methods']))
     m4.metric("Relationships Mapped", len(st.session_state.relationships))
+
+    # Graph analytics are updated incrementally as partial results arrive, and cached per model hash
+    report = st.session_state.analytics.update(st.session_state.components['classes'], st.session_state.relationships)
+    hubs = report['hubs']['fan_in']
+    a1, a2, a3, a4 = st.columns(4)
+    a1.metric("Max Inheritance Depth", report['inheritance']['max_depth'],
+              help=f"Mean depth {report['inheritance']['mean_depth']}")
+    a2.metric("Inheritance Cycles", len(report['inheritance']['cycles']),
+              help="; ".join(" -> ".join(cycle) for cycle in report['inheritance']['cycles'][:5]) or None)
+    a3.metric("Orphan Classes", len(report['orphans']), help=", ".join(report['orphans'][:20]) or None)
+    a4.metric("Top Fan-in Hub", hubs[0][0] if hubs else "-", help=f"{hubs[0][1]} incoming relationship(s)" if hubs else None)
+    if report['clusters']:
+        st.caption(f"{len(report['clusters'])} strongly connected cluster(s); largest: {', '.join(report['clusters'][0][:10])}")
     
     st.markdown("---")
     
@@ -177,30 +223,24 @@ else:
 
     with col_data:
         st.subheader("🧩 Structured Data")
+        # Tables and search indexes are built once per published model, not on every rerun
+        if st.session_state.get('tables_for') is not st.session_state.components:
+            st.session_state.tables = build_model_tables(st.session_state.components, st.session_state.relationships)
+            st.session_state.tables_for = st.session_state.components
+        tables = st.session_state.tables
+
         with st.expander("View Classes", expanded=True):
-            for cls in st.session_state.components['classes']:
-                st.markdown(f"- `{cls}`")
-                
+            render_table_panel(tables['classes'], key="classes_view")
+
         with st.expander("View Attributes & Methods"):
             st.write("**Attributes:**")
-            if st.session_state.components['attributes']:
-                st.code("\n".join([f"{c}.{a}" for c, a in st.session_state.components['attributes']]))
-            else:
-                st.write("*None detected*")
-                
+            render_table_panel(tables['attributes'], key="attributes_view")
+
             st.write("**Methods:**")
-            if st.session_state.components['methods']:
-                st.code("\n".join([f"{c}.{m}()" for c, m in st.session_state.components['methods']]))
-            else:
-                st.write("*None detected*")
-            
+            render_table_panel(tables['methods'], key="methods_view")
+
         with st.expander("View Relationships"):
-            if st.session_state.relationships:
-                for s, r, t in st.session_state.relationships:
-                    color = "#10B981" if r == "Inheritance" else "#3B82F6"
-                    st.markdown(f"`{s}` <span style='color:{color}; font-weight:bold;'>--[{r}]--></span> `{t}`", unsafe_allow_html=True)
-            else:
-                st.write("*No relationships mapped.*")
+            render_table_panel(tables['relationships'], key="relationships_view")
 
     st.markdown("---")
     st.header("💾 Code Export")
@@ -230,4 +270,9 @@ else:
         st.download_button("Download .xmi", data=xmi_code, file_name="architecture.xmi", mime="application/xml", use_container_width=True)
 
 # --- MAIN PAGE FOOTER ---
-st.markdown("<div class='custom-footer'>Project created by <b>Md Asif Khan</b> (Roll Num: 10830622038)</div>", unsafe_allow_html=True)
\ No newline at end of file
+st.markdown("<div class='custom-footer'>Project created by <b>Md Asif Khan</b> (Roll Num: 10830622038)</div>", unsafe_allow_html=True)
+
+# --- Poll the background job: rerun until it finishes so progress and partial results refresh ---
+if st.session_state.job is not None and st.session_state.job.active:
+    time.sleep(0.5)
+    st.rerun()
\ No newline at end of file
@@ -1,23 +1,59 @@
 import os
+import time
 import logging
 import json
+import argparse
+from contextlib import nullcontext
 
-from src.core.config import INPUT_DIR, OUTPUT_DIR
+from src.core.config import (
+    INPUT_DIR, OUTPUT_DIR, PROCESSING_ENGINE, ITER_BATCH_SENTENCES, ITER_FIRST_BATCH_SENTENCES,
+    MAX_DOC_CHARS, MAX_SENTENCE_WORDS, MAX_DOC_SECONDS, MAX_DOC_MEMORY_MB
+)
+from src.core.budget import ResourceBudget, BudgetExceeded, split_sentences
 from src.nlp.clean_text import clean_srs_text
-from src.nlp.parser import SRSParser
+from src.nlp.parser import SRSParser, ENGINES
 from src.nlp.extractor import UMLExtractor
+from src.nlp.array_engine import ArrayExtractor, TokenArrays
+from src.nlp.sentence_memo import SentenceMemo, MemoizedExtractor
+from src.nlp.parallel_extract import ParallelExtractor
+from src.nlp.prefilter import SentenceFilter
 from src.logic.classifier import RelationshipClassifier
+from src.logic.analytics import ModelAnalytics
+from src.logic.accumulator import sentence_entry, ModelAccumulator
 from src.generators.plantuml import PlantUMLGenerator
 from src.generators.xmi import XMIGenerator
+from src.generators.delta import DeltaExporter, load_model
+from src.generators.svg import SVGGenerator
+from src.generators.sharding import ShardedDiagramGenerator
+from src.utils.columnar import ColumnarStore, flatten_model
+from src.utils.memory_profiler import StageMemoryProfiler
+from src.utils.component_index import ComponentIndex
+from src.utils.pipelined import PipelinedExecutor
+from src.utils.rule_stats import RuleStats
 
 # Set up logging for the CLI pipeline
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("EndToEndPipeline")
 
-def run_pipeline(input_filename="sample_srs.txt"):
-    """
-    Runs the fully automated, headless UML generation pipeline.
-    """
+def _checkpoint(budget, stage):
+    """Checks the document budget after a stage; only 'skip' budgets abort the document."""
+    if budget is None:
+        return
+    try:
+        budget.check(stage)
+    except BudgetExceeded as exc:
+        if budget.on_exceed == "skip":
+            raise
+        budget.record(stage, exc.reason)
+
+
+def _stage(profiler, name):
+    """Wraps a pipeline stage in the memory profiler when --profile-memory is on."""
+    return profiler.stage(name) if profiler is not None else nullcontext()
+
+
+def _read_input(input_filename):
+    """Steps 0-1: returns the raw text of an input file (creating the sample input if missing)."""
     input_path = os.path.join(INPUT_DIR, input_filename)
     
     # --- Step 0: Ensure input file exists ---
@@ -34,61 +70,498 @@ def run_pipeline(input_filename="sample_srs.txt"):
     # --- Step 1: Read & Preprocess ---
     logger.info(f"Reading input from: {input_path}")
     with open(input_path, "r", encoding="utf-8") as f:
-        raw_text = f.read()
+        return f.read()
+
+
+def _write_file(path, content):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def run_pipeline(input_filename="sample_srs.txt", use_token_arrays=False, parser=None, render_svg=False,
+                 budget=None, memo=None, profile_memory=False, shard=False, engine=PROCESSING_ENGINE,
+                 index=None, prefetched=None, writer=None, split_document=False, analytics=None, prefilter=False,
+                 rule_stats=None, delta=False):
+    """
+    Runs the fully automated, headless UML generation pipeline.
+    With use_token_arrays=True the Doc is exported once to NumPy arrays and
+    extraction/classification run on the vectorized ArrayExtractor engine.
+    Pass an existing `parser` to reuse a loaded spaCy model across documents;
+    otherwise one is created for `engine` ("spacy" or the faster "fast").
+    With render_svg=True a native SVG diagram is written next to the .puml.
+    A ResourceBudget bounds characters, sentence length, wall time and memory;
+    its `report` records whether the document was degraded or skipped.
+    With a SentenceMemo, sentences seen before (in any document or run) reuse
+    their cached extraction instead of being parsed again.
+    With profile_memory=True, tracemalloc and RSS are recorded around every
+    stage and written to <name>_memory.json.
+    With shard=True the model is also split into renderable per-shard
+    .puml/.xmi files plus an index diagram under <name>_shards/.
+    With a ComponentIndex, the extracted facts, their confidence and their
+    source sentences are upserted into the corpus-wide SQLite index.
+    `prefetched` is a (raw_text, cleaned_text) pair already read by a
+    prefetcher, and `writer(path, content)` replaces the synchronous output
+    writes (see run_batch(overlap_io=True)).
+    With split_document=True one large document is split into sentence-aligned
+    shards (at section headings where possible) that are parsed and extracted
+    on a process pool; the merged model is identical to a serial run. It
+    cannot be combined with a memo or use_token_arrays (ValueError).
+    Graph analytics (inheritance depth/cycles, hubs, orphans, clusters) are
+    saved under "analytics" in the components JSON; pass the same
+    ModelAnalytics across runs to update them incrementally.
+    With prefilter=True, sentences that cannot yield requirements (tables of
+    contents, references, boilerplate, table rows, bare headings) are dropped
+    before parsing and the drop counts are logged.
+    With a RuleStats, every extraction/classification rule counts the tokens
+    it examined, its matches, its emitted items and its time for this
+    document, and the components JSON gets a "provenance" key mapping each
+    item to the rule(s) that produced it. Only the default rule path is
+    instrumented (not the memo, token-array or split-document paths).
+    With delta=True the model is compared with the previous run's components
+    JSON and only the added/removed/changed elements are written as
+    <name>_delta.json/.xmi/.puml patches, keyed by the stable XMI ids.
+    Returns the extracted data as saved in the components JSON.
+    """
+    if split_document and (memo is not None or use_token_arrays):
+        raise ValueError("split_document cannot be combined with a sentence memo or token arrays")
+
+    if prefetched is not None:
+        raw_text, cleaned_text = prefetched
+    else:
+        raw_text, cleaned_text = _read_input(input_filename), None
+
+    if parser is None:
+        logger.info("Initializing NLP Parser...")
+        parser = SRSParser(engine)
+
+    profiler = StageMemoryProfiler(input_filename) if profile_memory else None
+    if budget is not None:
+        budget.start(input_filename)
+    if rule_stats is not None:
+        rule_stats.start_document(input_filename)
+
+    try:
+        return _run_stages(
+            input_filename, raw_text, use_token_arrays, parser, render_svg, budget, memo, profiler, shard, index,
+            split_document, analytics or ModelAnalytics(), prefilter, cleaned_text, writer or _write_file, rule_stats,
+            delta
+        )
+    except BudgetExceeded as exc:
+        budget.record(exc.stage, f"{exc.reason}; document skipped", status="skipped")
+        return {"components": {"classes": [], "attributes": [], "methods": []}, "relationships": []}
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            base_name = os.path.splitext(input_filename)[0]
+            profiler.write(os.path.join(OUTPUT_DIR, f"{base_name}_memory.json"))
+
+
+def _run_stages(input_filename, raw_text, use_token_arrays, parser, render_svg, budget, memo, profiler, shard,
+                index, split_document, analytics, prefilter, cleaned_text, write, rule_stats=None,
+                delta=False):
+    """Steps 1-5 of run_pipeline, after the input has been read."""
+    with _stage(profiler, "clean"):
+        if cleaned_text is None:
+            cleaned_text = clean_srs_text(raw_text)
+        if budget is not None:
+            cleaned_text = budget.prepare_text(cleaned_text)
+
+    # The index keeps offsets into the full cleaned text; only parsing sees the filtered text
+    parse_text = cleaned_text
+    if prefilter:
+        with _stage(profiler, "prefilter"):
+            parse_text, _ = SentenceFilter().filter_text(cleaned_text)
+
+    if memo is not None:
+        # --- Steps 2-3: Memoized per-sentence Parsing, Extraction & Classification ---
+        logger.info("Extracting UML Components via sentence memo...")
+        with _stage(profiler, "memo_extract"):
+            components, relationships = MemoizedExtractor(memo, parser).run(parse_text, budget)
+    elif split_document:
+        # --- Steps 2-3: Sharded Parsing, Extraction & Classification on a process pool ---
+        logger.info("Extracting UML Components from document shards...")
+        with _stage(profiler, "parallel_extract"):
+            components, relationships = ParallelExtractor(parser).run(raw_text, parse_text, budget)
+    else:
+        # --- Step 2: NLP Parsing ---
+        with _stage(profiler, "parse"):
+            if budget is not None:
+                doc = parser.parse_with_budget(parse_text, budget)
+            else:
+                doc = parser.parse(parse_text)
         
-    cleaned_text = clean_srs_text(raw_text)
-    
-    # --- Step 2: NLP Parsing ---
-    logger.info("Initializing NLP Parser...")
-    parser = SRSParser()
-    doc = parser.parse(cleaned_text)
-    
-    # --- Step 3: Extraction & Classification ---
-    logger.info("Extracting UML Components...")
-    extractor = UMLExtractor()
-    components = extractor.extract_components(doc)
-    
-    logger.info("Classifying Relationships...")
-    classifier = RelationshipClassifier()
-    relationships = classifier.classify_relationships(doc, components['classes'])
+        # --- Step 3: Extraction & Classification ---
+        if use_token_arrays:
+            logger.info("Exporting Doc to token arrays...")
+            with _stage(profiler, "to_array"):
+                doc = TokenArrays.from_doc(doc)
+            extractor = classifier = ArrayExtractor()
+        else:
+            extractor = UMLExtractor(stats=rule_stats)
+            classifier = RelationshipClassifier(stats=rule_stats)
+
+        logger.info("Extracting UML Components...")
+        with _stage(profiler, "extract"):
+            components = extractor.extract_components(doc)
+        
+        logger.info("Classifying Relationships...")
+        with _stage(profiler, "classify"):
+            relationships = classifier.classify_relationships(doc, components['classes'])
+
+        # Drop the Doc before generation so its memory is not attributed to later stages
+        del doc
+    _checkpoint(budget, "extract")
+
+    with _stage(profiler, "analytics"):
+        analytics_report = analytics.update(components['classes'], relationships)
     
     # --- Step 4: Code Generation ---
     logger.info("Generating PlantUML and XMI code...")
     puml_gen = PlantUMLGenerator()
     xmi_gen = XMIGenerator()
     
-    puml_code = puml_gen.generate_puml(
-        components['classes'], components['attributes'], components['methods'], relationships
-    )
+    with _stage(profiler, "generate_puml"):
+        puml_code = puml_gen.generate_puml(
+            components['classes'], components['attributes'], components['methods'], relationships
+        )
     
-    xmi_code = xmi_gen.generate_xmi(
-        components['classes'], components['attributes'], components['methods'], relationships
-    )
+    with _stage(profiler, "generate_xmi"):
+        xmi_code = xmi_gen.generate_xmi(
+            components['classes'], components['attributes'], components['methods'], relationships
+        )
+    
+    svg_code = None
+    if render_svg:
+        with _stage(profiler, "generate_svg"):
+            svg_code = SVGGenerator().generate_svg(
+                components['classes'], components['attributes'], components['methods'], relationships
+            )
     
+    sharded = None
+    if shard:
+        with _stage(profiler, "generate_shards"):
+            sharded = ShardedDiagramGenerator().generate(
+                components['classes'], components['attributes'], components['methods'], relationships
+            )
+
     # --- Step 5: Save Outputs ---
     base_name = os.path.splitext(input_filename)[0]
     puml_out_path = os.path.join(OUTPUT_DIR, f"{base_name}.puml")
     xmi_out_path = os.path.join(OUTPUT_DIR, f"{base_name}.xmi")
     json_out_path = os.path.join(OUTPUT_DIR, f"{base_name}_components.json")
     
-    with open(puml_out_path, "w", encoding="utf-8") as f:
-        f.write(puml_code)
-        
-    with open(xmi_out_path, "w", encoding="utf-8") as f:
-        f.write(xmi_code)
+    write(puml_out_path, puml_code)
+    write(xmi_out_path, xmi_code)
+
+    if svg_code is not None:
+        svg_out_path = os.path.join(OUTPUT_DIR, f"{base_name}.svg")
+        write(svg_out_path, svg_code)
+
+    if sharded is not None:
+        shard_dir = os.path.join(OUTPUT_DIR, f"{base_name}_shards")
+        os.makedirs(shard_dir, exist_ok=True)
+        write(os.path.join(shard_dir, "index.puml"), sharded["index"])
+        for shard_data in sharded["shards"]:
+            for ext in ("puml", "xmi"):
+                write(os.path.join(shard_dir, f"{shard_data['name']}.{ext}"), shard_data[ext])
         
-    with open(json_out_path, "w", encoding="utf-8") as f:
+    full_data = {"components": components, "relationships": relationships, "analytics": analytics_report}
+    if rule_stats is not None and rule_stats.provenance.get(input_filename):
+        full_data["provenance"] = rule_stats.provenance_json(input_filename)
+
+    delta_export = None
+    if delta:
+        # Must run before the components JSON of the previous run is overwritten
+        with _stage(profiler, "generate_delta"):
+            delta_export = DeltaExporter().export(load_model(json_out_path), full_data)
+        for ext in ("json", "xmi", "puml"):
+            write(os.path.join(OUTPUT_DIR, f"{base_name}_delta.{ext}"), delta_export[ext])
+
+    with _stage(profiler, "json_dump"):
         # Save the raw extracted components for debugging and evaluation
-        full_data = {"components": components, "relationships": relationships}
-        json.dump(full_data, f, indent=4)
+        write(json_out_path, json.dumps(full_data, indent=4))
+
+    if index is not None:
+        with _stage(profiler, "index"):
+            index.upsert_document(input_filename, cleaned_text, full_data)
         
     logger.info("=== PIPELINE COMPLETE ===")
     logger.info(f"Outputs saved to: {OUTPUT_DIR}")
     logger.info(f" - {os.path.basename(puml_out_path)}")
     logger.info(f" - {os.path.basename(xmi_out_path)}")
     logger.info(f" - {os.path.basename(json_out_path)}")
+    if svg_code is not None:
+        logger.info(f" - {os.path.basename(svg_out_path)}")
+    if sharded is not None:
+        logger.info(f" - {os.path.basename(shard_dir)}/ ({len(sharded['shards'])} shard(s) + index.puml)")
+    if delta_export is not None:
+        summary = ", ".join(
+            f"{kind} +{len(sides['added'])}/-{len(sides['removed'])}" for kind, sides in delta_export["diff"].items()
+        )
+        logger.info(f" - {base_name}_delta.json/.xmi/.puml ({summary})")
+
+    return full_data
+
+
+def iter_pipeline(text_or_path, parser=None, engine=PROCESSING_ENGINE, batch_sentences=ITER_BATCH_SENTENCES,
+                  first_batch_sentences=ITER_FIRST_BATCH_SENTENCES, snapshots=False, prefilter=False):
+    """
+    Progressive variant of run_pipeline's extraction: yields an event after
+    every sentence batch instead of returning once at the end.
+
+    `text_or_path` is SRS text, a file path or a file name in data/input.
+    Each "delta" event carries the classes, attributes and methods found in
+    the batch and the relationships added/removed since the previous event
+    (a new class can re-link earlier sentences); with snapshots=True it also
+    carries the whole model so far. The first batch is small so the first
+    classes arrive quickly. The last event is "final" with the consolidated
+    model and its analytics in the components-JSON layout. Nothing is
+    written to disk.
+
+    Work is pulled by the consumer: a batch is parsed only when the next
+    event is requested, so at most one batch is buffered and abandoning the
+    iterator stops the work.
+    """
+    started = time.perf_counter()
+    if os.path.isfile(text_or_path):
+        with open(text_or_path, "r", encoding="utf-8") as f:
+            raw_text = f.read()
+    elif os.path.isfile(os.path.join(INPUT_DIR, text_or_path)):
+        raw_text = _read_input(text_or_path)
+    else:
+        raw_text = text_or_path
+
+    if parser is None:
+        parser = SRSParser(engine)
+    text = clean_srs_text(raw_text)
+    if prefilter:
+        text, _ = SentenceFilter().filter_text(text)
+
+    sentences = split_sentences(text)
+    bounds, start = [], 0
+    while start < len(sentences):
+        end = start + (first_batch_sentences if not bounds else batch_sentences)
+        bounds.append((start, min(end, len(sentences))))
+        start = end
+
+    # Per-call rule objects: compiled matchers are not shared between threads
+    extractor = UMLExtractor()
+    classifier = RelationshipClassifier()
+    accumulator = ModelAccumulator(classifier)
+
+    batch_texts = (" ".join(sentences[a:b]) for a, b in bounds)
+    for (_, end), doc in zip(bounds, parser.nlp.pipe(batch_texts, batch_size=1)):
+        accumulator.add(sentence_entry(doc, extractor, classifier))
+        event = {
+            "event": "delta",
+            "sentences_done": end,
+            "sentences_total": len(sentences),
+            "elapsed": round(time.perf_counter() - started, 3)
+        }
+        event.update(accumulator.take_delta())
+        if snapshots:
+            event["components"], event["relationships"] = accumulator.snapshot()
+        yield event
+
+    components, relationships = accumulator.snapshot()
+    yield {
+        "event": "final",
+        "sentences_done": len(sentences),
+        "sentences_total": len(sentences),
+        "elapsed": round(time.perf_counter() - started, 3),
+        "components": components,
+        "relationships": relationships,
+        "analytics": ModelAnalytics().update(components['classes'], relationships)
+    }
+
+
+def run_batch(input_filenames=None, columnar_filename="corpus_components.npz", use_token_arrays=False,
+              render_svg=False, budget=None, use_memo=False, profile_memory=False, shard=False,
+              engine=PROCESSING_ENGINE, use_index=False, overlap_io=False, prefilter=False, rule_stats=False,
+              delta=False, split_document=False):
+    """
+    Runs the pipeline over several input files with one shared parser.
+    Besides the per-document outputs, all models are stored together in one
+    columnar file (.npz, or .parquet/.feather with pyarrow) for fast loading.
+    A failing or over-budget document is reported in batch_report.json and
+    never aborts the rest of the batch. With use_memo=True repeated sentences
+    are served from the persistent sentence memo. With use_index=True every
+    model is upserted into the SQLite component index.
+    With overlap_io=True a reader thread reads and cleans documents ahead of
+    the parser and writer threads flush outputs in the background; queue
+    metrics are saved to batch_io_metrics.json. prefilter=True enables the
+    pre-parse sentence filter for every document. With rule_stats=True the
+    per-rule counters of every document and of the whole corpus are saved
+    to rule_stats.json. delta=True writes per-document delta patches against
+    the previous run (see run_pipeline). split_document=True parses each
+    large document in shards on a process pool.
+    """
+    if split_document and (use_memo or use_token_arrays):
+        raise ValueError("split_document cannot be combined with use_memo or use_token_arrays")
+    if input_filenames is None:
+        input_filenames = sorted(f for f in os.listdir(INPUT_DIR) if f.endswith((".txt", ".md")))
+    if budget is None:
+        budget = ResourceBudget()
+
+    parser = SRSParser(engine)
+    memo = SentenceMemo() if use_memo else None
+    index = ComponentIndex() if use_index else None
+    stats = RuleStats() if rule_stats else None
+    models = {}
+    report = []
+
+    if overlap_io:
+        def prefetch(input_filename):
+            raw_text = _read_input(input_filename)
+            return raw_text, clean_srs_text(raw_text)
+
+        executor = PipelinedExecutor(prefetch)
+        documents = executor.items(input_filenames)
+        writer = executor.write
+    else:
+        documents = ((input_filename, None, None) for input_filename in input_filenames)
+        writer = None
+
+    for input_filename, prefetched, read_error in documents:
+        try:
+            if read_error is not None:
+                raise read_error
+            full_data = run_pipeline(
+                input_filename, use_token_arrays=use_token_arrays, parser=parser, render_svg=render_svg,
+                budget=budget, memo=memo, profile_memory=profile_memory, shard=shard, index=index,
+                prefetched=prefetched, writer=writer, prefilter=prefilter, rule_stats=stats,
+                delta=delta, split_document=split_document
+            )
+        except Exception as exc:
+            logger.exception(f"Pipeline failed for {input_filename}")
+            report.append({"document": input_filename, "status": "failed", "events": [{"message": str(exc)}]})
+            continue
+
+        report.append(budget.report)
+        if budget.report["status"] != "skipped":
+            models[os.path.splitext(input_filename)[0]] = flatten_model(full_data)
+
+    if overlap_io:
+        io_metrics = executor.close()
+        for failure in io_metrics["write_errors"]:
+            report.append({"document": failure["path"], "status": "failed", "events": [{"message": failure["error"]}]})
+        with open(os.path.join(OUTPUT_DIR, "batch_io_metrics.json"), "w", encoding="utf-8") as f:
+            json.dump(io_metrics, f, indent=4)
+        logger.info(f"Overlapped I/O: {io_metrics['prefetch_queue']} (prefetch), {io_metrics['write_queue']} (write)")
+
+    if columnar_filename:
+        ColumnarStore().write(models, os.path.join(OUTPUT_DIR, columnar_filename))
+
+    if stats is not None:
+        stats.write(os.path.join(OUTPUT_DIR, "rule_stats.json"))
+
+    report_path = os.path.join(OUTPUT_DIR, "batch_report.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4)
+
+    if memo is not None:
+        logger.info(f"Sentence memo: {memo.stats()}")
+        memo.close()
+    if index is not None:
+        logger.info(f"Component index: {index.stats()}")
+        index.close()
+
+    problems = [r for r in report if r["status"] != "ok"]
+    logger.info(f"Batch complete: {len(input_filenames)} document(s), {len(problems)} degraded/skipped/failed")
+    return models
+
+
+def parse_args(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Headless SRS -> UML generation pipeline.")
+    arg_parser.add_argument("inputs", nargs="*", default=["sample_srs.txt"],
+                            help="Input file name(s) inside data/input")
+    arg_parser.add_argument("--batch", action="store_true",
+                            help="Run every .txt/.md file in data/input (or the given inputs) as a batch")
+    arg_parser.add_argument("--token-arrays", action="store_true",
+                            help="Use the NumPy token-array extraction engine")
+    arg_parser.add_argument("--svg", action="store_true", help="Also render an SVG diagram")
+    arg_parser.add_argument("--memo", action="store_true", help="Reuse the persistent sentence memo")
+    arg_parser.add_argument("--profile-memory", action="store_true",
+                            help="Write a per-stage tracemalloc/RSS report (<name>_memory.json)")
+    arg_parser.add_argument("--shard", action="store_true",
+                            help="Also write one diagram per connected shard plus an index (<name>_shards/)")
+    arg_parser.add_argument("--engine", choices=sorted(ENGINES), default=PROCESSING_ENGINE,
+                            help="Processing engine: statistical spaCy parser or the fast rule-based parser")
+    arg_parser.add_argument("--overlap-io", action="store_true",
+                            help="Batch mode: prefetch inputs and write outputs on background threads")
+    arg_parser.add_argument("--index", action="store_true",
+                            help="Upsert extracted facts into the SQLite component index")
+    arg_parser.add_argument("--split-document", action="store_true",
+                            help="Parse and extract each large document in shards on a process pool")
+    arg_parser.add_argument("--prefilter", action="store_true",
+                            help="Drop non-requirement sentences (TOC, references, boilerplate) before parsing")
+    arg_parser.add_argument("--stream", action="store_true",
+                            help="Print partial models as JSON lines while extracting instead of writing outputs")
+    budget_args = arg_parser.add_argument_group(
+        "resource budget",
+        "Per-document limits (0 disables one). Batches always run with a budget (config defaults); "
+        "single documents only when one of these options is given"
+    )
+    budget_args.add_argument("--max-chars", type=int,
+                             help=f"Truncate (or skip) longer documents (default {MAX_DOC_CHARS})")
+    budget_args.add_argument("--max-sentence-words", type=int,
+                             help=f"Pre-split longer sentences (default {MAX_SENTENCE_WORDS})")
+    budget_args.add_argument("--max-seconds", type=float,
+                             help=f"Wall-time limit per document (default {MAX_DOC_SECONDS})")
+    budget_args.add_argument("--max-memory-mb", type=int,
+                             help=f"Current-RSS limit, Linux only (default {MAX_DOC_MEMORY_MB})")
+    budget_args.add_argument("--on-exceed", choices=("degrade", "skip"),
+                             help="Keep what was processed (degrade, default) or drop the document (skip)")
+    arg_parser.add_argument("--rule-stats", action="store_true",
+                            help="Count tokens, matches, emitted items and time per extraction rule (rule_stats.json)")
+    arg_parser.add_argument("--delta", action="store_true",
+                            help="Also write <name>_delta.json/.xmi/.puml with the changes since the previous run")
+    args = arg_parser.parse_args(argv)
+    if args.split_document:
+        conflicts = [flag for flag, given in (("--memo", args.memo), ("--token-arrays", args.token_arrays),
+                                              ("--stream", args.stream)) if given]
+        if conflicts:
+            arg_parser.error(f"--split-document cannot be combined with {', '.join(conflicts)}")
+    return args
 
 
 if __name__ == "__main__":
-    print("\nStarting End-to-End Automated UML Pipeline...\n")
-    run_pipeline("sample_srs.txt")
\ No newline at end of file
+    args = parse_args()
+    if not args.stream:
+        print("\nStarting End-to-End Automated UML Pipeline...\n")
+
+    budget_limits = {
+        key: value for key, value in (
+            ("max_chars", args.max_chars), ("max_sentence_words", args.max_sentence_words),
+            ("max_seconds", args.max_seconds), ("max_memory_mb", args.max_memory_mb),
+            ("on_exceed", args.on_exceed)
+        ) if value is not None
+    }
+    budget = ResourceBudget(**budget_limits) if args.batch or budget_limits else None
+
+    if args.batch:
+        run_batch(
+            None if args.inputs == ["sample_srs.txt"] else args.inputs,
+            use_token_arrays=args.token_arrays, render_svg=args.svg, budget=budget,
+            use_memo=args.memo, profile_memory=args.profile_memory, shard=args.shard, engine=args.engine,
+            use_index=args.index, overlap_io=args.overlap_io, prefilter=args.prefilter, rule_stats=args.rule_stats,
+            delta=args.delta, split_document=args.split_document
+        )
+    else:
+        memo = SentenceMemo() if args.memo else None
+        index = ComponentIndex() if args.index else None
+        rule_stats = RuleStats() if args.rule_stats else None
+        parser = SRSParser(args.engine)
+        for input_filename in args.inputs:
+            if args.stream:
+                for event in iter_pipeline(input_filename, parser=parser, prefilter=args.prefilter):
+                    print(json.dumps(event), flush=True)
+                continue
+            run_pipeline(
+                input_filename, use_token_arrays=args.token_arrays, parser=parser, render_svg=args.svg,
+                budget=budget, memo=memo, profile_memory=args.profile_memory, shard=args.shard, index=index,
+                split_document=args.split_document, prefilter=args.prefilter, rule_stats=rule_stats,
+                delta=args.delta
+            )
+        if rule_stats is not None:
+            rule_stats.write(os.path.join(OUTPUT_DIR, "rule_stats.json"))
\ No newline at end of file
@@ -0,0 +1,161 @@
+import os
+import re
+import sys
+import time
+import logging
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import (
+    MAX_DOC_CHARS, MAX_SENTENCE_WORDS, MAX_DOC_SECONDS, MAX_DOC_MEMORY_MB
+)
+
+logger = logging.getLogger(__name__)
+
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+CLAUSE_SPLIT_RE = re.compile(r"(?<=[,;:])\s+")
+
+
+class BudgetExceeded(Exception):
+    """Raised when a document exceeds its character, wall-time or memory budget."""
+    def __init__(self, stage: str, reason: str):
+        super().__init__(f"{reason} during {stage}")
+        self.stage = stage
+        self.reason = reason
+
+
+def current_rss_mb():
+    """
+    Returns the current resident set size in MB, or None if unavailable.
+    Only /proc gives the current RSS without extra dependencies; the rusage
+    maximum is a lifetime peak and would keep every later document over budget.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def split_sentences(text: str) -> list:
+    """Cheap regex sentence split used to chunk text before parsing."""
+    return [s for s in SENTENCE_SPLIT_RE.split(text) if s]
+
+
+def split_long_sentence(sentence: str, max_words: int) -> list:
+    """
+    Splits a run-on sentence into pieces of at most `max_words` words,
+    preferring clause boundaries (, ; :) and falling back to hard word cuts.
+    """
+    pieces, current, current_len = [], [], 0
+    for clause in CLAUSE_SPLIT_RE.split(sentence):
+        words = clause.split()
+        # Hard-cut clauses that are themselves too long
+        while len(words) > max_words:
+            if current:
+                pieces.append(" ".join(current))
+                current, current_len = [], 0
+            pieces.append(" ".join(words[:max_words]))
+            words = words[max_words:]
+        if current_len + len(words) > max_words and current:
+            pieces.append(" ".join(current))
+            current, current_len = [], 0
+        current.extend(words)
+        current_len += len(words)
+    if current:
+        pieces.append(" ".join(current))
+
+    # Terminate every piece so the parser treats it as its own sentence
+    return [p.rstrip(",;:") + ("" if p[-1] in ".!?" else ".") for p in pieces]
+
+
+class ResourceBudget:
+    """
+    Per-document limits on characters, sentence length, wall time and memory.
+
+    Oversized input is degraded before parsing (truncated / pre-split). Time and
+    memory are checked between pipeline stages and parse chunks; when exceeded the
+    document is either degraded (keep what was processed) or skipped, depending on
+    `on_exceed`. Every decision is recorded in `report`. The memory limit
+    needs the current RSS (/proc); where it is unavailable the limit is
+    disabled with a warning.
+    """
+    def __init__(self, max_chars=MAX_DOC_CHARS, max_sentence_words=MAX_SENTENCE_WORDS,
+                 max_seconds=MAX_DOC_SECONDS, max_memory_mb=MAX_DOC_MEMORY_MB, on_exceed="degrade"):
+        if on_exceed not in ("degrade", "skip"):
+            raise ValueError("on_exceed must be 'degrade' or 'skip'")
+        self.max_chars = max_chars
+        self.max_sentence_words = max_sentence_words
+        self.max_seconds = max_seconds
+        self.max_memory_mb = max_memory_mb
+        if max_memory_mb and current_rss_mb() is None:
+            logger.warning("Current RSS is unavailable on this platform; the memory budget is disabled")
+            self.max_memory_mb = None
+        self.on_exceed = on_exceed
+        self._started = None
+        self.report = {}
+
+    def start(self, document: str):
+        """Resets the clock and report for a new document."""
+        self._started = time.perf_counter()
+        self.report = {"document": document, "status": "ok", "events": []}
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started if self._started else 0.0
+
+    def record(self, stage: str, message: str, status: str = "degraded"):
+        logger.warning(f"[{self.report.get('document')}] {stage}: {message}")
+        self.report["events"].append({"stage": stage, "message": message})
+        # 'skipped' outranks 'degraded', which outranks 'ok'
+        if status == "skipped" or self.report["status"] == "ok":
+            self.report["status"] = status
+
+    def prepare_text(self, text: str) -> str:
+        """Applies the character limit and pre-splits oversized sentences."""
+        if self.max_chars and len(text) > self.max_chars:
+            if self.on_exceed == "skip":
+                raise BudgetExceeded("clean", f"{len(text)} chars > limit of {self.max_chars}")
+            self.record("clean", f"Truncated {len(text)} chars to {self.max_chars}")
+            text = text[:self.max_chars]
+
+        if not self.max_sentence_words:
+            return text
+
+        sentences, split_count = [], 0
+        for sentence in split_sentences(text):
+            if len(sentence.split()) > self.max_sentence_words:
+                sentences.extend(split_long_sentence(sentence, self.max_sentence_words))
+                split_count += 1
+            else:
+                sentences.append(sentence)
+
+        if split_count:
+            self.record("clean", f"Pre-split {split_count} sentence(s) over {self.max_sentence_words} words")
+            return " ".join(sentences)
+        return text
+
+    def check(self, stage: str):
+        """Raises BudgetExceeded if the wall-time or memory limit is exceeded."""
+        if self.max_seconds and self.elapsed > self.max_seconds:
+            raise BudgetExceeded(stage, f"Wall time {self.elapsed:.1f}s > limit of {self.max_seconds}s")
+
+        if self.max_memory_mb:
+            rss = current_rss_mb()
+            if rss is not None and rss > self.max_memory_mb:
+                raise BudgetExceeded(stage, f"Memory {rss:.0f} MB > limit of {self.max_memory_mb} MB")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    run_on = "The table lists " + ", ".join(f"field_{i}" for i in range(300)) + " for every Account."
+    budget = ResourceBudget(max_sentence_words=50)
+    budget.start("run_on_sample")
+    prepared = budget.prepare_text(run_on)
+
+    print("=== BUDGET REPORT ===")
+    print(f"Pieces after pre-split: {len(split_sentences(prepared))}")
+    print(budget.report)
@@ -3,11 +3,48 @@ import logging
 
 # --- NLP Configuration ---
 SPACY_MODEL = "en_core_web_sm"
+PROCESSING_ENGINE = "spacy"  # "spacy" (statistical parser) or "fast" (rule/lexicon shallow parser)
 
 # --- Thresholds & Scoring ---
 DEFAULT_CONFIDENCE = 0.85
 RELATIONSHIP_THRESHOLD = 0.70
 
+# --- Per-Document Resource Budgets ---
+# Documents exceeding a limit are degraded (truncated / partially parsed) or skipped
+MAX_DOC_CHARS = 500_000
+MAX_SENTENCE_WORDS = 120     # Longer "sentences" (e.g. table dumps) are pre-split
+MAX_DOC_SECONDS = 60.0
+MAX_DOC_MEMORY_MB = 3072
+PARSE_CHUNK_SENTENCES = 200  # Sentences per parse chunk; budgets are checked between chunks
+
+# --- Streamlit Background Extraction ---
+UI_WORKER_THREADS = 4        # Worker pool shared by all sessions of one server process
+UI_BATCH_SENTENCES = 20      # Sentences parsed per progress update
+
+# --- Progressive Pipeline (main.iter_pipeline) ---
+ITER_FIRST_BATCH_SENTENCES = 5   # Small first batch so the first classes show up quickly
+ITER_BATCH_SENTENCES = 50
+
+# --- Sharded Diagram Output ---
+SHARD_MAX_CLASSES = 150      # Largest shard that PlantUML still renders comfortably
+SHARD_WORKERS = os.cpu_count() or 1
+SHARD_PARALLEL_MIN_CLASSES = 2_000  # Smaller models render serially (pool start-up costs more)
+
+# --- Single-Document Parallelism ---
+# A large document is split into sentence-aligned shards extracted on a process pool
+SPLIT_TARGET_CHARS = 50_000
+SPLIT_WORKERS = os.cpu_count() or 1
+
+# --- Overlapped Batch I/O ---
+PREFETCH_DEPTH = 4           # Documents read and cleaned ahead of the parser
+WRITE_QUEUE_DEPTH = 32       # Output files waiting to be flushed
+WRITER_THREADS = 2
+
+# --- Model Graph Analytics ---
+ANALYTICS_HUB_COUNT = 10          # Classes listed per fan-in/fan-out/depth ranking
+ANALYTICS_CACHE_SIZE = 32         # Reports kept per model hash
+ANALYTICS_REBUILD_FRACTION = 0.25 # Diffs larger than this share of the model trigger a full rebuild
+
 # --- Directory Paths ---
 # Dynamically locate the root 'uml_generator' directory
 CORE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -18,11 +55,26 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 INPUT_DIR = os.path.join(DATA_DIR, "input")
 OUTPUT_DIR = os.path.join(DATA_DIR, "output")
 GROUND_TRUTH_DIR = os.path.join(DATA_DIR, "ground_truth") # <-- ADDED DIRECTORY
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+
+# --- Sentence Memo ---
+# Persistent per-sentence extraction cache shared across documents and runs
+MEMO_PATH = os.path.join(CACHE_DIR, "sentence_memo.sqlite")
+MEMO_MAX_ENTRIES = 200_000
+
+# --- Corpus Component Index ---
+# SQLite index of extracted facts across documents (see src/utils/component_index.py)
+INDEX_PATH = os.path.join(OUTPUT_DIR, "component_index.sqlite")
+
+# --- Rule Lexicons ---
+# Cue words for the extraction/classification rules (editable without code changes)
+LEXICON_PATH = os.path.join(CORE_DIR, "lexicons.json")
 
 # Ensure required directories exist immediately upon import
 os.makedirs(INPUT_DIR, exist_ok=True)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(GROUND_TRUTH_DIR, exist_ok=True) # <-- AUTO-CREATE DIRECTORY
+os.makedirs(CACHE_DIR, exist_ok=True)
 
 # --- Logging Setup ---
 logging.basicConfig(
@@ -0,0 +1,50 @@
+import os
+import sys
+import json
+import logging
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import LEXICON_PATH
+
+logger = logging.getLogger(__name__)
+
+# Built-in fallback used when the lexicon file is missing or incomplete
+DEFAULT_LEXICONS = {
+    "attribute_verbs": ["have", "has", "contain", "contains", "include", "includes"],
+    "inheritance_cues": ["is a", "is an", "extends", "inherits", "type of", "kind of", "are a"],
+    "aggregation_cues": ["has", "have", "contains", "contain", "consists of", "composed of", "comprises"]
+}
+
+
+def load_lexicons(path: str = LEXICON_PATH) -> dict:
+    """
+    Loads the rule lexicons from a JSON file and returns them as sets.
+    Missing keys fall back to the built-in defaults.
+    """
+    lexicons = {key: set(values) for key, values in DEFAULT_LEXICONS.items()}
+
+    if not path or not os.path.exists(path):
+        logger.warning(f"Lexicon file not found: {path}. Using built-in defaults.")
+        return lexicons
+
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError:
+            logger.error(f"Invalid JSON format in {path}. Using built-in defaults.")
+            return lexicons
+
+    for key in lexicons:
+        if key in data:
+            lexicons[key] = set(data[key])
+
+    return lexicons
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    for name, cues in load_lexicons().items():
+        print(f"{name}: {sorted(cues)}")
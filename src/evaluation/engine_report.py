@@ -0,0 +1,94 @@
+import logging
+import sys
+import os
+import json
+import time
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import INPUT_DIR, OUTPUT_DIR
+from src.nlp.clean_text import clean_srs_text
+from src.nlp.parser import SRSParser, ENGINES
+from src.nlp.extractor import UMLExtractor
+from src.logic.classifier import RelationshipClassifier
+from src.evaluation.metrics import UMLEvaluator
+
+logger = logging.getLogger(__name__)
+
+
+def benchmark_engine(engine: str, text: str, ground_truth: dict, repeat: int = 3) -> dict:
+    """
+    Runs parse -> extract -> classify with one engine and reports throughput
+    (best of `repeat` runs, model loading excluded) next to accuracy.
+    """
+    parser = SRSParser(engine)
+    extractor = UMLExtractor()
+    classifier = RelationshipClassifier()
+
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        doc = parser.parse(text)
+        components = extractor.extract_components(doc)
+        relationships = classifier.classify_relationships(doc, components['classes'])
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    words = len(text.split())
+    extracted = dict(components, relationships=relationships)
+    return {
+        "engine": engine,
+        "seconds": round(best, 4),
+        "words_per_second": round(words / best) if best > 0 else None,
+        "metrics": UMLEvaluator().evaluate_pipeline(extracted, ground_truth)
+    }
+
+
+def compare_engines(input_filename="sample_srs.txt", ground_truth_filename="sample_srs_gt.json",
+                    engines=None, repeat=3, report_filename="engine_report.json") -> list:
+    """
+    Benchmarks every processing engine on one annotated document and writes
+    the accuracy-vs-throughput table to data/output/<report_filename>.
+    Engines that cannot be loaded (e.g. a missing spaCy model) are reported
+    with their error instead of aborting the comparison.
+    """
+    with open(os.path.join(INPUT_DIR, input_filename), "r", encoding="utf-8") as f:
+        text = clean_srs_text(f.read())
+    ground_truth = UMLEvaluator().load_ground_truth(ground_truth_filename)
+
+    report = []
+    for engine in engines or sorted(ENGINES):
+        try:
+            report.append(benchmark_engine(engine, text, ground_truth, repeat))
+        except Exception as exc:
+            logger.error(f"Engine '{engine}' could not be benchmarked: {exc}")
+            report.append({"engine": engine, "error": str(exc)})
+
+    # Speedup relative to the statistical baseline, when it ran
+    baseline = next((r for r in report if r["engine"] == "spacy" and "error" not in r), None)
+    for entry in report:
+        if baseline is not None and "error" not in entry:
+            entry["speedup_vs_spacy"] = round(baseline["seconds"] / entry["seconds"], 1) if entry["seconds"] else None
+
+    if report_filename:
+        with open(os.path.join(OUTPUT_DIR, report_filename), "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+    return report
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    results = compare_engines()
+
+    print("\n=== ENGINE COMPARISON (accuracy vs throughput) ===")
+    print(f"{'Engine':<8} | {'Words/s':>10} | {'Classes F1':>10} | {'Attrs F1':>8} | {'Methods F1':>10} | {'Rels F1':>7}")
+    print("-" * 70)
+    for entry in results:
+        if "error" in entry:
+            print(f"{entry['engine']:<8} | unavailable: {entry['error']}")
+            continue
+        m = entry["metrics"]
+        print(f"{entry['engine']:<8} | {entry['words_per_second']:>10} | {m['Classes']['f1_score']:>10} | "
+              f"{m['Attributes']['f1_score']:>8} | {m['Methods']['f1_score']:>10} | {m['Relationships']['f1_score']:>7}")
@@ -0,0 +1,129 @@
+import logging
+import sys
+import os
+import json
+import time
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import INPUT_DIR, OUTPUT_DIR, PROCESSING_ENGINE
+from src.core.budget import split_sentences
+from src.nlp.clean_text import clean_srs_text
+from src.nlp.parser import SRSParser
+from src.nlp.prefilter import SentenceFilter
+from src.nlp.extractor import UMLExtractor
+from src.logic.classifier import RelationshipClassifier
+from src.evaluation.metrics import UMLEvaluator
+
+logger = logging.getLogger(__name__)
+
+# Typical front/back matter of real specifications, appended to measure what the filter removes
+NOISE_SAMPLE = (
+    "Table of Contents 1 Introduction ........ 3 1.1 Purpose ........ 4 2 Overall Description ........ 7 "
+    "Revision History Version 1.0 2021-03-01 Initial release. Version 1.1 2021-06-12 Review comments. "
+    "[1] IEEE Std 830-1998, IEEE Recommended Practice for Software Requirements Specifications. "
+    "[2] ISO/IEC/IEEE 29148:2018. "
+    "Copyright 2021 ACME Corp. All rights reserved. Confidential and proprietary. "
+    "Page 3 of 120."
+)
+
+# Requirements that resemble noise (numbered items, legal-sounding class names); the filter must keep them all
+LOOKALIKE_SAMPLE = (
+    "(1) The system shall store every loan record. "
+    "(2) A Librarian is a User. "
+    "[REQ-3] The Library contains Books. "
+    "A Trademark is an Asset. "
+    "The Copyright Office maintains Registrations. "
+    "A Disclaimer has a body_text."
+)
+
+
+def _extract(parser, text: str) -> dict:
+    doc = parser.parse(text)
+    components = UMLExtractor().extract_components(doc)
+    relationships = RelationshipClassifier().classify_relationships(doc, components['classes'])
+    return dict(components, relationships=relationships)
+
+
+def evaluate_prefilter(input_filename="sample_srs.txt", ground_truth_filename="sample_srs_gt.json",
+                       engine=PROCESSING_ENGINE, noise=NOISE_SAMPLE, lookalikes=LOOKALIKE_SAMPLE,
+                       report_filename="prefilter_report.json") -> dict:
+    """
+    Extracts one annotated document with and without the pre-parse filter
+    (optionally with `noise` appended) and reports the metrics of both runs,
+    the drop counts, and every extracted item the filter lost. The filter is
+    safe for the document when ground-truth recall does not drop. Every
+    sentence of `lookalikes` (cleaned like the document) must also be kept;
+    the ones dropped are listed with their reason.
+    """
+    with open(os.path.join(INPUT_DIR, input_filename), "r", encoding="utf-8") as f:
+        text = clean_srs_text(f.read())
+    if noise:
+        text = f"{text} {noise}"
+
+    evaluator = UMLEvaluator()
+    ground_truth = evaluator.load_ground_truth(ground_truth_filename)
+    parser = SRSParser(engine)
+
+    started = time.perf_counter()
+    unfiltered = _extract(parser, text)
+    unfiltered_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    filtered_text, stats = SentenceFilter().filter_text(text)
+    filtered = _extract(parser, filtered_text)
+    filtered_seconds = time.perf_counter() - started
+
+    before = evaluator.evaluate_pipeline(unfiltered, ground_truth)
+    after = evaluator.evaluate_pipeline(filtered, ground_truth)
+    lost = {
+        key: sorted(set(map(tuple, unfiltered[key])) - set(map(tuple, filtered[key])))
+        if key != "classes" else sorted(set(unfiltered[key]) - set(filtered[key]))
+        for key in ("classes", "attributes", "methods", "relationships")
+    }
+    recall_preserved = all(
+        after[kind]["recall"] >= before[kind]["recall"] for kind in ("Classes", "Attributes", "Methods", "Relationships")
+    )
+
+    sentence_filter = SentenceFilter()
+    dropped_lookalikes = [
+        [sentence, sentence_filter.reason(sentence)]
+        for sentence in split_sentences(clean_srs_text(lookalikes or ""))
+        if sentence_filter.reason(sentence) is not None
+    ]
+
+    report = {
+        "document": input_filename,
+        "engine": engine,
+        "filter": stats,
+        "seconds": {"unfiltered": round(unfiltered_seconds, 4), "filtered": round(filtered_seconds, 4)},
+        "metrics": {"unfiltered": before, "filtered": after},
+        "lost_items": lost,
+        "recall_preserved": recall_preserved,
+        "dropped_lookalikes": dropped_lookalikes
+    }
+    if not recall_preserved:
+        logger.warning(f"Pre-filter lowered ground-truth recall on {input_filename}: {lost}")
+    if dropped_lookalikes:
+        logger.warning(f"Pre-filter dropped requirement sentences: {dropped_lookalikes}")
+
+    if report_filename:
+        with open(os.path.join(OUTPUT_DIR, report_filename), "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+    return report
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    result = evaluate_prefilter()
+
+    print("\n=== PRE-FILTER RECALL CHECK ===")
+    print(f"Dropped: {result['filter']['dropped']}/{result['filter']['sentences']} sentence(s) "
+          f"{result['filter']['reasons']}")
+    for kind in ("Classes", "Attributes", "Methods", "Relationships"):
+        print(f"{kind:<14} recall {result['metrics']['unfiltered'][kind]['recall']:.2f} -> "
+              f"{result['metrics']['filtered'][kind]['recall']:.2f}")
+    print(f"Recall preserved: {result['recall_preserved']}")
+    print(f"Look-alike requirements dropped: {result['dropped_lookalikes'] or 'none'}")
@@ -0,0 +1,233 @@
+import os
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import INPUT_DIR, OUTPUT_DIR, UI_WORKER_THREADS, PROCESSING_ENGINE
+from src.core.budget import current_rss_mb
+from src.nlp.parser import SRSParser
+from src.utils.background import ExtractionJob, run_extraction_job
+from src.utils.memory_profiler import peak_rss_mb, reset_peak_rss
+
+logger = logging.getLogger(__name__)
+
+TARGETS = ("app", "pipeline")
+
+
+class RSSSampler:
+    """Polls the process RSS in a daemon thread and keeps the samples."""
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            rss = current_rss_mb()
+            if rss is not None:
+                self.samples.append(rss)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def summary(self) -> dict:
+        if not self.samples:
+            return {"mean_mb": None, "max_mb": None}
+        return {"mean_mb": round(float(np.mean(self.samples)), 1), "max_mb": round(max(self.samples), 1)}
+
+
+def latency_summary(latencies: list) -> dict:
+    """p50/p95/p99/max latency in seconds."""
+    if not latencies:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return {"p50": round(float(p50), 4), "p95": round(float(p95), 4),
+            "p99": round(float(p99), 4), "max": round(max(latencies), 4)}
+
+
+def load_inputs(input_filenames=None) -> list:
+    """(file name, raw text) of the recorded SRS inputs to replay."""
+    if input_filenames is None:
+        input_filenames = sorted(f for f in os.listdir(INPUT_DIR) if f.endswith((".txt", ".md")))
+    inputs = []
+    for filename in input_filenames:
+        with open(os.path.join(INPUT_DIR, filename), "r", encoding="utf-8") as f:
+            inputs.append((filename, f.read()))
+    if not inputs:
+        raise ValueError(f"No recorded inputs found in {INPUT_DIR}")
+    return inputs
+
+
+def run_load_test(target="app", users=10, requests=50, rate=None, input_filenames=None,
+                  engine=PROCESSING_ENGINE, share_model=True, workers=UI_WORKER_THREADS, seed=0) -> dict:
+    """
+    Replays recorded SRS inputs against an extraction entry point and reports
+    latency percentiles, throughput and process memory.
+
+    target="app" reproduces the Streamlit path: each request is an
+    ExtractionJob submitted to a worker pool of `workers` threads (the app's
+    shared pool). target="pipeline" calls main.run_pipeline per request
+    (outputs of the same input are overwritten).
+
+    `users` requests may be in flight at once. With `rate` (requests/s) the
+    arrivals are open-loop Poisson and latency is measured from the scheduled
+    arrival, so queueing delay is included; without it every user sends its
+    next request as soon as the previous one returns (closed loop).
+
+    share_model=True mirrors @st.cache_resource (one parser for every
+    session); False loads a parser per request to show the uncached cost.
+    """
+    if target not in TARGETS:
+        raise ValueError(f"Unknown load-test target '{target}'. Available: {TARGETS}")
+    inputs = load_inputs(input_filenames)
+    rng = random.Random(seed)
+
+    # --- Cost of the cached model ---
+    rss_before = current_rss_mb()
+    started = time.perf_counter()
+    shared_parser = SRSParser(engine) if share_model else None
+    model = {
+        "engine": engine,
+        "shared": share_model,
+        "load_seconds": round(time.perf_counter() - started, 3) if share_model else None,
+        "rss_delta_mb": round(current_rss_mb() - rss_before, 1) if share_model and rss_before is not None else None
+    }
+
+    if target == "pipeline":
+        import main  # Imported lazily: the CLI module configures logging on import
+        server_pool = None
+    else:
+        server_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="uml-extract")
+
+    def handle(i, scheduled):
+        filename, raw_text = inputs[i % len(inputs)]
+        parser = shared_parser or SRSParser(engine)
+        service_start = time.perf_counter()
+        if target == "app":
+            job = ExtractionJob()
+            submitted = time.time()
+            server_pool.submit(run_extraction_job, job, raw_text, parser).result()
+            ok = job.state == "done"
+            queue_wait = job.started - submitted if job.started else None
+        else:
+            main.run_pipeline(filename, parser=parser)
+            ok, queue_wait = True, None
+        finished = time.perf_counter()
+        return {"latency": finished - scheduled, "service": finished - service_start,
+                "queue_wait": queue_wait, "ok": ok}
+
+    results, errors = [], []
+
+    def record(future):
+        try:
+            results.append(future.result())
+        except Exception as exc:
+            errors.append(str(exc))
+
+    reset_peak_rss()
+    with RSSSampler() as sampler, ThreadPoolExecutor(max_workers=users, thread_name_prefix="load-user") as clients:
+        t0 = time.perf_counter()
+        if rate:
+            # Open loop: Poisson arrivals, independent of how fast requests complete
+            next_arrival = t0
+            for i in range(requests):
+                next_arrival += rng.expovariate(rate)
+                delay = next_arrival - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                clients.submit(handle, i, next_arrival).add_done_callback(record)
+        else:
+            # Closed loop: `users` virtual users, each issuing its share back-to-back
+            def user_loop(u):
+                for i in range(u, requests, users):
+                    try:
+                        results.append(handle(i, time.perf_counter()))
+                    except Exception as exc:
+                        errors.append(str(exc))
+            for u in range(users):
+                clients.submit(user_loop, u)
+        clients.shutdown(wait=True)
+        wall = time.perf_counter() - t0
+
+    if server_pool is not None:
+        server_pool.shutdown()
+
+    completed = [r for r in results if r["ok"]]
+    waits = [r["queue_wait"] for r in results if r["queue_wait"] is not None]
+    report = {
+        "target": target,
+        "users": users,
+        "requests": requests,
+        "arrival_rate": rate,
+        "workers": workers if target == "app" else users,
+        "inputs": [name for name, _ in inputs],
+        "completed": len(completed),
+        "failed": len(results) - len(completed) + len(errors),
+        "errors": errors[:10],
+        "wall_seconds": round(wall, 3),
+        "throughput_rps": round(len(completed) / wall, 3) if wall > 0 else None,
+        "latency_seconds": latency_summary([r["latency"] for r in results]),
+        "service_seconds": latency_summary([r["service"] for r in results]),
+        "queue_wait_seconds": latency_summary(waits) if waits else None,
+        "memory": {
+            "model": model,
+            "rss": sampler.summary(),
+            "peak_rss_mb": round(peak_rss_mb(), 1) if peak_rss_mb() is not None else None
+        }
+    }
+    logger.info(
+        f"Load test ({target}): {report['completed']}/{requests} ok, {report['throughput_rps']} req/s, "
+        f"p95 {report['latency_seconds']['p95']}s"
+    )
+    return report
+
+
+def parse_args(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Headless load test of the extraction entry points.")
+    arg_parser.add_argument("--target", choices=TARGETS, default="app")
+    arg_parser.add_argument("--users", type=int, default=10, help="Concurrent requests in flight")
+    arg_parser.add_argument("--requests", type=int, default=50, help="Total requests to send")
+    arg_parser.add_argument("--rate", type=float, default=None,
+                            help="Open-loop Poisson arrival rate (req/s); closed loop if omitted")
+    arg_parser.add_argument("--workers", type=int, default=UI_WORKER_THREADS,
+                            help="Size of the app's shared extraction pool (target=app)")
+    arg_parser.add_argument("--engine", default=PROCESSING_ENGINE)
+    arg_parser.add_argument("--no-shared-model", action="store_true",
+                            help="Load a parser per request instead of one cached parser")
+    arg_parser.add_argument("inputs", nargs="*", help="Recorded inputs in data/input (default: all)")
+    return arg_parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+
+    result = run_load_test(
+        target=args.target, users=args.users, requests=args.requests, rate=args.rate,
+        input_filenames=args.inputs or None, engine=args.engine,
+        share_model=not args.no_shared_model, workers=args.workers
+    )
+
+    report_path = os.path.join(OUTPUT_DIR, f"load_test_{args.target}.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=4)
+
+    print(json.dumps(result, indent=4))
+    print(f"\nReport saved to {report_path}")
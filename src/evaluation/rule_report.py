@@ -0,0 +1,92 @@
+import logging
+import sys
+import os
+import json
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import INPUT_DIR, OUTPUT_DIR, GROUND_TRUTH_DIR, PROCESSING_ENGINE
+from src.nlp.clean_text import clean_srs_text
+from src.nlp.parser import SRSParser
+from src.nlp.extractor import UMLExtractor
+from src.logic.classifier import RelationshipClassifier
+from src.evaluation.metrics import UMLEvaluator
+from src.utils.rule_stats import RuleStats, COUNTERS
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("classes", "attributes", "methods", "relationships")
+
+
+def evaluate_rules(input_filenames=None, engine=PROCESSING_ENGINE, report_filename="rule_report.json") -> dict:
+    """
+    Extracts every input that has a <name>_gt.json ground truth with rule
+    instrumentation on, and reports for each rule its cost counters next to
+    the precision of the items it emitted, per document and over the corpus.
+    A rule that is slow and imprecise is the first candidate for tuning.
+    """
+    if input_filenames is None:
+        input_filenames = sorted(
+            f for f in os.listdir(INPUT_DIR)
+            if f.endswith((".txt", ".md"))
+            and os.path.exists(os.path.join(GROUND_TRUTH_DIR, f"{os.path.splitext(f)[0]}_gt.json"))
+        )
+
+    evaluator = UMLEvaluator()
+    parser = SRSParser(engine)
+    stats = RuleStats()
+    extractor = UMLExtractor(stats=stats)
+    classifier = RelationshipClassifier(stats=stats)
+
+    hits = {}  # rule id -> [true positives, emitted] over the corpus
+    documents = {}
+    for input_filename in input_filenames:
+        ground_truth = evaluator.load_ground_truth(f"{os.path.splitext(input_filename)[0]}_gt.json")
+        with open(os.path.join(INPUT_DIR, input_filename), "r", encoding="utf-8") as f:
+            doc = parser.parse(clean_srs_text(f.read()))
+
+        stats.start_document(input_filename)
+        components = extractor.extract_components(doc)
+        classifier.classify_relationships(doc, components["classes"])
+
+        rules = {}
+        for rule_id, counters in stats.documents[input_filename].items():
+            row = dict(counters, seconds=round(counters["seconds"], 6))
+            for kind in KINDS:
+                emitted = stats.items_of(rule_id, kind, input_filename)
+                if not emitted:
+                    continue
+                gt = {tuple(item) if isinstance(item, list) else item for item in ground_truth.get(kind, [])}
+                row["kind"] = kind
+                row["precision"] = evaluator.calculate_metrics(emitted, gt)["precision"]
+                total = hits.setdefault(rule_id, [0, 0])
+                total[0] += len(emitted & gt)
+                total[1] += len(emitted)
+            rules[rule_id] = row
+        documents[input_filename] = dict(sorted(rules.items()))
+
+    corpus = {}
+    for rule_id, counters in sorted(stats.corpus().items()):
+        row = dict(counters, seconds=round(counters["seconds"], 6))
+        if rule_id in hits and hits[rule_id][1]:
+            row["precision"] = round(hits[rule_id][0] / hits[rule_id][1], 2)
+        corpus[rule_id] = row
+
+    report = {"engine": engine, "documents": documents, "corpus": corpus}
+    if report_filename:
+        with open(os.path.join(OUTPUT_DIR, report_filename), "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+    return report
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    result = evaluate_rules()
+
+    print("\n=== PER-RULE COST AND PRECISION (corpus) ===")
+    print(f"{'Rule':<22}" + "".join(f"{key:>17}" for key in COUNTERS) + f"{'precision':>11}")
+    for rule_id, row in result["corpus"].items():
+        precision = f"{row['precision']:.2f}" if "precision" in row else "-"
+        print(f"{rule_id:<22}" + "".join(f"{row[key]:>17}" for key in COUNTERS) + f"{precision:>11}")
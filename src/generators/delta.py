@@ -0,0 +1,256 @@
+import os
+import sys
+import json
+import hashlib
+import logging
+import xml.etree.ElementTree as ET
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.generators.xmi import XMIGenerator, stable_id
+from src.generators.plantuml import PlantUMLGenerator
+
+logger = logging.getLogger(__name__)
+
+EMPTY_MODEL = {"components": {"classes": [], "attributes": [], "methods": []}, "relationships": []}
+
+
+def model_fingerprint(data: dict) -> str:
+    """Order-independent hash of a full_data model (classes, members and relationships)."""
+    components = data["components"]
+    payload = json.dumps([
+        sorted(components["classes"]),
+        sorted(map(list, components["attributes"])),
+        sorted(map(list, components["methods"])),
+        sorted(map(list, data["relationships"]))
+    ])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _as_sets(data: dict):
+    components = data["components"]
+    return (
+        set(components["classes"]),
+        set(map(tuple, components["attributes"])),
+        set(map(tuple, components["methods"])),
+        set(map(tuple, data["relationships"]))
+    )
+
+
+def diff_models(previous: dict, current: dict) -> dict:
+    """
+    Compares two models in the components-JSON layout. Elements are matched
+    by content, exactly like their stable XMI ids, so a rename is a removal
+    plus an addition. A class present in both models is "changed" when its
+    attributes, operations or generalizations (which the class owns) differ.
+    Duplicate members collapse to one element.
+    """
+    old_classes, old_attrs, old_methods, old_rels = _as_sets(previous)
+    new_classes, new_attrs, new_methods, new_rels = _as_sets(current)
+
+    diff = {
+        "classes": {"added": sorted(new_classes - old_classes), "removed": sorted(old_classes - new_classes)},
+        "attributes": {"added": sorted(new_attrs - old_attrs), "removed": sorted(old_attrs - new_attrs)},
+        "methods": {"added": sorted(new_methods - old_methods), "removed": sorted(old_methods - new_methods)},
+        "relationships": {"added": sorted(new_rels - old_rels), "removed": sorted(old_rels - new_rels)}
+    }
+    touched = {cls for kind in ("attributes", "methods") for side in ("added", "removed") for cls, _ in diff[kind][side]}
+    touched.update(
+        source for side in ("added", "removed") for source, rel_type, _ in diff["relationships"][side]
+        if rel_type == "Inheritance"
+    )
+    diff["classes"]["changed"] = sorted(touched & old_classes & new_classes)
+    return diff
+
+
+class DeltaExporter:
+    """
+    Exports the difference between the previous run's model and the current
+    one as three patches that reference elements by their stable XMI ids:
+
+    - JSON: an ordered list of add/remove operations per element,
+    - XMI: the added and changed classes and added associations in a model,
+      followed by xmi:Add / xmi:Replace / xmi:Delete differences,
+    - PlantUML: only the affected classes and relationships, coloured by change.
+    """
+    def __init__(self):
+        self.xmi_gen = XMIGenerator()
+        self.rel_mapping = PlantUMLGenerator().rel_mapping
+
+    def export(self, previous: dict, current: dict) -> dict:
+        """Returns {"diff", "json", "xmi", "puml"} for the step from `previous` to `current`."""
+        previous = previous or EMPTY_MODEL
+        diff = diff_models(previous, current)
+        base, target = model_fingerprint(previous), model_fingerprint(current)
+        return {
+            "diff": diff,
+            "json": self.to_json(diff, current, base, target),
+            "xmi": self.to_xmi(diff, current),
+            "puml": self.to_puml(diff, current, base, target)
+        }
+
+    # --- JSON ---
+
+    def to_json(self, diff: dict, current: dict, base: str, target: str) -> str:
+        operations = []
+        # Removals first, owners last; additions owners first, so the patch applies in order
+        for rel in diff["relationships"]["removed"]:
+            operations.append(self._relationship_op("remove", *rel))
+        for kind, element, member_kind in (("methods", "Operation", "op"), ("attributes", "Property", "attr")):
+            for cls, name in diff[kind]["removed"]:
+                operations.append({"op": "remove", "type": element, "id": stable_id(member_kind, cls, name),
+                                   "owner": stable_id("class", cls), "name": name})
+        for cls in diff["classes"]["removed"]:
+            operations.append({"op": "remove", "type": "Class", "id": stable_id("class", cls), "name": cls})
+
+        for cls in diff["classes"]["added"]:
+            operations.append({"op": "add", "type": "Class", "id": stable_id("class", cls), "name": cls})
+        for kind, element, member_kind in (("attributes", "Property", "attr"), ("methods", "Operation", "op")):
+            for cls, name in diff[kind]["added"]:
+                operations.append({"op": "add", "type": element, "id": stable_id(member_kind, cls, name),
+                                   "owner": stable_id("class", cls), "name": name})
+        for rel in diff["relationships"]["added"]:
+            operations.append(self._relationship_op("add", *rel))
+
+        summary = {kind: {side: len(items) for side, items in sides.items()} for kind, sides in diff.items()}
+        patch = {"base": base, "target": target, "summary": summary, "operations": operations}
+        return json.dumps(patch, indent=4)
+
+    @staticmethod
+    def _relationship_op(op, source, rel_type, target):
+        return {
+            "op": op, "type": "Generalization" if rel_type == "Inheritance" else rel_type,
+            "id": stable_id("rel", source, rel_type, target),
+            "source": stable_id("class", source), "target": stable_id("class", target),
+            "name": f"{source}_{rel_type}_{target}"
+        }
+
+    # --- XMI ---
+
+    def to_xmi(self, diff: dict, current: dict) -> str:
+        components = current["components"]
+        attrs_by_class, methods_by_class, parents = {}, {}, {}
+        for cls, attr in components["attributes"]:
+            attrs_by_class.setdefault(cls, []).append(attr)
+        for cls, method in components["methods"]:
+            methods_by_class.setdefault(cls, []).append(method)
+        for source, rel_type, target in map(tuple, current["relationships"]):
+            if rel_type == "Inheritance":
+                parents.setdefault(source, []).append(target)
+
+        root, model = self.xmi_gen.create_document()
+        model_id = model.get("xmi:id")
+        class_nodes, used_ids = {}, {}
+
+        # Added and changed classes are exported whole, with their generalizations
+        for cls in sorted(diff["classes"]["added"] + diff["classes"]["changed"]):
+            node = self.xmi_gen.add_class(model, cls, attrs_by_class.get(cls, []), methods_by_class.get(cls, []),
+                                          used_ids)
+            class_nodes[node.get("xmi:id")] = node
+            for parent in parents.get(cls, []):
+                self.xmi_gen.add_relationship(model, class_nodes, cls, "Inheritance", parent, used_ids)
+
+        added_rels = [rel for rel in diff["relationships"]["added"] if rel[1] != "Inheritance"]
+        for source, rel_type, target in added_rels:
+            self.xmi_gen.add_relationship(model, class_nodes, source, rel_type, target, used_ids)
+
+        for cls in diff["classes"]["added"]:
+            ET.SubElement(root, "xmi:Add", {"addition": stable_id("class", cls), "target": model_id})
+        for source, rel_type, target in added_rels:
+            ET.SubElement(root, "xmi:Add", {"addition": stable_id("rel", source, rel_type, target),
+                                            "target": model_id})
+        for cls in diff["classes"]["changed"]:
+            cls_id = stable_id("class", cls)
+            ET.SubElement(root, "xmi:Replace", {"target": cls_id, "replacement": cls_id})
+        for source, rel_type, target in diff["relationships"]["removed"]:
+            # A removed generalization is covered by the Replace of its (changed) source class
+            if rel_type != "Inheritance" or source in diff["classes"]["removed"]:
+                ET.SubElement(root, "xmi:Delete", {"target": stable_id("rel", source, rel_type, target)})
+        for cls in diff["classes"]["removed"]:
+            ET.SubElement(root, "xmi:Delete", {"target": stable_id("class", cls)})
+
+        return self.xmi_gen.to_string(root)
+
+    # --- PlantUML ---
+
+    def to_puml(self, diff: dict, current: dict, base: str, target: str) -> str:
+        components = current["components"]
+        lines = ["@startuml", "skinparam classAttributeIconSize 0", f"title Delta {base} -> {target}", ""]
+
+        members = {}
+        for kind, suffix in (("attributes", ""), ("methods", "()")):
+            for side in ("added", "removed"):
+                for cls, name in diff[kind][side]:
+                    members.setdefault(cls, {"added": [], "removed": []})[side].append(f"{name}{suffix}")
+
+        for cls in diff["classes"]["added"]:
+            lines.append(f"class {cls} <<added>> #palegreen {{")
+            lines.extend(f"  +{attr}" for c, attr in components["attributes"] if c == cls)
+            lines.extend(f"  +{method}()" for c, method in components["methods"] if c == cls)
+            lines.extend(["}", ""])
+        for cls in diff["classes"]["changed"]:
+            lines.append(f"class {cls} <<changed>> #khaki {{")
+            for side in ("added", "removed"):
+                names = members.get(cls, {}).get(side)
+                if names:
+                    lines.append(f"  .. {side} ..")
+                    lines.extend(f"  +{name}" for name in names)
+            lines.extend(["}", ""])
+        for cls in diff["classes"]["removed"]:
+            lines.append(f"class {cls} <<removed>> #pink")
+        if diff["classes"]["removed"]:
+            lines.append("")
+
+        for side, style in (("added", "#green"), ("removed", "#red,dashed")):
+            for source, rel_type, target in diff["relationships"][side]:
+                arrow = self.rel_mapping.get(rel_type, "-->")
+                cut = arrow.index("-") + 1
+                arrow = f"{arrow[:cut]}[{style}]{arrow[cut:]}"
+                label = f"{rel_type} ({side})" if rel_type == "Association" else side
+                lines.append(f"{source} {arrow} {target} : {label}")
+
+        lines.append("")
+        lines.append("@enduml")
+        return "\n".join(lines)
+
+
+def load_model(json_path: str):
+    """Reads a <name>_components.json written by a previous run, or returns None."""
+    if not os.path.exists(json_path):
+        return None
+    try:
+        with open(json_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning(f"Previous model {json_path} unreadable, exporting a full delta: {exc}")
+        return None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    previous = {
+        "components": {
+            "classes": ['Books', 'Librarian', 'Library', 'User'],
+            "attributes": [('User', 'name')],
+            "methods": [('User', 'borrow')]
+        },
+        "relationships": [('Librarian', 'Inheritance', 'User'), ('Library', 'Aggregation', 'Books')]
+    }
+    current = {
+        "components": {
+            "classes": ['Books', 'Librarian', 'Library', 'LibraryManagementSystem', 'User'],
+            "attributes": [('User', 'name'), ('User', 'email_address')],
+            "methods": [('LibraryManagementSystem', 'allow'), ('User', 'borrow')]
+        },
+        "relationships": [('Librarian', 'Inheritance', 'User'), ('LibraryManagementSystem', 'Association', 'Library')]
+    }
+
+    delta = DeltaExporter().export(previous, current)
+    print("=== JSON PATCH ===")
+    print(delta["json"])
+    print("=== XMI PATCH ===")
+    print(delta["xmi"])
+    print("=== PLANTUML DELTA ===")
+    print(delta["puml"])
@@ -19,9 +19,12 @@ class PlantUMLGenerator:
             "Association": "-->"     # Source is associated with Target
         }
 
-    def generate_puml(self, classes: list, attributes: list, methods: list, relationships: list) -> str:
+    def generate_puml(self, classes: list, attributes: list, methods: list, relationships: list,
+                      stubs: dict = None) -> str:
         """
         Takes structured UML data and returns a valid PlantUML string.
+        `stubs` maps classes defined in another diagram to a stereotype label;
+        they are drawn as empty boxes so cross-diagram edges stay visible.
         """
         lines = ["@startuml", "skinparam classAttributeIconSize 0", ""]
         
@@ -41,6 +44,11 @@ class PlantUMLGenerator:
                 
             lines.append("}")
             lines.append("")
+
+        for cls, label in (stubs or {}).items():
+            lines.append(f"class {cls} <<{label}>>")
+        if stubs:
+            lines.append("")
             
         # 2. Generate Relationships
         for source, rel_type, target in relationships:
@@ -0,0 +1,182 @@
+import os
+import sys
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import SHARD_MAX_CLASSES, SHARD_WORKERS, SHARD_PARALLEL_MIN_CLASSES
+from src.generators.plantuml import PlantUMLGenerator
+from src.generators.xmi import XMIGenerator
+
+logger = logging.getLogger(__name__)
+
+
+def partition_model(classes: list, relationships: list, max_classes: int = SHARD_MAX_CLASSES) -> list:
+    """
+    Splits the class graph into shards of at most `max_classes` classes.
+    Weakly connected components are kept whole when they fit; larger ones are
+    split along Louvain communities (then chunked if a community is still too
+    big). Small groups are packed together so tiny islands do not each get a
+    diagram of their own. Returns a list of sorted class lists.
+    """
+    graph = nx.Graph()
+    graph.add_nodes_from(classes)
+    graph.add_edges_from((s, t) for s, _, t in relationships if s in graph and t in graph and s != t)
+
+    groups = []
+    for component in nx.connected_components(graph):
+        if len(component) <= max_classes:
+            groups.append(component)
+            continue
+        subgraph = graph.subgraph(component)
+        for community in nx.community.louvain_communities(subgraph, seed=0):
+            if len(community) <= max_classes:
+                groups.append(community)
+                continue
+            # Chunk in BFS order so each piece stays as connected as possible
+            start = min(community)
+            order = list(nx.bfs_tree(subgraph.subgraph(community), start))
+            order += sorted(community.difference(order))
+            groups.extend(order[i:i + max_classes] for i in range(0, len(order), max_classes))
+
+    # First-fit decreasing: pack groups into as few shards as the bound allows
+    shards = []
+    for group in sorted(groups, key=lambda g: (-len(g), min(g))):
+        target = next((shard for shard in shards if len(shard) + len(group) <= max_classes), None)
+        if target is None:
+            shards.append(set(group))
+        else:
+            target.update(group)
+
+    return [sorted(shard) for shard in shards]
+
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _shared_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    One render pool per process, created on first use and reused for every
+    document. It uses the "spawn" start method: forking while batch reader and
+    writer threads are alive (run_batch(overlap_io=True)) can deadlock.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown()
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pool_workers = workers
+        return _pool
+
+
+def _render_shard(job):
+    """Worker entry point; module-level so it can be sent to a process pool."""
+    name, classes, attributes, methods, relationships, stubs = job
+    return {
+        "name": name,
+        "classes": classes,
+        "stubs": sorted(stubs),
+        "puml": PlantUMLGenerator().generate_puml(classes, attributes, methods, relationships, stubs),
+        "xmi": XMIGenerator().generate_xmi(classes, attributes, methods, relationships, stubs)
+    }
+
+
+class ShardedDiagramGenerator:
+    """
+    Emits one PlantUML/XMI diagram per shard plus a PlantUML index diagram
+    of the shards and the number of relationships crossing between them.
+    Classes owned by another shard appear as stubs stereotyped with that
+    shard's name. Models of at least `parallel_min_classes` classes are
+    rendered on a shared process pool; smaller ones render faster serially.
+    """
+    def __init__(self, max_classes: int = SHARD_MAX_CLASSES, workers: int = SHARD_WORKERS,
+                 parallel_min_classes: int = SHARD_PARALLEL_MIN_CLASSES):
+        self.max_classes = max_classes
+        self.workers = workers
+        self.parallel_min_classes = parallel_min_classes
+
+    def generate(self, classes: list, attributes: list, methods: list, relationships: list,
+                 prefix: str = "shard") -> dict:
+        """Returns {"shards": [{name, classes, stubs, puml, xmi}, ...], "index": puml}."""
+        partition = partition_model(classes, relationships, self.max_classes)
+        names = [f"{prefix}_{i + 1:02d}" for i in range(len(partition))]
+        owner = {cls: name for name, shard in zip(names, partition) for cls in shard}
+
+        # Bucket members and relationships per shard in one pass each
+        buckets = {name: ([], [], []) for name in names}
+        for cls, attr in attributes:
+            if cls in owner:
+                buckets[owner[cls]][0].append((cls, attr))
+        for cls, method in methods:
+            if cls in owner:
+                buckets[owner[cls]][1].append((cls, method))
+
+        crossing = {}
+        stubs = {name: {} for name in names}
+        for source, rel_type, target in relationships:
+            shard_s, shard_t = owner.get(source), owner.get(target)
+            if shard_s is None or shard_t is None:
+                continue
+            buckets[shard_s][2].append((source, rel_type, target))
+            if shard_s != shard_t:
+                buckets[shard_t][2].append((source, rel_type, target))
+                stubs[shard_s][target] = shard_t
+                stubs[shard_t][source] = shard_s
+                pair = tuple(sorted((shard_s, shard_t)))
+                crossing[pair] = crossing.get(pair, 0) + 1
+
+        jobs = [(name, shard, *buckets[name], stubs[name]) for name, shard in zip(names, partition)]
+        if self.workers > 1 and len(jobs) > 1 and len(classes) >= self.parallel_min_classes:
+            shards = list(_shared_pool(self.workers).map(_render_shard, jobs))
+        else:
+            shards = [_render_shard(job) for job in jobs]
+
+        logger.info(f"Sharded {len(classes)} classes into {len(shards)} diagram(s), "
+                    f"{sum(crossing.values())} cross-shard relationship(s)")
+        return {"shards": shards, "index": self.generate_index(names, partition, crossing)}
+
+    def generate_index(self, names: list, partition: list, crossing: dict) -> str:
+        """One package per shard, linked by the count of relationships between them."""
+        lines = ["@startuml", ""]
+        for name, shard in zip(names, partition):
+            lines.append(f'package "{name} ({len(shard)} classes)" as {name} {{')
+            lines.append("}")
+        lines.append("")
+        for (a, b), count in sorted(crossing.items()):
+            lines.append(f"{a} .. {b} : {count}")
+        lines.append("")
+        lines.append("@enduml")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    test_classes = ['Books', 'Librarian', 'Library', 'LibraryManagementSystem', 'User', 'Invoice', 'Payment']
+    test_attributes = [('User', 'name'), ('Payment', 'amount')]
+    test_methods = [('User', 'borrow')]
+    test_relationships = [
+        ('Librarian', 'Inheritance', 'User'),
+        ('Library', 'Aggregation', 'Books'),
+        ('LibraryManagementSystem', 'Association', 'Library'),
+        ('Invoice', 'Aggregation', 'Payment'),
+        ('User', 'Association', 'Invoice')
+    ]
+
+    result = ShardedDiagramGenerator(max_classes=3, workers=2, parallel_min_classes=0).generate(
+        test_classes, test_attributes, test_methods, test_relationships
+    )
+    for shard in result["shards"]:
+        print(f"=== {shard['name']} ===")
+        print(shard["puml"])
+    print("=== INDEX ===")
+    print(result["index"])
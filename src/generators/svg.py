@@ -0,0 +1,221 @@
+import os
+import sys
+import logging
+from xml.sax.saxutils import escape, quoteattr
+
+import networkx as nx
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logger = logging.getLogger(__name__)
+
+class SVGGenerator:
+    """
+    Renders extracted UML components straight to an SVG class diagram,
+    without a PlantUML JVM or render server. Classes are placed in layers
+    computed with networkx (parents and wholes above children and parts).
+    """
+    def __init__(self):
+        # Box metrics for a 12px monospace font
+        self.char_width = 7.2
+        self.line_height = 16
+        self.padding = 8
+        self.h_gap = 40
+        self.v_gap = 70
+        self.margin = 20
+        # Layers wider than this wrap onto further rows (e.g. many unrelated classes)
+        self.max_row_width = 1600
+
+        # Marker per relationship type, mirroring the PlantUML arrow styles
+        # (marker position, marker id)
+        self.rel_markers = {
+            "Inheritance": ("end", "inheritance"),   # --|>  hollow triangle at target
+            "Aggregation": ("start", "aggregation"), # o--   hollow diamond at source
+            "Association": ("end", "association")    # -->   open arrow at target
+        }
+
+    def generate_svg(self, classes: list, attributes: list, methods: list, relationships: list) -> str:
+        """
+        Takes the same structured UML data as PlantUMLGenerator.generate_puml
+        and returns a standalone SVG document.
+        """
+        # 1. Group members once per class
+        members = {cls: ([], []) for cls in classes}
+        for cls, attr in attributes:
+            if cls in members:
+                members[cls][0].append(f"+{attr}")
+        for cls, method in methods:
+            if cls in members:
+                members[cls][1].append(f"+{method}()")
+
+        # 2. Measure boxes and compute the layout
+        sizes = {cls: self._box_size(cls, *members[cls]) for cls in classes}
+        positions = self._layout(classes, relationships, sizes)
+
+        width = max((x + sizes[c][0] for c, (x, y) in positions.items()), default=0) + self.margin
+        height = max((y + sizes[c][1] for c, (x, y) in positions.items()), default=0) + self.margin
+
+        lines = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+            f'viewBox="0 0 {width:.0f} {height:.0f}" font-family="monospace" font-size="12">',
+            self._defs(),
+            f'<rect width="100%" height="100%" fill="#FFFFFF"/>'
+        ]
+
+        # 3. Relationships first so class boxes are drawn on top
+        for source, rel_type, target in relationships:
+            if source not in positions or target not in positions:
+                continue
+            lines.append(self._edge(source, rel_type, target, positions, sizes))
+
+        # 4. Class boxes
+        for cls in classes:
+            lines.append(self._class_box(cls, *members[cls], positions[cls], sizes[cls]))
+
+        lines.append("</svg>")
+        return "\n".join(lines)
+
+    def _box_size(self, cls, attrs, methods):
+        longest = max([len(cls)] + [len(m) for m in attrs + methods])
+        width = longest * self.char_width + 2 * self.padding
+        # Header + one compartment per member list (at least one line tall each)
+        rows = 1 + max(len(attrs), 1) + max(len(methods), 1)
+        height = rows * self.line_height + 3 * self.padding
+        return width, height
+
+    def _layout(self, classes, relationships, sizes):
+        """Assigns (x, y) top-left corners using topological layers."""
+        graph = nx.DiGraph()
+        graph.add_nodes_from(classes)
+        for source, rel_type, target in relationships:
+            if source in sizes and target in sizes and source != target:
+                # Edges point downwards: parent -> child, whole -> part
+                if rel_type == "Inheritance":
+                    graph.add_edge(target, source)
+                else:
+                    graph.add_edge(source, target)
+
+        # Collapse cycles so every class gets a well-defined layer
+        condensed = nx.condensation(graph)
+        layers = []
+        for generation in nx.topological_generations(condensed):
+            layer = []
+            for scc in generation:
+                layer.extend(sorted(condensed.nodes[scc]["members"]))
+            layers.append(layer)
+
+        positions = {}
+        centers = {}
+        y = self.margin
+        for layer in layers:
+            # Order by the mean x of already-placed parents to limit edge crossings
+            def barycenter(cls):
+                parents = [centers[p] for p in graph.predecessors(cls) if p in centers]
+                return sum(parents) / len(parents) if parents else float("inf")
+
+            layer.sort(key=barycenter)
+
+            x, row_height = self.margin, 0
+            for cls in layer:
+                width, height = sizes[cls]
+                if x > self.margin and x + width > self.margin + self.max_row_width:
+                    x, y, row_height = self.margin, y + row_height + self.v_gap, 0
+                positions[cls] = (x, y)
+                centers[cls] = x + width / 2
+                x += width + self.h_gap
+                row_height = max(row_height, height)
+            y += row_height + self.v_gap
+
+        return positions
+
+    def _class_box(self, cls, attrs, methods, position, size):
+        x, y = position
+        width, height = size
+        header_bottom = y + self.line_height + self.padding
+        attrs_bottom = header_bottom + max(len(attrs), 1) * self.line_height + self.padding
+
+        parts = [
+            f'<g class="uml-class" id={quoteattr(cls)}>',
+            f'<rect x="{x:.1f}" y="{y:.1f}" width="{width:.1f}" height="{height:.1f}" '
+            f'fill="#FEFECE" stroke="#A80036" stroke-width="1.5"/>',
+            f'<text x="{x + width / 2:.1f}" y="{y + self.line_height:.1f}" text-anchor="middle" '
+            f'font-weight="bold">{escape(cls)}</text>',
+            f'<line x1="{x:.1f}" y1="{header_bottom:.1f}" x2="{x + width:.1f}" y2="{header_bottom:.1f}" stroke="#A80036"/>',
+            f'<line x1="{x:.1f}" y1="{attrs_bottom:.1f}" x2="{x + width:.1f}" y2="{attrs_bottom:.1f}" stroke="#A80036"/>'
+        ]
+        for i, attr in enumerate(attrs):
+            line_y = header_bottom + (i + 1) * self.line_height
+            parts.append(f'<text x="{x + self.padding:.1f}" y="{line_y:.1f}">{escape(attr)}</text>')
+        for i, method in enumerate(methods):
+            line_y = attrs_bottom + (i + 1) * self.line_height
+            parts.append(f'<text x="{x + self.padding:.1f}" y="{line_y:.1f}">{escape(method)}</text>')
+        parts.append("</g>")
+        return "\n".join(parts)
+
+    def _edge(self, source, rel_type, target, positions, sizes):
+        src_center = self._center(positions[source], sizes[source])
+        tgt_center = self._center(positions[target], sizes[target])
+        x1, y1 = self._clip(src_center, tgt_center, sizes[source])
+        x2, y2 = self._clip(tgt_center, src_center, sizes[target])
+
+        side, marker = self.rel_markers.get(rel_type, self.rel_markers["Association"])
+        parts = [
+            f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}" stroke="#A80036" '
+            f'stroke-width="1.2" marker-{side}="url(#{marker})"/>'
+        ]
+        if rel_type == "Association":
+            # Label the generic associations, as in the PlantUML output
+            parts.append(
+                f'<text x="{(x1 + x2) / 2:.1f}" y="{(y1 + y2) / 2 - 4:.1f}" text-anchor="middle" '
+                f'font-size="11">{escape(rel_type)}</text>'
+            )
+        return "\n".join(parts)
+
+    def _center(self, position, size):
+        return position[0] + size[0] / 2, position[1] + size[1] / 2
+
+    def _clip(self, center, towards, size):
+        """Moves a box center to where the line towards `towards` leaves the box."""
+        cx, cy = center
+        dx, dy = towards[0] - cx, towards[1] - cy
+        if dx == 0 and dy == 0:
+            return cx, cy
+        half_w, half_h = size[0] / 2, size[1] / 2
+        scale = min(
+            half_w / abs(dx) if dx else float("inf"),
+            half_h / abs(dy) if dy else float("inf")
+        )
+        return cx + dx * scale, cy + dy * scale
+
+    def _defs(self):
+        return (
+            '<defs>'
+            '<marker id="inheritance" viewBox="0 0 12 12" refX="12" refY="6" markerWidth="12" markerHeight="12" '
+            'orient="auto"><path d="M0,0 L12,6 L0,12 Z" fill="#FFFFFF" stroke="#A80036"/></marker>'
+            '<marker id="aggregation" viewBox="0 0 16 10" refX="0" refY="5" markerWidth="16" markerHeight="10" '
+            'orient="auto"><path d="M0,5 L8,0 L16,5 L8,10 Z" fill="#FFFFFF" stroke="#A80036"/></marker>'
+            '<marker id="association" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="10" markerHeight="10" '
+            'orient="auto"><path d="M0,0 L10,5 L0,10" fill="none" stroke="#A80036"/></marker>'
+            '</defs>'
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    # Reusing the same simulated data
+    test_classes = ['Books', 'Librarian', 'Library', 'LibraryManagementSystem', 'User']
+    test_attributes = [('User', 'name'), ('User', 'email_address'), ('User', 'user_id')]
+    test_methods = [('LibraryManagementSystem', 'allow'), ('User', 'borrow')]
+    test_relationships = [
+        ('Librarian', 'Inheritance', 'User'),
+        ('Library', 'Aggregation', 'Books'),
+        ('LibraryManagementSystem', 'Association', 'Library')
+    ]
+
+    generator = SVGGenerator()
+    svg_code = generator.generate_svg(test_classes, test_attributes, test_methods, test_relationships)
+
+    print("=== GENERATED SVG CODE ===")
+    print(svg_code)
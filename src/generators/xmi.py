@@ -1,5 +1,6 @@
 import os
 import sys
+import hashlib
 import logging
 import xml.etree.ElementTree as ET
 import xml.dom.minidom
@@ -9,10 +10,27 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 logger = logging.getLogger(__name__)
 
+
+def stable_id(kind: str, *parts: str) -> str:
+    """Deterministic XMI id derived from an element's content, e.g. stable_id("class", "User")."""
+    digest = hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:12]
+    return f"{kind}_{digest}"
+
+
+def _unique(element_id: str, used: dict) -> str:
+    """Suffixes repeated ids (duplicate members) with their occurrence number."""
+    used[element_id] = used.get(element_id, 0) + 1
+    return element_id if used[element_id] == 1 else f"{element_id}_{used[element_id]}"
+
+
 class XMIGenerator:
     """
     Generates standard XMI (XML Metadata Interchange) format 
     from extracted UML components for tool interoperability.
+
+    Element ids are derived from content (class name, owner + member name,
+    source + type + target), so a class keeps its id when others are added
+    or removed and re-exports can be diffed by id.
     """
     def __init__(self):
         # Define standard UML namespaces
@@ -21,96 +39,139 @@ class XMIGenerator:
             "uml": "http://www.eclipse.org/uml2/5.0.0/UML"
         }
 
-    def generate_xmi(self, classes: list, attributes: list, methods: list, relationships: list) -> str:
+    def generate_xmi(self, classes: list, attributes: list, methods: list, relationships: list,
+                     stubs: dict = None) -> str:
         """
         Builds an XML tree representing the UML model and returns a formatted XML string.
+        `stubs` maps classes defined in another model file to a note; they are
+        emitted without members so cross-file relationships still resolve.
         """
-        # 1. Create Root Element
+        return self.to_string(self.build_tree(classes, attributes, methods, relationships, stubs))
+
+    def build_tree(self, classes: list, attributes: list, methods: list, relationships: list,
+                   stubs: dict = None, class_ids: dict = None):
+        """
+        Builds the xmi:XMI element tree behind generate_xmi. `class_ids` maps
+        class names to ids to use instead of their stable ids (e.g. the ids of
+        an existing model the classes are merged into).
+        """
+        class_ids = class_ids or {}
+
+        # 1-2. Create Root Element and Model Container
+        root, model = self.create_document()
+        
+        # Class nodes by id, so generalizations can be nested in their source class
+        class_nodes = {}
+        used_ids = {}
+
+        # Group members per class once, so large models stay linear
+        attrs_by_class, methods_by_class = {}, {}
+        for c, attr in attributes:
+            attrs_by_class.setdefault(c, []).append(attr)
+        for c, method in methods:
+            methods_by_class.setdefault(c, []).append(method)
+        
+        # 3. Generate Classes, Attributes, and Methods
+        for cls in classes:
+            class_node = self.add_class(
+                model, cls, attrs_by_class.get(cls, []), methods_by_class.get(cls, []), used_ids,
+                class_id=class_ids.get(cls)
+            )
+            class_nodes[class_node.get("xmi:id")] = class_node
+
+        # Stubs share the id of the class in its own file, so cross-file references resolve
+        for cls, label in (stubs or {}).items():
+            stub_node = self.add_class(model, cls, [], [], used_ids)
+            stub_id = stub_node.get("xmi:id")
+            class_nodes[stub_id] = stub_node
+            ET.SubElement(stub_node, "ownedComment", {"xmi:id": f"{stub_id}_note", "body": f"Defined in {label}"})
+                
+        # 4. Generate Relationships
+        for source, rel_type, target in relationships:
+            self.add_relationship(model, class_nodes, source, rel_type, target, used_ids, class_ids=class_ids)
+
+        return root
+
+    def create_document(self):
+        """Returns the (xmi:XMI root, uml:Model) pair every export starts from."""
         root = ET.Element("xmi:XMI", {
             "xmlns:xmi": self.namespaces["xmi"],
             "xmlns:uml": self.namespaces["uml"],
             "xmi:version": "2.5"
         })
-        
-        # 2. Create Model Container
         model = ET.SubElement(root, "uml:Model", {"name": "Automated_SRS_Model", "xmi:id": "model_1"})
-        
-        # Map class names to dynamically generated XMI IDs for relationship linking
-        class_id_map = {}
-        
-        # 3. Generate Classes, Attributes, and Methods
-        for i, cls in enumerate(classes):
-            cls_id = f"class_{i}"
-            class_id_map[cls] = cls_id
-            
-            # Create Class Node
-            class_node = ET.SubElement(model, "packagedElement", {
-                "xmi:type": "uml:Class", 
-                "xmi:id": cls_id, 
-                "name": cls
+        return root, model
+
+    def add_class(self, model, cls: str, attrs: list, methods: list, used_ids: dict, class_id: str = None):
+        """Appends a uml:Class with its attributes and operations and returns its node."""
+        cls_id = _unique(class_id or stable_id("class", cls), used_ids)
+        class_node = ET.SubElement(model, "packagedElement", {
+            "xmi:type": "uml:Class", 
+            "xmi:id": cls_id, 
+            "name": cls
+        })
+        for attr in attrs:
+            ET.SubElement(class_node, "ownedAttribute", {
+                "xmi:id": _unique(stable_id("attr", cls, attr), used_ids),
+                "name": attr,
+                "visibility": "public"
             })
-            
-            # Add Attributes
-            cls_attrs = [attr for c, attr in attributes if c == cls]
-            for j, attr in enumerate(cls_attrs):
-                ET.SubElement(class_node, "ownedAttribute", {
-                    "xmi:id": f"{cls_id}_attr_{j}",
-                    "name": attr,
-                    "visibility": "public"
-                })
-                
-            # Add Methods
-            cls_methods = [method for c, method in methods if c == cls]
-            for k, method in enumerate(cls_methods):
-                ET.SubElement(class_node, "ownedOperation", {
-                    "xmi:id": f"{cls_id}_op_{k}",
-                    "name": method,
-                    "visibility": "public"
-                })
-                
-        # 4. Generate Relationships
-        for i, (source, rel_type, target) in enumerate(relationships):
-            source_id = class_id_map.get(source, "unknown")
-            target_id = class_id_map.get(target, "unknown")
-            rel_id = f"rel_{i}"
-            
-            uml_type = "uml:Association"
-            if rel_type == "Inheritance":
-                uml_type = "uml:Generalization"
-                
-                # FIXED: Safely find the source node without relying on XPath namespaces
-                source_node = next(
-                    (node for node in model.findall("packagedElement") if node.get("xmi:id") == source_id), 
-                    None
-                )
-                
-                if source_node is not None:
-                    ET.SubElement(source_node, "generalization", {
-                        "xmi:id": rel_id,
-                        "general": target_id
-                    })
-                continue
-            
-            # For Association and Aggregation
-            rel_node = ET.SubElement(model, "packagedElement", {
-                "xmi:type": uml_type,
-                "xmi:id": rel_id,
-                "name": f"{source}_{rel_type}_{target}"
+        for method in methods:
+            ET.SubElement(class_node, "ownedOperation", {
+                "xmi:id": _unique(stable_id("op", cls, method), used_ids),
+                "name": method,
+                "visibility": "public"
             })
-            
-            # Add member ends to link the two classes
-            ET.SubElement(rel_node, "ownedEnd", {"type": source_id})
-            ET.SubElement(rel_node, "ownedEnd", {"type": target_id})
-            
-            if rel_type == "Aggregation":
-                # Mark aggregation explicitly
-                rel_node.set("aggregation", "shared")
-
-        # 5. Pretty Print XML
+        return class_node
+
+    def add_relationship(self, model, class_nodes: dict, source: str, rel_type: str, target: str, used_ids: dict,
+                         class_ids: dict = None):
+        """
+        Appends a relationship: a generalization inside the source class node
+        (skipped when that class is not in `class_nodes`), or an association
+        packaged in the model. Endpoints are referenced by their stable id, so
+        they resolve against classes exported in another file or run, unless
+        `class_ids` gives the class another id.
+        """
+        class_ids = class_ids or {}
+        source_id = class_ids.get(source) or stable_id("class", source)
+        target_id = class_ids.get(target) or stable_id("class", target)
+        rel_id = _unique(stable_id("rel", source, rel_type, target), used_ids)
+        
+        if rel_type == "Inheritance":
+            source_node = class_nodes.get(source_id)
+            if source_node is not None:
+                ET.SubElement(source_node, "generalization", {
+                    "xmi:id": rel_id,
+                    "general": target_id
+                })
+            return
+        
+        # For Association and Aggregation
+        rel_node = ET.SubElement(model, "packagedElement", {
+            "xmi:type": "uml:Association",
+            "xmi:id": rel_id,
+            "name": f"{source}_{rel_type}_{target}"
+        })
+        
+        # Add member ends to link the two classes
+        ET.SubElement(rel_node, "ownedEnd", {"type": source_id})
+        ET.SubElement(rel_node, "ownedEnd", {"type": target_id})
+        
+        if rel_type == "Aggregation":
+            # Mark aggregation explicitly
+            rel_node.set("aggregation", "shared")
+
+    def to_string(self, root) -> str:
         xml_string = ET.tostring(root, encoding='utf-8', xml_declaration=True)
         parsed_xml = xml.dom.minidom.parseString(xml_string)
         return parsed_xml.toprettyxml(indent="  ")
 
+    def write(self, root, path: str):
+        """Indents the tree in place and writes it to `path` without a string copy of the document."""
+        ET.indent(root, space="  ")
+        ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
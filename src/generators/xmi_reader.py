@@ -0,0 +1,285 @@
+import os
+import sys
+import json
+import logging
+import argparse
+from io import BytesIO
+import xml.etree.ElementTree as ET
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.generators.xmi import XMIGenerator
+
+logger = logging.getLogger(__name__)
+
+
+def _local(name: str) -> str:
+    """'{namespace}id' or 'xmi:id' -> 'id'."""
+    return name.rsplit("}", 1)[-1].rsplit(":", 1)[-1]
+
+
+def _attrs(elem) -> dict:
+    """
+    Element attributes keyed by their full name. Attributes in any XMI
+    namespace are keyed 'xmi:<local>' (tools disagree on the namespace URI),
+    so xmi:type/xmi:id never collide with the plain UML type/id attributes.
+    """
+    attrs = {}
+    for key, value in elem.attrib.items():
+        if key.startswith("{"):
+            namespace, local = key[1:].split("}", 1)
+            if "xmi" in namespace.lower():
+                key = f"xmi:{local}"
+        attrs[key] = value
+    return attrs
+
+
+def _order_ends(resolved: list):
+    """
+    [(type id, aggregation)] per association end -> ([type ids], aggregation).
+    In UML2 the end carrying the aggregation is the property typed by the
+    part, so the ends without one (the whole) are moved first and become the
+    relationship's source.
+    """
+    aggregate = [end for end in resolved if end[1] != "none"]
+    if aggregate:
+        resolved = [end for end in resolved if end[1] == "none"] + aggregate
+    return [type_id for type_id, _ in resolved], aggregate[0][1] if aggregate else "none"
+
+
+class XMIReader:
+    """
+    Streams an existing XMI model into in-memory tables with iterparse.
+
+    Every packagedElement is reduced to table rows as soon as its end tag is
+    read and is then detached from the tree, so memory is bounded by the
+    tables rather than by the size of the document. Only what the generator
+    models survives: classes, attributes, operations, generalizations and
+    (shared/composite) associations.
+
+    Tables (ids are the file's own xmi:ids):
+        classes         {class id: name}, with class_ids as the reverse index
+        attributes      [(class id, name)]
+        operations      [(class id, name)]
+        generalizations [(specific id, general id)]
+        associations    [(association id, [end type ids], aggregation)]
+        member_ends     {property id: (type id, aggregation)}, for associations
+                        that reference their ends through memberEnd
+    """
+    def __init__(self):
+        self.classes = {}
+        self.class_ids = {}
+        self.attributes = []
+        self.operations = []
+        self.generalizations = []
+        self.associations = []
+        self.member_ends = {}
+        self.elements_read = 0
+
+    def read(self, source):
+        """Parses a path or file object; returns self so calls can be chained."""
+        # Stack of (element, local tag, attributes) for the open elements
+        stack = []
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                stack.append((elem, _local(elem.tag), _attrs(elem)))
+                continue
+
+            _, tag, attrs = stack.pop()
+            owner = next((entry for entry in reversed(stack) if entry[1] == "packagedElement"), None)
+            if tag == "packagedElement":
+                self._add_element(attrs, elem)
+            elif owner is not None:
+                self._add_member(tag, attrs, owner[2])
+
+            # packagedElements are kept until their end tag (their children are read there);
+            # everything else is released immediately
+            if tag == "packagedElement" or owner is None:
+                elem.clear()
+                if stack:
+                    stack[-1][0].remove(elem)
+            self.elements_read += 1
+
+        self.class_ids = {name: class_id for class_id, name in self.classes.items()}
+        logger.info(
+            f"Read {len(self.classes)} classes, {len(self.attributes)} attributes, "
+            f"{len(self.operations)} operations and {len(self.generalizations) + len(self.associations)} "
+            f"relationships from {self.elements_read} XMI elements"
+        )
+        return self
+
+    def _add_element(self, attrs, elem):
+        uml_type = attrs.get("xmi:type", "")
+        if uml_type == "uml:Class":
+            self.classes[attrs.get("xmi:id")] = attrs.get("name", "")
+        elif uml_type == "uml:Association":
+            owned = []
+            for child in elem:
+                if _local(child.tag) == "ownedEnd":
+                    child_attrs = _attrs(child)
+                    owned.append((child_attrs.get("type"), child_attrs.get("aggregation", "none")))
+                    if "xmi:id" in child_attrs:
+                        self.member_ends[child_attrs["xmi:id"]] = owned[-1]
+            if any(aggregation != "none" for _, aggregation in owned):
+                ends, aggregation = _order_ends(owned)
+            else:
+                # Aggregation on the association itself (as XMIGenerator writes it): ends are source, target
+                ends, aggregation = [type_id for type_id, _ in owned], attrs.get("aggregation", "none")
+            if len(ends) < 2 and attrs.get("memberEnd"):
+                ends = attrs["memberEnd"].split()
+                aggregation = None  # Resolved through member_ends once the whole file is read
+            self.associations.append((attrs.get("xmi:id"), ends, aggregation))
+
+    def _add_member(self, tag, attrs, owner_attrs):
+        if owner_attrs.get("xmi:type") != "uml:Class":
+            return
+        owner_id = owner_attrs.get("xmi:id")
+        if tag == "ownedAttribute":
+            if "association" in attrs:
+                # A navigable association end, not a plain attribute
+                self.member_ends[attrs.get("xmi:id")] = (attrs.get("type"), attrs.get("aggregation", "none"))
+            else:
+                self.attributes.append((owner_id, attrs.get("name", "")))
+        elif tag == "ownedOperation":
+            self.operations.append((owner_id, attrs.get("name", "")))
+        elif tag == "generalization" and attrs.get("general"):
+            self.generalizations.append((owner_id, attrs["general"]))
+
+    def to_components(self) -> dict:
+        """The tables resolved to class names, in the pipeline's full_data layout."""
+        name = self.classes.get
+        relationships = [
+            (name(specific), "Inheritance", name(general)) for specific, general in self.generalizations
+            if name(specific) and name(general)
+        ]
+        for _, ends, aggregation in self.associations:
+            if aggregation is None:
+                # memberEnd form: ends are property ids, typed and aggregated through member_ends
+                ends, aggregation = _order_ends([self.member_ends.get(end, (None, "none")) for end in ends])
+            if len(ends) < 2 or not (name(ends[0]) and name(ends[1])):
+                continue
+            rel_type = "Aggregation" if aggregation in ("shared", "composite") else "Association"
+            relationships.append((name(ends[0]), rel_type, name(ends[1])))
+
+        return {
+            "components": {
+                "classes": list(dict.fromkeys(self.classes.values())),
+                "attributes": [(name(c), attr) for c, attr in self.attributes if name(c)],
+                "methods": [(name(c), op) for c, op in self.operations if name(c)]
+            },
+            "relationships": relationships
+        }
+
+
+def merge_models(existing: dict, extracted: dict) -> dict:
+    """
+    Merges extracted components into an existing model by name. The existing
+    model's order is kept and new classes, members and relationships are
+    appended; nothing already in the model is removed or renamed.
+    """
+    def union(old, new):
+        return list(dict.fromkeys([tuple(x) if isinstance(x, list) else x for x in list(old) + list(new)]))
+
+    components = {
+        key: union(existing["components"][key], extracted["components"][key])
+        for key in ("classes", "attributes", "methods")
+    }
+    return {"components": components,
+            "relationships": union(existing["relationships"], extracted["relationships"])}
+
+
+def merge_into_xmi(xmi_path: str, extracted: dict, output_path: str) -> dict:
+    """
+    Reads `xmi_path`, merges `extracted` (full_data) into it and writes the
+    result to `output_path`. Classes matched by name keep their xmi:ids from
+    the existing file; new elements get stable ids. The output is a lossy
+    regeneration, not an in-place edit: only what XMIReader models survives,
+    so packages, diagrams, multiplicities, comments and other elements of the
+    original file are dropped. The tree is written with ElementTree, without
+    building the whole document as a string.
+    """
+    reader = XMIReader().read(xmi_path)
+    existing = reader.to_components()
+    merged = merge_models(existing, extracted)
+
+    components = merged["components"]
+    added = {key: len(components[key]) - len(existing["components"][key]) for key in components}
+    added["relationships"] = len(merged["relationships"]) - len(existing["relationships"])
+
+    generator = XMIGenerator()
+    root = generator.build_tree(
+        components["classes"], components["attributes"], components["methods"], merged["relationships"],
+        class_ids=reader.class_ids
+    )
+    generator.write(root, output_path)
+    logger.info(f"Merged model written to {output_path} (added: {added})")
+    return added
+
+
+# Library owns Books by composition, written as UML2 tools do: the aggregation sits on
+# the end typed by the part, in an ownedEnd and in a class-owned memberEnd property
+SAMPLE_HEADER = (
+    '<xmi:XMI xmlns:xmi="http://www.omg.org/spec/XMI/20131001" xmlns:uml="http://www.eclipse.org/uml2/5.0.0/UML">'
+    '<uml:Model xmi:id="m"><packagedElement xmi:type="uml:Class" xmi:id="L" name="Library"/>'
+)
+SAMPLE_OWNED_END = SAMPLE_HEADER + (
+    '<packagedElement xmi:type="uml:Class" xmi:id="B" name="Books"/>'
+    '<packagedElement xmi:type="uml:Association" xmi:id="A">'
+    '<ownedEnd xmi:id="e1" type="B" aggregation="composite"/><ownedEnd xmi:id="e2" type="L"/>'
+    '</packagedElement></uml:Model></xmi:XMI>'
+)
+SAMPLE_MEMBER_END = SAMPLE_HEADER + (
+    '<packagedElement xmi:type="uml:Class" xmi:id="B" name="Books">'
+    '<ownedAttribute xmi:id="p1" name="library" type="L" association="A"/></packagedElement>'
+    '<packagedElement xmi:type="uml:Association" xmi:id="A" memberEnd="p1 p2">'
+    '<ownedEnd xmi:id="p2" type="B" aggregation="composite"/></packagedElement></uml:Model></xmi:XMI>'
+)
+
+
+def self_check():
+    """Reads the UML2 samples and a generator round trip; raises AssertionError on a mismatch."""
+    expected = [("Library", "Aggregation", "Books")]
+    for label, sample in (("ownedEnd", SAMPLE_OWNED_END), ("memberEnd", SAMPLE_MEMBER_END)):
+        relationships = XMIReader().read(BytesIO(sample.encode("utf-8"))).to_components()["relationships"]
+        assert relationships == expected, f"{label} form read as {relationships}"
+
+    relationships = [("Librarian", "Inheritance", "User"), ("Library", "Aggregation", "Books"),
+                     ("LibraryManagementSystem", "Association", "Library")]
+    classes = sorted({cls for source, _, target in relationships for cls in (source, target)})
+    xmi_code = XMIGenerator().generate_xmi(classes, [("User", "name")], [("User", "borrow")], relationships)
+    model = XMIReader().read(BytesIO(xmi_code.encode("utf-8"))).to_components()
+    assert model["relationships"] == relationships, f"round trip read as {model['relationships']}"
+    assert model["components"]["classes"] == classes
+    logger.info("XMI reader self-check passed")
+
+
+def parse_args(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        description="Merge extracted components into an existing XMI model. The merged file is regenerated from "
+                    "classes, members, generalizations and associations only (existing class ids are kept); "
+                    "packages and other unmodelled elements of the original are dropped."
+    )
+    arg_parser.add_argument("model", nargs="?", help="Existing XMI model")
+    arg_parser.add_argument("components", nargs="?", help="Extracted <name>_components.json")
+    arg_parser.add_argument("-o", "--output", help="Merged XMI (default: <model>_merged.xmi)")
+    arg_parser.add_argument("--self-check", action="store_true",
+                            help="Read built-in UML2 association samples and a generator round trip, then exit")
+    args = arg_parser.parse_args(argv)
+    if not args.self_check and not (args.model and args.components):
+        arg_parser.error("model and components are required unless --self-check is given")
+    return args
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    if args.self_check:
+        self_check()
+        sys.exit(0)
+
+    with open(args.components, "r", encoding="utf-8") as f:
+        extracted = json.load(f)
+
+    output_path = args.output or f"{os.path.splitext(args.model)[0]}_merged.xmi"
+    print(json.dumps(merge_into_xmi(args.model, extracted, output_path), indent=4))
@@ -0,0 +1,127 @@
+import logging
+import sys
+import os
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logger = logging.getLogger(__name__)
+
+
+def sentence_entry(doc, extractor, classifier) -> dict:
+    """
+    Extracts a self-contained, JSON-serializable result for a parsed piece of text.
+    Relationships are kept as candidate noun phrases + cue type per sentence,
+    because linking them needs the class list of the whole document.
+    """
+    components = extractor.extract_components(doc)
+    return {
+        "classes": components["classes"],
+        "attributes": components["attributes"],
+        "methods": components["methods"],
+        "links": [
+            [classifier.sentence_noun_phrases(sent), classifier.cue_relation_type(sent.text.lower())]
+            for sent in doc.sents
+        ] if doc else []
+    }
+
+
+class ModelAccumulator:
+    """
+    Merges per-sentence entries (in document order) into one UML model.
+    A snapshot can be taken at any time; after all entries are added it is
+    identical to extracting and classifying the text in one pass.
+
+    Relationships are maintained incrementally: a new class can only change
+    the links of sentences that mention it, so only those are re-linked.
+    `take_delta` returns what changed since it was last called.
+    """
+    def __init__(self, classifier):
+        self.classifier = classifier
+        self.classes = set()
+        self.attributes = []
+        self.methods = []
+        self.links = []
+        self._link_rel = []        # current relationship of each link, or None
+        self._links_by_phrase = {} # noun phrase -> indices of the links mentioning it
+        self._rel_count = {}       # relationship -> number of links producing it
+        self._delta = self._empty_delta()
+
+    @staticmethod
+    def _empty_delta():
+        return {"classes": set(), "attributes": [], "methods": [], "added": set(), "removed": set()}
+
+    def add(self, entry: dict):
+        new_classes = set(entry["classes"]) - self.classes
+        self.classes.update(new_classes)
+        attributes = [tuple(item) for item in entry["attributes"]]
+        methods = [tuple(item) for item in entry["methods"]]
+        self.attributes.extend(attributes)
+        self.methods.extend(methods)
+        self._delta["classes"].update(new_classes)
+        self._delta["attributes"].extend(attributes)
+        self._delta["methods"].extend(methods)
+
+        # Earlier sentences mentioning a new class may now link differently
+        stale = set()
+        for cls in new_classes:
+            stale.update(self._links_by_phrase.get(cls, ()))
+        for i in sorted(stale):
+            self._set_link(i, self._link(self.links[i]))
+
+        for link in entry["links"]:
+            i = len(self.links)
+            self.links.append(link)
+            self._link_rel.append(None)
+            for phrase in link[0]:
+                self._links_by_phrase.setdefault(phrase, []).append(i)
+            self._set_link(i, self._link(link))
+
+    def _link(self, link):
+        noun_phrases, rel_type = link
+        relationship = self.classifier.relationship_from_phrases(noun_phrases, self.classes, rel_type)
+        return tuple(relationship) if relationship is not None else None
+
+    def _set_link(self, i, relationship):
+        old = self._link_rel[i]
+        if old == relationship:
+            return
+        self._link_rel[i] = relationship
+        if old is not None:
+            self._rel_count[old] -= 1
+            if not self._rel_count[old]:
+                del self._rel_count[old]
+                if old in self._delta["added"]:
+                    self._delta["added"].discard(old)
+                else:
+                    self._delta["removed"].add(old)
+        if relationship is not None:
+            self._rel_count[relationship] = self._rel_count.get(relationship, 0) + 1
+            if self._rel_count[relationship] == 1:
+                if relationship in self._delta["removed"]:
+                    self._delta["removed"].discard(relationship)
+                else:
+                    self._delta["added"].add(relationship)
+
+    def relationships(self) -> list:
+        return sorted(self._rel_count)
+
+    def snapshot(self):
+        """Returns (components, relationships) for everything added so far."""
+        components = {
+            "classes": sorted(self.classes),
+            "attributes": list(self.attributes),
+            "methods": list(self.methods)
+        }
+        return components, self.relationships()
+
+    def take_delta(self) -> dict:
+        """New classes, members and added/removed relationships since the previous call."""
+        delta, self._delta = self._delta, self._empty_delta()
+        return {
+            "classes": sorted(delta["classes"]),
+            "attributes": delta["attributes"],
+            "methods": delta["methods"],
+            "relationships_added": sorted(delta["added"]),
+            "relationships_removed": sorted(delta["removed"])
+        }
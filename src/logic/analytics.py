@@ -0,0 +1,247 @@
+import os
+import sys
+import json
+import heapq
+import hashlib
+import logging
+from collections import OrderedDict
+
+import networkx as nx
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import ANALYTICS_HUB_COUNT, ANALYTICS_CACHE_SIZE, ANALYTICS_REBUILD_FRACTION
+
+logger = logging.getLogger(__name__)
+
+
+def model_hash(classes, relationships) -> str:
+    """Order-independent fingerprint of a model's classes and relationships."""
+    payload = "\n".join(sorted(classes)) + "\x00" + "\n".join(sorted("\t".join(rel) for rel in relationships))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _cyclic_components(graph):
+    """Strongly connected components that contain a cycle (size > 1 or a self-loop)."""
+    for component in nx.strongly_connected_components(graph):
+        if len(component) > 1 or graph.has_edge(next(iter(component)), next(iter(component))):
+            yield frozenset(component)
+
+
+def _scc_after_add(graph, components, u, v):
+    """Updates {node: cyclic SCC} after adding edge u -> v: a new cycle exists iff v reaches u."""
+    if components.get(u) is not None and components.get(u) is components.get(v):
+        return
+    if u != v and not nx.has_path(graph, v, u):
+        return
+    component = frozenset({u} | (nx.descendants(graph, u) & nx.ancestors(graph, u)))
+    for node in component:
+        components[node] = component
+
+
+def _scc_after_remove(graph, components, u, v):
+    """
+    Updates {node: cyclic SCC} after removing edge u -> v: only u's old
+    component can split, and it stays whole while u still reaches v.
+    """
+    component = components.get(u)
+    if component is None or v not in component:
+        return
+    if u != v and nx.has_path(graph, u, v):
+        return
+    for node in component:
+        del components[node]
+    for split in _cyclic_components(graph.subgraph(component).copy()):
+        for node in split:
+            components[node] = split
+
+
+class ModelAnalytics:
+    """
+    Graph analytics over an extracted model: inheritance depth and cycles,
+    fan-in/fan-out hubs, orphan classes and strongly connected clusters.
+
+    The graphs and per-class results are kept between calls to `update`, which
+    diffs the new model against the previous one and only revisits what a
+    changed relationship can affect (the subclasses of a re-parented class,
+    the component a removed edge belonged to, ...). Large diffs fall back to a
+    full rebuild. Reports are cached per model hash.
+    """
+    def __init__(self, hub_count=ANALYTICS_HUB_COUNT, cache_size=ANALYTICS_CACHE_SIZE,
+                 rebuild_fraction=ANALYTICS_REBUILD_FRACTION):
+        self.hub_count = hub_count
+        self.cache_size = cache_size
+        self.rebuild_fraction = rebuild_fraction
+        self.classes = set()
+        self.relationships = set()
+        self.graph = nx.DiGraph()        # source -> target, any relationship type
+        self.inheritance = nx.DiGraph()  # child -> parent
+        self.depth = {}                  # class -> inheritance depth (0 = no parent)
+        self.clusters = {}               # class -> cyclic SCC of self.graph
+        self.cycles = {}                 # class -> cyclic SCC of self.inheritance
+        self.stats = {"rebuilds": 0, "incremental_updates": 0, "cache_hits": 0}
+        self._reports = OrderedDict()
+
+    def update(self, classes, relationships) -> dict:
+        """Brings the analytics in line with the given model and returns its report."""
+        key = model_hash(classes, relationships)
+        classes = set(classes)
+        relationships = set(map(tuple, relationships))
+
+        added = relationships - self.relationships
+        removed = self.relationships - relationships
+        changes = len(added) + len(removed) + len(classes ^ self.classes)
+        if changes > self.rebuild_fraction * max(len(relationships) + len(classes), 1):
+            self._rebuild(classes, relationships)
+        elif changes:
+            self._apply(classes, added, removed)
+
+        if key in self._reports:
+            self.stats["cache_hits"] += 1
+            self._reports.move_to_end(key)
+            return self._reports[key]
+        report = self.report()
+        report["model_hash"] = key
+        self._reports[key] = report
+        if len(self._reports) > self.cache_size:
+            self._reports.popitem(last=False)
+        return report
+
+    # --- Maintenance ---
+
+    def _rebuild(self, classes, relationships):
+        self.stats["rebuilds"] += 1
+        self.classes, self.relationships = set(classes), set(relationships)
+        self.graph = nx.DiGraph()
+        self.inheritance = nx.DiGraph()
+        self.graph.add_nodes_from(classes)
+        for source, rel_type, target in relationships:
+            self._add_edge(source, rel_type, target)
+
+        self.clusters = {node: c for c in _cyclic_components(self.graph) for node in c}
+        self.cycles = {node: c for c in _cyclic_components(self.inheritance) for node in c}
+        self.depth = {}
+        self._compute_depth(set(self.inheritance))
+
+    def _apply(self, classes, added, removed):
+        self.stats["incremental_updates"] += 1
+        for source, rel_type, target in removed:
+            self.relationships.discard((source, rel_type, target))
+            self._remove_edge(source, rel_type, target)
+        self.classes = set(classes)
+        self.graph.add_nodes_from(classes)
+        for source, rel_type, target in added:
+            self.relationships.add((source, rel_type, target))
+            self._add_edge(source, rel_type, target, incremental=True)
+
+        # Drop nodes that are neither classes nor relationship endpoints any more
+        stale = [n for n in self.graph if n not in self.classes and self.graph.degree(n) == 0]
+        self.graph.remove_nodes_from(stale)
+        stale = [n for n in self.inheritance if self.inheritance.degree(n) == 0]
+        self.inheritance.remove_nodes_from(stale)
+        for node in stale:
+            self.depth.pop(node, None)
+
+    def _add_edge(self, source, rel_type, target, incremental=False):
+        if self.graph.has_edge(source, target):
+            self.graph[source][target]["types"].add(rel_type)
+        else:
+            self.graph.add_edge(source, target, types={rel_type})
+            if incremental:
+                _scc_after_add(self.graph, self.clusters, source, target)
+
+        if rel_type == "Inheritance":
+            self.inheritance.add_edge(source, target)
+            if incremental:
+                _scc_after_add(self.inheritance, self.cycles, source, target)
+                self._refresh_depth({source})
+
+    def _remove_edge(self, source, rel_type, target):
+        types = self.graph[source][target]["types"]
+        types.discard(rel_type)
+        if not types:
+            self.graph.remove_edge(source, target)
+            _scc_after_remove(self.graph, self.clusters, source, target)
+
+        if rel_type == "Inheritance":
+            self.inheritance.remove_edge(source, target)
+            _scc_after_remove(self.inheritance, self.cycles, source, target)
+            self._refresh_depth({source})
+
+    def _refresh_depth(self, changed):
+        """
+        Recomputes the depth of the changed classes and of every class that
+        inherits from them; nothing else depends on an edge leaving `changed`.
+        Classes on an inheritance cycle share the depth of their cycle.
+        """
+        affected = set()
+        for node in changed:
+            if node in self.inheritance and node not in affected:
+                affected.add(node)
+                affected.update(nx.ancestors(self.inheritance, node))
+        if affected:
+            self._compute_depth(affected)
+
+    def _compute_depth(self, affected):
+        condensed = nx.condensation(self.inheritance.subgraph(affected))
+        members = nx.get_node_attributes(condensed, "members")
+        # Edges point child -> parent, so walk parents first
+        for scc in reversed(list(nx.topological_sort(condensed))):
+            depth = 0
+            for node in members[scc]:
+                for parent in self.inheritance.successors(node):
+                    if parent not in members[scc]:
+                        depth = max(depth, self.depth.get(parent, 0) + 1)
+            for node in members[scc]:
+                self.depth[node] = depth
+
+    # --- Report ---
+
+    def report(self) -> dict:
+        classes = sorted(self.classes)
+        depths = {cls: self.depth.get(cls, 0) for cls in classes}
+        fan_in, fan_out = dict(self.graph.in_degree()), dict(self.graph.out_degree())
+
+        def top(degree):
+            ranked = heapq.nsmallest(self.hub_count, (c for c in classes if degree[c]), key=lambda c: (-degree[c], c))
+            return [[cls, degree[cls]] for cls in ranked]
+
+        def distinct(components):
+            unique = {id(c): c for c in components.values()}.values()
+            return sorted((sorted(c) for c in unique), key=lambda c: (-len(c), c))
+
+        return {
+            "classes": len(classes),
+            "relationships": len(self.relationships),
+            "inheritance": {
+                "max_depth": max(depths.values(), default=0),
+                "mean_depth": round(sum(depths.values()) / len(depths), 3) if depths else 0.0,
+                "deepest": [[cls, depths[cls]] for cls in
+                            heapq.nsmallest(self.hub_count, (c for c in classes if depths[c]),
+                                            key=lambda c: (-depths[c], c))],
+                "cycles": distinct(self.cycles)
+            },
+            "hubs": {"fan_in": top(fan_in), "fan_out": top(fan_out)},
+            "orphans": [cls for cls in classes if not fan_in[cls] and not fan_out[cls]],
+            "clusters": distinct(self.clusters)
+        }
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    classes = ['Books', 'Librarian', 'Library', 'LibraryManagementSystem', 'User', 'Guest']
+    relationships = [
+        ('Librarian', 'Inheritance', 'User'),
+        ('Library', 'Aggregation', 'Books'),
+        ('LibraryManagementSystem', 'Association', 'Library')
+    ]
+
+    analytics = ModelAnalytics()
+    print(json.dumps(analytics.update(classes, relationships), indent=4))
+
+    # A requirements change adds one relationship: only the affected classes are revisited
+    relationships.append(('Books', 'Association', 'Library'))
+    print(json.dumps(analytics.update(classes, relationships)["clusters"]))
+    print(analytics.stats)
@@ -1,10 +1,14 @@
 import logging
 import sys
 import os
+import re
+import time
 
 # Ensure the root directory is in the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from src.core.config import LEXICON_PATH
+from src.core.lexicons import load_lexicons
 from src.nlp.clean_text import clean_srs_text
 from src.nlp.parser import SRSParser
 from src.nlp.extractor import UMLExtractor
@@ -15,11 +19,73 @@ class RelationshipClassifier:
     """
     Detects UML relationships (Association, Aggregation, Inheritance) 
     between extracted classes using rule-based NLP heuristics.
+
+    With a RuleStats in `stats`, each cue rule (CUE_INHERITANCE,
+    CUE_AGGREGATION, DEFAULT_ASSOCIATION) is timed and credited with the
+    relationships it typed.
     """
-    def __init__(self):
-        # Lexical cues for identifying relationship types
-        self.inheritance_cues = {"is a", "is an", "extends", "inherits", "type of", "kind of", "are a"}
-        self.aggregation_cues = {"has", "have", "contains", "contain", "consists of", "composed of", "comprises"}
+    def __init__(self, lexicon_path=LEXICON_PATH, stats=None):
+        self.stats = stats
+
+        # Lexical cues for identifying relationship types (see src/core/lexicons.json)
+        lexicons = load_lexicons(lexicon_path)
+        self.inheritance_cues = lexicons["inheritance_cues"]
+        self.aggregation_cues = lexicons["aggregation_cues"]
+
+        # Each cue set compiles to one alternation, so a sentence is scanned once per type
+        self._inheritance_re = self._compile_cues(self.inheritance_cues)
+        self._aggregation_re = self._compile_cues(self.aggregation_cues)
+
+    def _compile_cues(self, cues):
+        if not cues:
+            return None
+        return re.compile("|".join(re.escape(cue) for cue in sorted(cues, key=len, reverse=True)))
+
+    def cue_relation_type(self, text_lower: str) -> str:
+        """Maps a lower-cased sentence to a relationship type using the cue lexicons."""
+        if self._inheritance_re is not None and self._inheritance_re.search(text_lower):
+            return "Inheritance"
+        if self._aggregation_re is not None and self._aggregation_re.search(text_lower):
+            return "Aggregation"
+        return "Association"
+
+    def _timed_cue_relation_type(self, sent):
+        """cue_relation_type() for one sentence, recording each cue rule it tries; returns (type, rule id)."""
+        text_lower = sent.text.lower()
+        for rule_id, pattern, rel_type in (("CUE_INHERITANCE", self._inheritance_re, "Inheritance"),
+                                           ("CUE_AGGREGATION", self._aggregation_re, "Aggregation")):
+            if pattern is None:
+                continue
+            started = time.perf_counter()
+            found = pattern.search(text_lower) is not None
+            self.stats.record(rule_id, tokens=len(sent), matches=int(found), seconds=time.perf_counter() - started)
+            if found:
+                return rel_type, rule_id
+        self.stats.record("DEFAULT_ASSOCIATION", tokens=len(sent), matches=1)
+        return "Association", "DEFAULT_ASSOCIATION"
+
+    def sentence_noun_phrases(self, sent) -> list:
+        """Distinct compound noun phrases of a sentence, in order of first mention."""
+        noun_phrases = []
+        for token in sent:
+            if token.pos_ in ["NOUN", "PROPN"]:
+                compounds = [w.text for w in token.lefts if w.dep_ == "compound"]
+                compounds.append(token.text)
+                noun_phrase = "".join(word.capitalize() for word in compounds)
+                
+                if noun_phrase not in noun_phrases:
+                    noun_phrases.append(noun_phrase)
+        return noun_phrases
+
+    def relationship_from_phrases(self, noun_phrases, class_set, rel_type):
+        """
+        Links the first two known classes of a sentence, or returns None.
+        The first class mentioned is typically the source (subject), the second is the target (object).
+        """
+        classes_in_sent = [phrase for phrase in noun_phrases if phrase in class_set]
+        if len(classes_in_sent) < 2:
+            return None
+        return (classes_in_sent[0], rel_type, classes_in_sent[1])
 
     def classify_relationships(self, doc, extracted_classes):
         relationships = [] 
@@ -27,43 +93,33 @@ class RelationshipClassifier:
         if not doc or not extracted_classes:
             return relationships
         
-        # Sort classes by length descending so we match 'LibraryManagementSystem' before 'Library'
-        sorted_classes = sorted(extracted_classes, key=len, reverse=True)
+        class_set = set(extracted_classes)
             
+        if self.stats is not None:
+            return self._classify_instrumented(doc, class_set)
+
         for sent in doc.sents:
-            text_lower = sent.text.lower()
-            
             # Find classes in the sentence, preserving order to determine Subject -> Object direction
-            classes_in_sent = []
-            
-            for token in sent:
-                if token.pos_ in ["NOUN", "PROPN"]:
-                    compounds = [w.text for w in token.lefts if w.dep_ == "compound"]
-                    compounds.append(token.text)
-                    noun_phrase = "".join(word.capitalize() for word in compounds)
-                    
-                    if noun_phrase in sorted_classes and noun_phrase not in classes_in_sent:
-                        classes_in_sent.append(noun_phrase)
-
-            # If a sentence contains at least 2 distinct classes, evaluate their relationship
-            if len(classes_in_sent) >= 2:
-                # The first class mentioned is typically the source (subject), the second is the target (object)
-                source = classes_in_sent[0]
-                target = classes_in_sent[1]
-                
-                is_inheritance = any(cue in text_lower for cue in self.inheritance_cues)
-                is_aggregation = any(cue in text_lower for cue in self.aggregation_cues)
-                
-                if is_inheritance:
-                    relationships.append((source, "Inheritance", target))
-                elif is_aggregation:
-                    relationships.append((source, "Aggregation", target))
-                else:
-                    relationships.append((source, "Association", target))
+            relationship = self.relationship_from_phrases(
+                self.sentence_noun_phrases(sent), class_set, self.cue_relation_type(sent.text.lower())
+            )
+            if relationship is not None:
+                relationships.append(relationship)
                     
         unique_rels = list(set(relationships))
         return sorted(unique_rels)
 
+    def _classify_instrumented(self, doc, class_set):
+        relationships = set()
+        for sent in doc.sents:
+            rel_type, rule_id = self._timed_cue_relation_type(sent)
+            started = time.perf_counter()
+            relationship = self.relationship_from_phrases(self.sentence_noun_phrases(sent), class_set, rel_type)
+            self.stats.record(rule_id, seconds=time.perf_counter() - started)
+            if relationship is not None:
+                relationships.add(relationship)
+                self.stats.emit(rule_id, "relationships", [relationship])
+        return sorted(relationships)
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
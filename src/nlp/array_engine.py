@@ -0,0 +1,319 @@
+import logging
+import sys
+import os
+
+import numpy as np
+from spacy.attrs import ORTH, LEMMA, POS, DEP, HEAD, SPACY, SENT_START
+from spacy.strings import get_string_id
+
+# Ensure the root directory is in the Python path for direct script execution
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.nlp.clean_text import clean_srs_text
+from src.nlp.parser import SRSParser
+from src.nlp.extractor import UMLExtractor
+from src.logic.classifier import RelationshipClassifier
+
+logger = logging.getLogger(__name__)
+
+# Label sets read by the heuristics, resolved once to StringStore IDs
+NOUN_POS = np.array([get_string_id(p) for p in ["NOUN", "PROPN"]], dtype=np.uint64)
+ATTR_VERB_POS = np.array([get_string_id(p) for p in ["VERB", "AUX"]], dtype=np.uint64)
+CLASS_DEPS = np.array([get_string_id(d) for d in ["nsubj", "nsubjpass", "dobj", "pobj", "attr"]], dtype=np.uint64)
+SUBJECT_DEPS = np.array([get_string_id(d) for d in ["nsubj", "nsubjpass"]], dtype=np.uint64)
+ATTR_OBJECT_DEPS = np.array([get_string_id(d) for d in ["dobj", "attr"]], dtype=np.uint64)
+COMPLEMENT_DEPS = np.array([get_string_id(d) for d in ["xcomp", "ccomp"]], dtype=np.uint64)
+VERB_ID = get_string_id("VERB")
+DOBJ_DEP = get_string_id("dobj")
+CONJ_DEP = get_string_id("conj")
+COMPOUND_DEP = get_string_id("compound")
+
+
+class TokenArrays:
+    """
+    Compact, Doc-free snapshot of a parsed document holding only the token
+    attributes the UML heuristics read (one row per token).
+    ORTH/LEMMA columns are hashes resolved through the `strings` table.
+    """
+    EXPORT_ATTRS = [ORTH, LEMMA, POS, DEP, HEAD, SPACY, SENT_START]
+
+    def __init__(self, orth, lemma, pos, dep, head, whitespace, sent_ids, strings):
+        self.orth = orth
+        self.lemma = lemma
+        self.pos = pos
+        self.dep = dep
+        self.head = head              # Absolute head index (root points at itself)
+        self.whitespace = whitespace  # True if the token is followed by a space
+        self.sent_ids = sent_ids
+        self.strings = strings
+
+    @classmethod
+    def from_doc(cls, doc):
+        """Exports a spaCy Doc once via `Doc.to_array`."""
+        if not doc or len(doc) == 0:
+            return cls.empty()
+
+        table = doc.to_array(cls.EXPORT_ATTRS)
+        signed = table.view(np.int64)
+        index = np.arange(len(doc), dtype=np.int64)
+
+        sent_starts = signed[:, 6] == 1
+        sent_starts[0] = True
+
+        orth = np.ascontiguousarray(table[:, 0])
+        lemma = np.ascontiguousarray(table[:, 1])
+        keys = np.unique(np.concatenate([orth, lemma])).tolist()
+
+        return cls(
+            orth=orth,
+            lemma=lemma,
+            pos=np.ascontiguousarray(table[:, 2]),
+            dep=np.ascontiguousarray(table[:, 3]),
+            head=index + signed[:, 4],
+            whitespace=table[:, 5].astype(bool),
+            sent_ids=np.cumsum(sent_starts) - 1,
+            strings={key: doc.vocab.strings[key] for key in keys}
+        )
+
+    @classmethod
+    def empty(cls):
+        hashes = np.zeros(0, dtype=np.uint64)
+        return cls(hashes, hashes, hashes, hashes, np.zeros(0, dtype=np.int64),
+                   np.zeros(0, dtype=bool), np.zeros(0, dtype=np.int64), {})
+
+    def __len__(self):
+        return len(self.orth)
+
+    @property
+    def nbytes(self):
+        columns = [self.orth, self.lemma, self.pos, self.dep, self.head, self.whitespace, self.sent_ids]
+        return sum(col.nbytes for col in columns)
+
+    def text(self, i):
+        return self.strings[int(self.orth[i])]
+
+    def lemma_text(self, i):
+        return self.strings[int(self.lemma[i])]
+
+    def sentence_bounds(self):
+        """Returns (start, end) token offsets for every sentence."""
+        if len(self) == 0:
+            return []
+        starts = np.flatnonzero(np.diff(self.sent_ids, prepend=-1))
+        ends = np.append(starts[1:], len(self))
+        return list(zip(starts.tolist(), ends.tolist()))
+
+    def span_text(self, start, end):
+        """Rebuilds span text like `Span.text` (no trailing whitespace)."""
+        parts = []
+        for i in range(start, end):
+            parts.append(self.text(i))
+            if self.whitespace[i] and i < end - 1:
+                parts.append(" ")
+        return "".join(parts)
+
+
+class ArrayExtractor:
+    """
+    Array-backed engine producing the same components and relationships as
+    `UMLExtractor` and `RelationshipClassifier`, using vectorized masks and
+    index arithmetic over `TokenArrays` instead of walking spaCy Tokens.
+    """
+    def __init__(self):
+        # Reuse the rule lexicons so both engines can never drift apart
+        self.attribute_verbs = UMLExtractor().attribute_verbs
+        self._cue_classifier = RelationshipClassifier()
+        self._attribute_verb_ids = np.array(
+            [get_string_id(v) for v in self.attribute_verbs], dtype=np.uint64
+        )
+
+    def extract_components(self, doc):
+        arrays = self._as_arrays(doc)
+        if len(arrays) == 0:
+            return {"classes": [], "attributes": [], "methods": []}
+
+        index = np.arange(len(arrays))
+        graph = self._build_graph(arrays, index)
+        is_noun = np.isin(arrays.pos, NOUN_POS)
+        names = {}
+
+        def name_of(i):
+            if i not in names:
+                names[i] = self._compound_name(arrays, graph, i)
+            return names[i]
+
+        # 1. Classes: noun subjects/objects/attributes
+        class_idx = np.flatnonzero(is_noun & np.isin(arrays.dep, CLASS_DEPS))
+        classes = {name_of(i) for i in class_idx.tolist()}
+
+        # 2. Attributes: "<noun subject> has/contains/includes <dobj|attr> (+ conj chain)"
+        first_subject = graph["first_subject"]
+        attributes = []
+        verb_idx = np.flatnonzero(
+            np.isin(arrays.lemma, self._attribute_verb_ids) & np.isin(arrays.pos, ATTR_VERB_POS)
+        )
+        subjects = self._noun_or_missing(first_subject[verb_idx], is_noun)
+        for verb, subject in zip(verb_idx.tolist(), subjects.tolist()):
+            if subject < 0:
+                continue
+            class_name = name_of(subject)
+            for child in self._children(graph, verb):
+                if child > verb and arrays.dep[child] in ATTR_OBJECT_DEPS:
+                    for attr in self._conjunct_chain(arrays, graph, child):
+                        attributes.append((class_name, arrays.text(attr)))
+
+        # 3. Methods: subject-verb rule and xcomp/ccomp rule, in token order
+        methods = []
+        method_verbs = (arrays.pos == VERB_ID) & ~np.isin(arrays.lemma, self._attribute_verb_ids)
+        is_comp = method_verbs & np.isin(arrays.dep, COMPLEMENT_DEPS)
+
+        subj_owner = self._noun_or_missing(np.where(method_verbs, first_subject, -1), is_noun)
+        comp_owner = self._noun_or_missing(np.where(is_comp, graph["first_dobj"][arrays.head], -1), is_noun)
+
+        for verb in np.flatnonzero((subj_owner >= 0) | (comp_owner >= 0)).tolist():
+            method = arrays.lemma_text(verb)
+            if subj_owner[verb] >= 0:
+                methods.append((name_of(int(subj_owner[verb])), method))
+            if comp_owner[verb] >= 0:
+                methods.append((name_of(int(comp_owner[verb])), method))
+
+        return {
+            "classes": sorted(classes),
+            "attributes": attributes,
+            "methods": methods
+        }
+
+    def classify_relationships(self, doc, extracted_classes):
+        relationships = set()
+        arrays = self._as_arrays(doc)
+
+        if len(arrays) == 0 or not extracted_classes:
+            return []
+
+        class_set = set(extracted_classes)
+        graph = self._build_graph(arrays, np.arange(len(arrays)))
+        noun_idx = np.flatnonzero(np.isin(arrays.pos, NOUN_POS))
+        noun_sents = arrays.sent_ids[noun_idx]
+
+        # Group noun tokens by sentence with one searchsorted instead of a per-sentence scan
+        bounds = arrays.sentence_bounds()
+        cuts = np.searchsorted(noun_sents, np.arange(len(bounds) + 1))
+
+        for sent_no, (start, end) in enumerate(bounds):
+            # The first two distinct classes give the Subject -> Object direction
+            classes_in_sent = []
+            for i in noun_idx[cuts[sent_no]:cuts[sent_no + 1]].tolist():
+                noun_phrase = self._compound_name(arrays, graph, i)
+                if noun_phrase in class_set and noun_phrase not in classes_in_sent:
+                    classes_in_sent.append(noun_phrase)
+                    if len(classes_in_sent) == 2:
+                        break
+
+            if len(classes_in_sent) < 2:
+                continue
+
+            source, target = classes_in_sent
+            rel_type = self._cue_classifier.cue_relation_type(arrays.span_text(start, end).lower())
+            relationships.add((source, rel_type, target))
+
+        return sorted(relationships)
+
+    def _as_arrays(self, doc):
+        if isinstance(doc, TokenArrays):
+            return doc
+        return TokenArrays.from_doc(doc)
+
+    def _build_graph(self, arrays, index):
+        """
+        Builds a CSR children index plus first-child lookups.
+        A stable argsort by head keeps every child list in document order.
+        """
+        n = len(arrays)
+        head = arrays.head
+        is_child = head != index
+
+        order = np.argsort(np.where(is_child, head, n), kind="stable")
+        counts = np.bincount(head[is_child], minlength=n)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        # Left children with a subject label, and the first (leftmost) one per head
+        subj = np.flatnonzero(np.isin(arrays.dep, SUBJECT_DEPS) & is_child & (index < head))
+        first_subject = self._first_child(head, subj, n)
+
+        dobj = np.flatnonzero((arrays.dep == DOBJ_DEP) & is_child)
+        first_dobj = self._first_child(head, dobj, n)
+
+        return {
+            "order": order,
+            "offsets": offsets,
+            "first_subject": first_subject,
+            "first_dobj": first_dobj,
+        }
+
+    @staticmethod
+    def _first_child(head, children, n):
+        """
+        Maps every head to its first child among `children` (ascending token
+        indices), -1 where it has none. np.unique returns the first occurrence
+        of each head explicitly, instead of relying on the order in which
+        repeated fancy-index assignments are applied.
+        """
+        first = np.full(n, -1)
+        heads, first_pos = np.unique(head[children], return_index=True)
+        first[heads] = children[first_pos]
+        return first
+
+    def _noun_or_missing(self, candidates, is_noun):
+        """Keeps candidate token indices that are nouns, replacing the rest with -1."""
+        present = candidates >= 0
+        return np.where(present & is_noun[np.maximum(candidates, 0)], candidates, -1)
+
+    def _children(self, graph, i):
+        return graph["order"][graph["offsets"][i]:graph["offsets"][i + 1]].tolist()
+
+    def _compound_name(self, arrays, graph, i):
+        words = [arrays.text(c) for c in self._children(graph, i) if c < i and arrays.dep[c] == COMPOUND_DEP]
+        words.append(arrays.text(i))
+        return "".join(word.capitalize() for word in words)
+
+    def _conjunct_chain(self, arrays, graph, i):
+        """Pre-order walk of the conj subtree, matching `UMLExtractor._get_conjuncts`."""
+        chain = []
+        stack = [i]
+        while stack:
+            node = stack.pop()
+            chain.append(node)
+            conj_children = [c for c in self._children(graph, node) if arrays.dep[c] == CONJ_DEP]
+            stack.extend(reversed(conj_children))
+        return chain
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    sample_text = """
+    The Library Management System shall allow a User to borrow books.
+    A Librarian is a User.
+    The Library contains Books.
+    A User has a name, email_address, and user_id.
+    """
+
+    cleaned = clean_srs_text(sample_text)
+    parser = SRSParser()
+    doc = parser.parse(cleaned)
+
+    arrays = TokenArrays.from_doc(doc)
+    engine = ArrayExtractor()
+    components = engine.extract_components(arrays)
+    rels = engine.classify_relationships(arrays, components['classes'])
+
+    reference = UMLExtractor().extract_components(doc)
+    reference_rels = RelationshipClassifier().classify_relationships(doc, reference['classes'])
+
+    print(f"\nToken arrays: {len(arrays)} tokens, {arrays.nbytes} bytes")
+    print("\n=== ARRAY ENGINE COMPONENTS ===")
+    print(f"Classes:    {components['classes']}")
+    print(f"Attributes: {components['attributes']}")
+    print(f"Methods:    {components['methods']}")
+    print(f"Relationships: {rels}")
+    print(f"\nMatches Token-walking engine: {components == reference and rels == reference_rels}")
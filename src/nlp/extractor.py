@@ -1,22 +1,111 @@
 import logging
 import sys
 import os
+import time
+from spacy.matcher import Matcher, DependencyMatcher
 
 # Ensure the root directory is in the Python path for direct script execution
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from src.core.config import LEXICON_PATH
+from src.core.lexicons import load_lexicons
 from src.nlp.clean_text import clean_srs_text
 from src.nlp.parser import SRSParser
 
 logger = logging.getLogger(__name__)
 
+NOUN_TAGS = ["NOUN", "PROPN"]
+SUBJECT_DEPS = ["nsubj", "nsubjpass"]
+
 class UMLExtractor:
     """
     Extracts UML components (Classes, Attributes, Methods) from parsed text 
     using NLP heuristic rules.
+
+    The rules are declared as spaCy Matcher/DependencyMatcher patterns and
+    compiled once per vocabulary, so each Doc is scanned in a single matching
+    pass instead of one Python loop per rule.
+
+    With a RuleStats in `stats`, every rule runs through its own matcher so
+    its tokens, matches, emitted items and time can be attributed to it.
     """
-    def __init__(self):
-        self.attribute_verbs = {"have", "has", "contain", "contains", "include", "includes"}
+    def __init__(self, lexicon_path=LEXICON_PATH, stats=None):
+        self.attribute_verbs = load_lexicons(lexicon_path)["attribute_verbs"]
+        self.stats = stats
+        self._compiled_vocab = None
+        self._token_matcher = None
+        self._dep_matcher = None
+        self._rule_matchers = {}
+
+    def build_rules(self):
+        """
+        Declarative rule set: rule id -> (matcher kind, patterns).
+        Token indices in each dependency match follow the node order below.
+        """
+        verbs = sorted(self.attribute_verbs)
+        return {
+            # Class: noun acting as subject / object / predicate attribute
+            "CLASS_NOUN": ("token", [[
+                {"POS": {"IN": NOUN_TAGS}, "DEP": {"IN": ["nsubj", "nsubjpass", "dobj", "pobj", "attr"]}}
+            ]]),
+            # Attribute: subject -- have/contain/include -- dobj|attr (+ conj chain)
+            "ATTR_VERB_SUBJECT": ("dep", [[
+                {"RIGHT_ID": "verb", "RIGHT_ATTRS": {"LEMMA": {"IN": verbs}, "POS": {"IN": ["VERB", "AUX"]}}},
+                {"LEFT_ID": "verb", "REL_OP": ">--", "RIGHT_ID": "subject", "RIGHT_ATTRS": {"DEP": {"IN": SUBJECT_DEPS}}}
+            ]]),
+            "ATTR_VERB_OBJECT": ("dep", [[
+                {"RIGHT_ID": "verb", "RIGHT_ATTRS": {"LEMMA": {"IN": verbs}, "POS": {"IN": ["VERB", "AUX"]}}},
+                {"LEFT_ID": "verb", "REL_OP": ">++", "RIGHT_ID": "object", "RIGHT_ATTRS": {"DEP": {"IN": ["dobj", "attr"]}}}
+            ]]),
+            # Method: subject -- verb
+            "METHOD_SUBJECT_VERB": ("dep", [[
+                {"RIGHT_ID": "verb", "RIGHT_ATTRS": {"POS": "VERB", "LEMMA": {"NOT_IN": verbs}}},
+                {"LEFT_ID": "verb", "REL_OP": ">--", "RIGHT_ID": "subject", "RIGHT_ATTRS": {"DEP": {"IN": SUBJECT_DEPS}}}
+            ]]),
+            # Method: head -- dobj, head -- xcomp|ccomp verb ("allow a User to borrow")
+            "METHOD_COMPLEMENT": ("dep", [[
+                {"RIGHT_ID": "verb", "RIGHT_ATTRS": {"POS": "VERB", "LEMMA": {"NOT_IN": verbs}, "DEP": {"IN": ["xcomp", "ccomp"]}}},
+                {"LEFT_ID": "verb", "REL_OP": "<", "RIGHT_ID": "head", "RIGHT_ATTRS": {}},
+                {"LEFT_ID": "head", "REL_OP": ">", "RIGHT_ID": "object", "RIGHT_ATTRS": {"DEP": "dobj"}}
+            ]])
+        }
+
+    def _compile(self, vocab):
+        """Compiles the rule set into matchers (once per vocabulary)."""
+        if self._compiled_vocab is vocab:
+            return
+
+        self._token_matcher = Matcher(vocab)
+        self._dep_matcher = DependencyMatcher(vocab)
+        self._rule_matchers = {}
+        for rule_id, (kind, patterns) in self.build_rules().items():
+            if kind == "token":
+                self._token_matcher.add(rule_id, patterns)
+                single = Matcher(vocab)
+            else:
+                self._dep_matcher.add(rule_id, patterns)
+                single = DependencyMatcher(vocab)
+            single.add(rule_id, patterns)
+            self._rule_matchers[rule_id] = (kind, single)
+        self._compiled_vocab = vocab
+
+    def _match(self, doc):
+        """(token matches, dependency matches); timed per rule when instrumented."""
+        if self.stats is None:
+            return self._token_matcher(doc), self._dep_matcher(doc)
+
+        token_matches, dep_matches = [], []
+        for rule_id, (kind, matcher) in self._rule_matchers.items():
+            started = time.perf_counter()
+            matches = matcher(doc)
+            self.stats.record(rule_id, tokens=len(doc), matches=len(matches), seconds=time.perf_counter() - started)
+            (token_matches if kind == "token" else dep_matches).extend(matches)
+        return token_matches, dep_matches
+
+    def _emit(self, rule_id, kind, items, started):
+        if self.stats is not None:
+            self.stats.record(rule_id, seconds=time.perf_counter() - started)
+            self.stats.emit(rule_id, kind, items)
 
     def extract_components(self, doc):
         classes = set()
@@ -26,39 +115,72 @@ class UMLExtractor:
         if not doc:
             return {"classes": [], "attributes": [], "methods": []}
 
-        for sent in doc.sents:
-            # 1. Extract Classes (Added "attr" to catch inheritance objects like "User")
-            for token in sent:
-                if token.pos_ in ["NOUN", "PROPN"] and token.dep_ in ["nsubj", "nsubjpass", "dobj", "pobj", "attr"]:
-                    class_name = self._get_compound_noun(token)
-                    classes.add(class_name)
-
-            # 2. Extract Attributes
-            for token in sent:
-                if token.lemma_ in self.attribute_verbs and token.pos_ in ["VERB", "AUX"]:
-                    subject = next((w for w in token.lefts if w.dep_ in ["nsubj", "nsubjpass"]), None)
-                    if subject and subject.pos_ in ["NOUN", "PROPN"]:
-                        class_name = self._get_compound_noun(subject)
-                        
-                        for child in token.rights:
-                            if child.dep_ in ["dobj", "attr"]:
-                                attrs = self._get_conjuncts(child)
-                                for attr in attrs:
-                                    attributes.append((class_name, attr))
-
-            # 3. Extract Methods
-            for token in sent:
-                if token.pos_ == "VERB" and token.lemma_ not in self.attribute_verbs:
-                    subject = next((w for w in token.lefts if w.dep_ in ["nsubj", "nsubjpass"]), None)
-                    if subject and subject.pos_ in ["NOUN", "PROPN"]:
-                        class_name = self._get_compound_noun(subject)
-                        methods.append((class_name, token.lemma_))
-                    
-                    if token.dep_ in ["xcomp", "ccomp"]:
-                        head_dobj = next((w for w in token.head.children if w.dep_ == "dobj"), None)
-                        if head_dobj and head_dobj.pos_ in ["NOUN", "PROPN"]:
-                            class_name = self._get_compound_noun(head_dobj)
-                            methods.append((class_name, token.lemma_))
+        self._compile(doc.vocab)
+        strings = doc.vocab.strings
+        token_matches, dep_matches = self._match(doc)
+
+        # 1. Extract Classes
+        started = time.perf_counter()
+        for _, start, _ in token_matches:
+            classes.add(self._get_compound_noun(doc[start]))
+        self._emit("CLASS_NOUN", "classes", classes, started)
+
+        # Collect dependency matches, keyed by the anchoring verb
+        first_subject = {}  # verb -> leftmost subject child
+        objects = {}        # verb -> right-hand dobj/attr children
+        first_dobj = {}     # head -> first dobj child
+        complements = set() # xcomp/ccomp verbs
+        method_subject = {}
+
+        for match_id, token_ids in dep_matches:
+            rule_id = strings[match_id]
+            if rule_id == "ATTR_VERB_SUBJECT":
+                verb, subject = token_ids
+                first_subject[verb] = min(subject, first_subject.get(verb, subject))
+            elif rule_id == "ATTR_VERB_OBJECT":
+                verb, obj = token_ids
+                objects.setdefault(verb, set()).add(obj)
+            elif rule_id == "METHOD_SUBJECT_VERB":
+                verb, subject = token_ids
+                method_subject[verb] = min(subject, method_subject.get(verb, subject))
+            elif rule_id == "METHOD_COMPLEMENT":
+                verb, head, obj = token_ids
+                complements.add(verb)
+                first_dobj[head] = min(obj, first_dobj.get(head, obj))
+
+        # 2. Extract Attributes (emitted by the object rule; the subject rule supplies the owner)
+        started = time.perf_counter()
+        for verb in sorted(objects):
+            subject = doc[first_subject[verb]] if verb in first_subject else None
+            if subject is not None and subject.pos_ in NOUN_TAGS:
+                class_name = self._get_compound_noun(subject)
+                for obj in sorted(objects[verb]):
+                    for attr in self._get_conjuncts(doc[obj]):
+                        attributes.append((class_name, attr))
+        self._emit("ATTR_VERB_OBJECT", "attributes", attributes, started)
+
+        # 3. Extract Methods
+        started = time.perf_counter()
+        from_subject, from_complement = [], []
+        for verb in sorted(set(method_subject) | complements):
+            token = doc[verb]
+            subject = doc[method_subject[verb]] if verb in method_subject else None
+            if subject is not None and subject.pos_ in NOUN_TAGS:
+                methods.append((self._get_compound_noun(subject), token.lemma_))
+                from_subject.append(methods[-1])
+
+            if verb in complements:
+                head_dobj = doc[first_dobj[token.head.i]]
+                if head_dobj.pos_ in NOUN_TAGS:
+                    methods.append((self._get_compound_noun(head_dobj), token.lemma_))
+                    from_complement.append(methods[-1])
+        if self.stats is not None:
+            # Both method rules share one loop; its time is split by items emitted
+            share = (time.perf_counter() - started) / max(len(methods), 1)
+            self.stats.record("METHOD_SUBJECT_VERB", seconds=share * len(from_subject))
+            self.stats.record("METHOD_COMPLEMENT", seconds=share * len(from_complement))
+            self.stats.emit("METHOD_SUBJECT_VERB", "methods", from_subject)
+            self.stats.emit("METHOD_COMPLEMENT", "methods", from_complement)
 
         return {
             "classes": sorted(list(classes)),
@@ -72,10 +194,13 @@ class UMLExtractor:
         return "".join(word.capitalize() for word in compounds)
 
     def _get_conjuncts(self, token):
-        conjuncts = [token.text]
-        for child in token.children:
-            if child.dep_ == "conj":
-                conjuncts.extend(self._get_conjuncts(child))
+        # Iterative pre-order walk so deep conj chains cannot hit the recursion limit
+        conjuncts = []
+        stack = [token]
+        while stack:
+            current = stack.pop()
+            conjuncts.append(current.text)
+            stack.extend(reversed([child for child in current.children if child.dep_ == "conj"]))
         return conjuncts
 
 if __name__ == "__main__":
@@ -0,0 +1,280 @@
+import logging
+import sys
+import os
+
+import numpy as np
+import spacy
+from spacy.attrs import POS, DEP, HEAD, LEMMA
+from spacy.language import Language
+from spacy.parts_of_speech import IDS as UNIVERSAL_POS
+
+# Ensure the root directory is in the Python path for direct script execution
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import LEXICON_PATH
+from src.core.lexicons import load_lexicons
+
+logger = logging.getLogger(__name__)
+
+FAST_ENGINE_VERSION = "1.0"
+
+# Closed word classes for the lexicon-based shallow tagger
+DETERMINERS = {"a", "an", "the", "this", "that", "these", "those", "each", "every", "all", "some",
+               "any", "no", "its", "their", "his", "her", "our", "my", "your"}
+MODALS = {"shall", "should", "must", "will", "would", "can", "could", "may", "might"}
+BE_FORMS = {"is", "are", "was", "were", "be", "been", "being", "am"}
+PREPOSITIONS = {"of", "in", "on", "at", "for", "with", "by", "from", "into", "onto", "about", "via",
+                "within", "without", "through", "under", "over", "between", "after", "before", "per", "as"}
+CONJUNCTIONS = {"and", "or", "nor", "but"}
+PRONOUNS = {"it", "they", "he", "she", "we", "you", "i", "them", "who", "which", "whom"}
+ADVERBS = {"not", "also", "only", "automatically", "then", "always", "never"}
+IRREGULAR_LEMMAS = {"has": "have", "had": "have", "does": "do", "did": "do"}
+
+
+def _verb_lemma(lower: str) -> str:
+    if lower in IRREGULAR_LEMMAS:
+        return IRREGULAR_LEMMAS[lower]
+    if lower.endswith("ies") and len(lower) > 4:
+        return lower[:-3] + "y"
+    if lower.endswith(("sses", "shes", "ches", "xes", "zes")):
+        return lower[:-2]
+    if lower.endswith("s") and not lower.endswith("ss") and len(lower) > 3:
+        return lower[:-1]
+    return lower
+
+
+def _noun_lemma(lower: str) -> str:
+    if lower.endswith("ies") and len(lower) > 4:
+        return lower[:-3] + "y"
+    if lower.endswith("s") and not lower.endswith("ss") and len(lower) > 3:
+        return lower[:-1]
+    return lower
+
+
+class ShallowSRSParser:
+    """
+    Rule/lexicon-based tagger and chunker covering the sentence shapes the
+    extraction heuristics target ("X is a Y", "X has a, b and c",
+    "X shall verb Y", "X shall allow Y to verb Z"). It writes spaCy-style
+    POS/DEP/HEAD/LEMMA annotations, so the extractor and classifier run
+    unchanged on its Docs. Anything outside those shapes is attached loosely
+    to the sentence root, trading recall for speed.
+    """
+    def __init__(self, lexicon_path=LEXICON_PATH):
+        self.attribute_verbs = load_lexicons(lexicon_path)["attribute_verbs"]
+
+    def __call__(self, doc):
+        n = len(doc)
+        if n == 0:
+            return doc
+        strings = doc.vocab.strings
+        pos = [""] * n
+        deps = ["dep"] * n
+        heads = list(range(n))
+        lemmas = [token.lower_ for token in doc]
+
+        for sent in doc.sents:
+            self._tag(doc, sent.start, sent.end, pos, lemmas)
+            self._attach(sent.start, sent.end, pos, deps, heads, lemmas)
+
+        # HEAD is stored relative to each token, as two's complement in uint64
+        array = np.zeros((n, 4), dtype="uint64")
+        for i in range(n):
+            array[i, 0] = UNIVERSAL_POS[pos[i]]
+            array[i, 1] = strings.add(deps[i])
+            array[i, 2] = np.int64(heads[i] - i).astype("uint64")
+            array[i, 3] = strings.add(lemmas[i])
+        doc.from_array([POS, DEP, HEAD, LEMMA], array)
+        return doc
+
+    def _tag(self, doc, start, end, pos, lemmas):
+        seen_verb = False
+        for i in range(start, end):
+            token = doc[i]
+            lower = token.lower_
+            if token.is_punct:
+                pos[i] = "PUNCT"
+            elif token.like_num:
+                pos[i] = "NUM"
+            elif lower in DETERMINERS:
+                pos[i] = "DET"
+            elif lower in MODALS:
+                pos[i] = "AUX"
+            elif lower in BE_FORMS:
+                pos[i] = "AUX"
+                lemmas[i] = "be"
+            elif lower == "to":
+                nxt = doc[i + 1] if i + 1 < end else None
+                is_infinitive = nxt is not None and nxt.is_lower and nxt.lower_ not in DETERMINERS \
+                    and nxt.lower_ not in PRONOUNS
+                pos[i] = "PART" if is_infinitive else "ADP"
+            elif lower in PREPOSITIONS:
+                pos[i] = "ADP"
+            elif lower in CONJUNCTIONS:
+                pos[i] = "CCONJ"
+            elif lower in PRONOUNS:
+                pos[i] = "PRON"
+            elif lower in ADVERBS:
+                pos[i] = "ADV"
+            elif self._is_verb(doc, i, start, end, pos, lemmas, seen_verb):
+                pos[i] = "VERB"
+                lemmas[i] = _verb_lemma(lower)
+                seen_verb = True
+            elif token.is_title or token.is_upper:
+                pos[i] = "PROPN"
+                lemmas[i] = token.text
+            else:
+                pos[i] = "NOUN"
+                lemmas[i] = _noun_lemma(lower)
+
+    def _is_verb(self, doc, i, start, end, pos, lemmas, seen_verb) -> bool:
+        token = doc[i]
+        lower = token.lower_
+        prev = pos[i - 1] if i > start else ""
+        if lower in self.attribute_verbs:
+            return True
+        if prev in ("AUX", "PART"):
+            # "shall allow", "to borrow"; after a form of "be" only participles ("is created")
+            return lemmas[i - 1] != "be" or lower.endswith("ed")
+        if not token.is_lower:
+            return False
+        # Main verb without a modal: "The System manages ..."
+        if not seen_verb and prev in ("NOUN", "PROPN") and lower.endswith("s"):
+            return True
+        # Coordinated verbs: "create, update and delete Accounts", "... and deletes the Record"
+        if seen_verb and prev in ("CCONJ", "PUNCT") and i - 2 >= start and pos[i - 2] == "VERB":
+            return True
+        return prev == "CCONJ" and seen_verb and i + 1 < end and doc[i + 1].lower_ in DETERMINERS
+
+    def _attach(self, start, end, pos, deps, heads, lemmas):
+        # Noun chunks: maximal runs of nouns, the last one is the head
+        chunk_head = {}
+        i = start
+        while i < end:
+            if pos[i] in ("NOUN", "PROPN"):
+                j = i
+                while j + 1 < end and pos[j + 1] in ("NOUN", "PROPN"):
+                    j += 1
+                for k in range(i, j):
+                    deps[k], heads[k] = "compound", j
+                chunk_head[j] = i
+                i = j + 1
+            else:
+                i += 1
+
+        verbs = [k for k in range(start, end) if pos[k] == "VERB"]
+        main = [k for k in verbs if k == start or pos[k - 1] != "PART"]
+        if main:
+            root = main[0]
+        else:
+            # Copular sentence ("A Librarian is a User"): the form of "be" is the root
+            copulas = [k for k in range(start, end) if pos[k] == "AUX" and lemmas[k] == "be"]
+            root = copulas[0] if copulas else (max(chunk_head) if chunk_head else start)
+        deps[root], heads[root] = "ROOT", root
+        copular = pos[root] == "AUX"
+
+        current = root
+        has_object = set()
+        last_arg = {}   # verb -> last object/conjunct noun, for coordination chains
+        last_noun = None
+        for k in range(start, end):
+            if k == root or deps[k] == "compound":
+                continue
+            tag = pos[k]
+            if k < root:
+                if k in chunk_head:
+                    before = self._before_chunk(chunk_head[k], start, pos)
+                    if before is not None and pos[before] == "ADP":
+                        deps[k], heads[k] = "pobj", before
+                    else:
+                        deps[k], heads[k] = "nsubj", root
+                    last_noun = k
+                elif tag == "PRON":
+                    deps[k], heads[k] = "nsubj", root
+                elif tag in ("AUX", "PART", "ADV"):
+                    deps[k], heads[k] = ("neg" if tag == "ADV" else "aux"), root
+                elif tag == "DET":
+                    deps[k], heads[k] = "det", self._next_head(k, end, chunk_head, root)
+                elif tag == "ADP":
+                    deps[k], heads[k] = "prep", last_noun if last_noun is not None else root
+                else:
+                    deps[k], heads[k] = ("punct" if tag == "PUNCT" else "dep"), root
+                continue
+
+            if tag == "VERB":
+                if pos[k - 1] == "PART":
+                    deps[k], heads[k] = "xcomp", current
+                    deps[k - 1], heads[k - 1] = "aux", k
+                else:
+                    deps[k], heads[k] = "conj", root
+                current = k
+            elif k in chunk_head:
+                before = self._before_chunk(chunk_head[k], root, pos)
+                if pos[before] == "ADP":
+                    deps[k], heads[k] = "pobj", before
+                elif current in last_arg and pos[before] in ("CCONJ", "PUNCT") and \
+                        all(pos[m] in ("CCONJ", "PUNCT", "DET") for m in range(last_arg[current] + 1, chunk_head[k])):
+                    deps[k], heads[k] = "conj", last_arg[current]
+                    last_arg[current] = k
+                elif current not in has_object:
+                    deps[k], heads[k] = ("attr" if copular and current == root else "dobj"), current
+                    has_object.add(current)
+                    last_arg[current] = k
+                else:
+                    deps[k], heads[k] = "npadvmod", current
+                last_noun = k
+            elif tag == "DET":
+                deps[k], heads[k] = "det", self._next_head(k, end, chunk_head, current)
+            elif tag == "ADP":
+                deps[k], heads[k] = "prep", last_noun if last_noun is not None and last_noun > current else current
+            elif tag == "CCONJ":
+                deps[k], heads[k] = "cc", last_arg.get(current, current)
+            elif tag == "PUNCT":
+                deps[k], heads[k] = "punct", last_arg.get(current, root) if k + 1 < end else root
+            elif tag in ("AUX", "ADV"):
+                deps[k], heads[k] = ("neg" if tag == "ADV" else "aux"), current
+            elif tag == "PART":
+                deps[k], heads[k] = "aux", k + 1 if k + 1 < end else current
+            else:
+                deps[k], heads[k] = "dep", current
+
+    def _before_chunk(self, first, limit, pos):
+        """Index of the word before a noun chunk and its determiners (None at the sentence start)."""
+        before = first - 1
+        while before >= limit and pos[before] == "DET":
+            before -= 1
+        return before if before >= limit else None
+
+    def _next_head(self, k, end, chunk_head, fallback):
+        """Head noun of the chunk a determiner introduces."""
+        for head, first in chunk_head.items():
+            if first == k + 1:
+                return head
+        return fallback
+
+
+@Language.factory("srs_shallow_parser", default_config={"lexicon_path": LEXICON_PATH})
+def create_shallow_parser(nlp, name, lexicon_path):
+    return ShallowSRSParser(lexicon_path)
+
+
+def build_fast_pipeline():
+    """Blank English tokenizer + rule sentencizer + shallow tagger/chunker (no statistical model)."""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("srs_shallow_parser")
+    nlp.meta["name"] = "srs_fast"
+    nlp.meta["version"] = FAST_ENGINE_VERSION
+    return nlp
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    nlp = build_fast_pipeline()
+    doc = nlp("The Library Management System shall allow a User to borrow books. A User has a name, email_address, and user_id.")
+
+    print(f"{'Token':<15} | {'POS Tag':<8} | {'Dependency':<12} | {'Head Word'}")
+    print("-" * 55)
+    for token in doc:
+        print(f"{token.text:<15} | {token.pos_:<8} | {token.dep_:<12} | {token.head.text}")
@@ -0,0 +1,215 @@
+import os
+import re
+import sys
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import SPLIT_TARGET_CHARS, SPLIT_WORKERS
+from src.core.budget import split_sentences, BudgetExceeded
+from src.nlp.clean_text import clean_srs_text
+from src.nlp.parser import SRSParser
+from src.nlp.extractor import UMLExtractor
+from src.logic.classifier import RelationshipClassifier
+from src.logic.accumulator import sentence_entry, ModelAccumulator
+
+logger = logging.getLogger(__name__)
+
+# Markdown headings, numbered headings ("3.2 Borrowing", "4. Reports") and all-caps title lines
+HEADING_RE = re.compile(r"^[ \t]*(?:#{1,6}\s|\d+(?:\.\d+)*\.?[ \t]+[A-Z]|[A-Z][A-Z0-9 ,&/-]{2,}$)", re.M)
+SENTENCE_END_RE = re.compile(r"[.!?]\s*$")
+
+
+def split_sections(raw_text: str) -> list:
+    """
+    Cuts raw text before section headings, while the newlines are still there,
+    and cleans each section. Only cuts where the preceding text ends a
+    sentence are used, so a heading without punctuation is never separated
+    from the sentence clean_srs_text would glue it to. The cleaned sections
+    joined with single spaces equal clean_srs_text(raw_text).
+    """
+    cuts = [0]
+    for match in HEADING_RE.finditer(raw_text):
+        if match.start() > cuts[-1] and SENTENCE_END_RE.search(raw_text, cuts[-1], match.start()):
+            cuts.append(match.start())
+    cuts.append(len(raw_text))
+    sections = (clean_srs_text(raw_text[a:b]) for a, b in zip(cuts, cuts[1:]))
+    return [section for section in sections if section]
+
+
+def plan_shards(raw_text: str, cleaned_text: str, target_chars: int = SPLIT_TARGET_CHARS) -> list:
+    """
+    Sentence-aligned pieces of `cleaned_text` of roughly `target_chars` each.
+    Heading-aligned sections are packed together where possible; a section
+    larger than the target, or text that no longer matches the raw input
+    (e.g. after a budget truncated it), is cut between regex sentences.
+    """
+    sections = split_sections(raw_text) if raw_text else []
+    if " ".join(sections) != cleaned_text:
+        sections = [cleaned_text] if cleaned_text else []
+
+    shards, current = [], []
+    for section in sections:
+        pieces = [section] if len(section) <= target_chars else split_sentences(section)
+        for piece in pieces:
+            size = sum(len(p) + 1 for p in current)
+            if current and size + len(piece) > target_chars:
+                shards.append(" ".join(current))
+                current = []
+            current.append(piece)
+    if current:
+        shards.append(" ".join(current))
+    return shards
+
+
+def shard_jobs(shards: list) -> list:
+    """
+    (context before, shard, context after) per shard. The neighbouring
+    sentences are parsed along with each shard so a statistical parser sees
+    the same surroundings at the cut as it would in the whole document.
+    """
+    jobs = []
+    for i, shard in enumerate(shards):
+        before = split_sentences(shards[i - 1])[-1] if i > 0 else ""
+        after = split_sentences(shards[i + 1])[0] if i + 1 < len(shards) else ""
+        jobs.append((before, shard, after))
+    return jobs
+
+
+def extract_shard(parser, extractor, classifier, job) -> dict:
+    """
+    Parses one shard with its context and extracts only the sentences that
+    start inside the shard, so every sentence is owned by exactly one shard.
+    """
+    before, shard, after = job
+    start = len(before) + 1 if before else 0
+    end = start + len(shard)
+    doc = parser.parse(" ".join(part for part in job if part))
+    if doc is None:
+        return sentence_entry(None, extractor, classifier)
+
+    owned = [sent for sent in doc.sents if start <= sent.start_char < end]
+    if not owned:
+        return sentence_entry(None, extractor, classifier)
+    return sentence_entry(doc[owned[0].start:owned[-1].end].as_doc(), extractor, classifier)
+
+
+# --- Process-pool worker: one parser and rule set per process ---
+
+_worker = {}
+
+
+def _init_worker(engine):
+    _worker["parser"] = SRSParser(engine)
+    _worker["extractor"] = UMLExtractor()
+    _worker["classifier"] = RelationshipClassifier()
+
+
+def _run_job(job):
+    return extract_shard(_worker["parser"], _worker["extractor"], _worker["classifier"], job)
+
+
+_pool = None
+_pool_key = None
+_pool_lock = threading.Lock()
+
+
+def _shared_pool(workers: int, engine: str) -> ProcessPoolExecutor:
+    """
+    One extraction pool per process, created on first use and reused by every
+    document, so each worker loads the NLP engine once rather than once per
+    document. Like sharding._shared_pool it uses the "spawn" start method:
+    forking while batch reader and writer threads are alive can deadlock.
+    """
+    global _pool, _pool_key
+    with _pool_lock:
+        if _pool is None or _pool_key != (workers, engine):
+            if _pool is not None:
+                _pool.shutdown()
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                        initializer=_init_worker, initargs=(engine,))
+            _pool_key = (workers, engine)
+        return _pool
+
+
+class ParallelExtractor:
+    """
+    Parses and extracts a single large document on a process pool.
+
+    The document is split into sentence-aligned shards (section headings
+    first), each shard is parsed and extracted in a worker, and the partial
+    results are merged in document order with ModelAccumulator, which
+    yields the same model as extracting the whole text in one pass.
+    """
+    def __init__(self, parser, workers: int = SPLIT_WORKERS, target_chars: int = SPLIT_TARGET_CHARS):
+        self.parser = parser
+        self.workers = workers
+        self.target_chars = target_chars
+        self.extractor = UMLExtractor()
+        self.classifier = RelationshipClassifier()
+
+    def run(self, raw_text: str, cleaned_text: str, budget=None):
+        """
+        Returns (components, relationships) for cleaned text, like MemoizedExtractor.run.
+        A ResourceBudget is checked as each shard (in document order) completes;
+        when it runs out the remaining shards are cancelled and the model covers
+        the shards done so far (degrade), or BudgetExceeded is re-raised (skip).
+        """
+        jobs = shard_jobs(plan_shards(raw_text, cleaned_text, self.target_chars))
+        workers = min(self.workers, len(jobs))
+        logger.info(f"Extracting {len(jobs)} shard(s) on {max(workers, 1)} process(es)...")
+
+        entries = []
+        futures = []
+        try:
+            if workers <= 1:
+                results = (extract_shard(self.parser, self.extractor, self.classifier, job) for job in jobs)
+            else:
+                # Workers load the same engine by name; results are read back in document order
+                pool = _shared_pool(self.workers, self.parser.engine)
+                futures = [pool.submit(_run_job, job) for job in jobs]
+                results = (future.result() for future in futures)
+            for entry in results:
+                entries.append(entry)
+                if budget is not None:
+                    budget.check("parse")
+        except BudgetExceeded as exc:
+            if budget.on_exceed == "skip":
+                raise
+            budget.record("parse", f"{exc.reason}; kept {len(entries)}/{len(jobs)} shard(s)")
+        finally:
+            # The pool outlives this document; only its unfinished shards are dropped
+            for future in futures:
+                future.cancel()
+
+        accumulator = ModelAccumulator(self.classifier)
+        for entry in entries:
+            accumulator.add(entry)
+        return accumulator.snapshot()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    sample_text = """
+    1. Introduction
+    The Library Management System shall allow a User to borrow books.
+
+    2. Users
+    A Librarian is a User. A User has a name and an email.
+
+    3. Catalogue
+    The Library contains Books.
+    """
+
+    parser = SRSParser("fast")
+    cleaned = clean_srs_text(sample_text)
+    print(f"Shards: {plan_shards(sample_text, cleaned, target_chars=80)}")
+
+    components, rels = ParallelExtractor(parser, workers=2, target_chars=80).run(sample_text, cleaned)
+    print(f"\nClasses: {components['classes']}")
+    print(f"Relationships: {rels}")
@@ -1,4 +1,5 @@
 import spacy
+from spacy.tokens import Doc
 import logging
 import sys
 import os
@@ -6,28 +7,55 @@ import os
 # Ensure the root directory is in the Python path for direct script execution
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.core.config import SPACY_MODEL
+from src.core.config import SPACY_MODEL, PARSE_CHUNK_SENTENCES, PROCESSING_ENGINE
+from src.core.budget import BudgetExceeded, split_sentences
 from src.nlp.clean_text import clean_srs_text
+from src.nlp.fast_engine import build_fast_pipeline
 
 # Set up local logger
 logger = logging.getLogger(__name__)
 
+def _load_spacy_model():
+    logger.info(f"Loading spaCy model: '{SPACY_MODEL}'...")
+    try:
+        nlp = spacy.load(SPACY_MODEL)
+        logger.info("spaCy model loaded successfully.")
+        return nlp
+    except OSError:
+        logger.error(
+            f"Model '{SPACY_MODEL}' not found. "
+            f"Please run: python -m spacy download {SPACY_MODEL}"
+        )
+        raise
+
+
+# Processing engines: name -> loader returning a spaCy-compatible pipeline
+# (callable, .pipe(), .vocab, .meta) whose Docs carry POS/DEP/LEMMA annotations
+ENGINES = {
+    "spacy": _load_spacy_model,
+    "fast": build_fast_pipeline
+}
+
+
+def register_engine(name: str, loader):
+    """Makes an additional processing engine available to SRSParser."""
+    ENGINES[name] = loader
+
+
 class SRSParser:
     """
-    Handles natural language parsing of SRS documents using spaCy.
-    Performs sentence splitting, POS tagging, and dependency parsing.
+    Handles natural language parsing of SRS documents.
+    Performs sentence splitting, POS tagging, and dependency parsing with the
+    selected engine: the statistical spaCy model ("spacy") or the rule-based
+    shallow parser ("fast"), which trades some recall for much higher throughput.
     """
-    def __init__(self):
-        logger.info(f"Loading spaCy model: '{SPACY_MODEL}'...")
-        try:
-            self.nlp = spacy.load(SPACY_MODEL)
-            logger.info("spaCy model loaded successfully.")
-        except OSError:
-            logger.error(
-                f"Model '{SPACY_MODEL}' not found. "
-                f"Please run: python -m spacy download {SPACY_MODEL}"
-            )
-            raise
+    def __init__(self, engine: str = PROCESSING_ENGINE):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown processing engine '{engine}'. Available: {sorted(ENGINES)}")
+        self.engine = engine
+        if engine != "spacy":
+            logger.info(f"Loading processing engine: '{engine}'...")
+        self.nlp = ENGINES[engine]()
 
     def parse(self, text: str):
         """
@@ -39,6 +67,33 @@ class SRSParser:
             return None
         return self.nlp(text)
 
+    def parse_with_budget(self, text: str, budget, chunk_sentences: int = PARSE_CHUNK_SENTENCES):
+        """
+        Parses text in sentence-aligned chunks, checking the ResourceBudget
+        between chunks. If the budget runs out, the chunks parsed so far are
+        kept (degrade) or BudgetExceeded is re-raised (skip).
+        """
+        if not text or not text.strip():
+            logger.warning("Empty text passed to parser.")
+            return None
+
+        sentences = split_sentences(text)
+        chunks = [" ".join(sentences[i:i + chunk_sentences]) for i in range(0, len(sentences), chunk_sentences)]
+
+        docs = []
+        try:
+            for doc in self.nlp.pipe(chunks, batch_size=1):
+                docs.append(doc)
+                budget.check("parse")
+        except BudgetExceeded as exc:
+            if budget.on_exceed == "skip":
+                raise
+            budget.record("parse", f"{exc.reason}; kept {len(docs)}/{len(chunks)} chunk(s)")
+
+        if not docs:
+            return None
+        return docs[0] if len(docs) == 1 else Doc.from_docs(docs)
+
     def get_sentences(self, doc):
         """Extracts individual sentences from a parsed spaCy document."""
         if not doc:
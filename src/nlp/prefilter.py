@@ -0,0 +1,121 @@
+import os
+import re
+import sys
+import logging
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import LEXICON_PATH
+from src.core.lexicons import load_lexicons
+from src.core.budget import split_sentences
+from src.nlp.fast_engine import MODALS, BE_FORMS, DETERMINERS, PREPOSITIONS, CONJUNCTIONS, PRONOUNS
+
+logger = logging.getLogger(__name__)
+
+WORD_RE = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_'/-]*")
+LEADER_RE = re.compile(r"\.{4,}|(?:\. ){3,}|_{4,}")
+REFERENCE_RE = re.compile(r"^\s*(?:\[\d+\]|\(\d+\)|https?://|www\.|isbn\b|doi\b)", re.I)
+BOILERPLATE_RE = re.compile(
+    r"\b(?:copyright|all rights reserved|confidential|proprietary|trademarks?|disclaimer|"
+    r"page \d+ of \d+|licensed under|without (?:prior )?written permission)\b", re.I
+)
+MODAL_RE = re.compile(r"\b(?:" + "|".join(sorted(MODALS)) + r")\b", re.I)
+CLOSED_WORDS = DETERMINERS | PREPOSITIONS | CONJUNCTIONS | PRONOUNS | MODALS | BE_FORMS | {"to"}
+TABLE_NUMERIC_SHARE = 0.3
+
+
+class SentenceFilter:
+    """
+    Cheap lexical pre-filter run between clean_srs_text and parsing. It drops
+    regex sentences that the extraction rules cannot turn into a requirement:
+    table-of-contents leaders, bibliography entries, legal boilerplate,
+    revision-history/table rows and title-case fragments (headings) without
+    any predicate cue. Everything else is kept, so in doubt a sentence is
+    parsed as before: a sentence with a modal or predicate cue is never taken
+    for a reference or boilerplate, so numbered requirements ("(2) A
+    Librarian is a User.") and classes named like legal terms ("A Trademark
+    is an Asset.") survive.
+    """
+    def __init__(self, lexicon_path=LEXICON_PATH):
+        lexicons = load_lexicons(lexicon_path)
+        cues = set(MODALS) | set(BE_FORMS) | set(lexicons["attribute_verbs"]) \
+            | set(lexicons["inheritance_cues"]) | set(lexicons["aggregation_cues"])
+        self._predicate_re = re.compile(
+            r"\b(?:" + "|".join(re.escape(c) for c in sorted(cues, key=len, reverse=True)) + r")\b"
+        )
+
+    def reason(self, sentence: str):
+        """Why `sentence` is dropped, or None to keep it."""
+        words = WORD_RE.findall(sentence)
+        if not any(word[0].isalpha() for word in words):
+            return "no_words"
+        if LEADER_RE.search(sentence):
+            return "toc"
+
+        lower = sentence.lower()
+        if MODAL_RE.search(lower) or self._predicate_re.search(lower):
+            return None
+        if REFERENCE_RE.match(sentence):
+            return "reference"
+        if self._is_boilerplate(lower):
+            return "boilerplate"
+
+        if sum(any(ch.isdigit() for ch in word) for word in words) >= TABLE_NUMERIC_SHARE * len(words):
+            return "table"
+        if not any(word.islower() and len(word) > 2 and word not in CLOSED_WORDS for word in words):
+            return "heading"
+        return None
+
+    @staticmethod
+    def _is_boilerplate(lower: str) -> bool:
+        """Legal phrases count unless used as a noun after a determiner ("The Copyright Office ...")."""
+        for match in BOILERPLATE_RE.finditer(lower):
+            previous = lower[:match.start()].split()[-1:]
+            if not previous or previous[0] not in DETERMINERS:
+                return True
+        return False
+
+    def filter_text(self, text: str):
+        """Returns (kept text, stats) with dropped counts per reason."""
+        sentences = split_sentences(text)
+        kept, reasons, dropped_chars = [], {}, 0
+        for sentence in sentences:
+            why = self.reason(sentence)
+            if why is None:
+                kept.append(sentence)
+            else:
+                reasons[why] = reasons.get(why, 0) + 1
+                dropped_chars += len(sentence)
+
+        stats = {
+            "sentences": len(sentences),
+            "dropped": len(sentences) - len(kept),
+            "dropped_chars": dropped_chars,
+            "reasons": reasons
+        }
+        logger.info(
+            f"Pre-filter dropped {stats['dropped']}/{stats['sentences']} sentence(s) "
+            f"({dropped_chars}/{len(text)} chars): {reasons}"
+        )
+        return " ".join(kept), stats
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    sample_text = (
+        "Table of Contents 1 Introduction ........ 3 1.1 Purpose ........ 4 "
+        "Revision History 1.0 2021-03-01 J. Smith Initial draft. "
+        "[1] IEEE Std 830-1998, Recommended Practice for Software Requirements Specifications. "
+        "Copyright 2021 ACME Corp. All rights reserved. "
+        "(1) The system shall store records. (2) A Trademark is an Asset. "
+        "The Copyright Office maintains Registrations. "
+        "The Library Management System shall allow a User to borrow books. "
+        "A Librarian is a User. The Library contains Books. Members borrow books."
+    )
+
+    sentence_filter = SentenceFilter()
+    for sentence in split_sentences(sample_text):
+        print(f"{str(sentence_filter.reason(sentence)):<12} | {sentence}")
+    print(sentence_filter.filter_text(sample_text))
@@ -0,0 +1,204 @@
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+
+# Ensure the root directory is in the Python path for direct script execution
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import MEMO_PATH, MEMO_MAX_ENTRIES
+from src.core.budget import split_sentences, BudgetExceeded
+from src.nlp.clean_text import clean_srs_text
+from src.nlp.parser import SRSParser
+from src.nlp.extractor import UMLExtractor
+from src.logic.classifier import RelationshipClassifier
+from src.logic.accumulator import sentence_entry, ModelAccumulator
+
+logger = logging.getLogger(__name__)
+
+
+class SentenceMemo:
+    """
+    Persistent SQLite cache of per-sentence extraction results.
+    Bounded to `max_entries`; the least recently used entries are evicted.
+    """
+    def __init__(self, path=MEMO_PATH, max_entries=MEMO_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS sentence_memo ("
+            " key TEXT PRIMARY KEY, payload TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_memo_last_used ON sentence_memo(last_used)")
+        self.conn.commit()
+        self._size = self.conn.execute("SELECT COUNT(*) FROM sentence_memo").fetchone()[0]
+
+    def get_many(self, keys: list) -> dict:
+        """Returns {key: payload} for the keys present and refreshes their recency."""
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        # Stay below SQLite's bound-parameter limit
+        for i in range(0, len(unique), 500):
+            batch = unique[i:i + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.conn.execute(
+                f"SELECT key, payload FROM sentence_memo WHERE key IN ({placeholders})", batch
+            ).fetchall()
+            found.update((key, json.loads(payload)) for key, payload in rows)
+
+        if found:
+            now = time.time()
+            self.conn.executemany(
+                "UPDATE sentence_memo SET last_used = ? WHERE key = ?", [(now, key) for key in found]
+            )
+            self.conn.commit()
+
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, entries: dict):
+        """Stores {key: payload} and evicts old entries past the size bound."""
+        if not entries:
+            return
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO sentence_memo (key, payload, last_used) VALUES (?, ?, ?)",
+                [(key, json.dumps(payload), now) for key, payload in entries.items()]
+            )
+        self._size += len(entries)
+
+        if self._size > self.max_entries:
+            self._evict()
+
+    def _evict(self):
+        # Trim to 90% of the bound so eviction does not run on every insert
+        keep = int(self.max_entries * 0.9)
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM sentence_memo WHERE key NOT IN "
+                "(SELECT key FROM sentence_memo ORDER BY last_used DESC LIMIT ?)", (keep,)
+            )
+        self._size = self.conn.execute("SELECT COUNT(*) FROM sentence_memo").fetchone()[0]
+        logger.info(f"Sentence memo evicted down to {self._size} entries")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+    def close(self):
+        self.conn.close()
+
+
+class MemoizedExtractor:
+    """
+    Runs parse -> extract -> classify per sentence, reusing memoized results for
+    sentences already seen (keyed by normalized text + model/rule version).
+
+    Relationships depend on the document-wide class list, so the memo stores each
+    sentence's candidate noun phrases and cue type, and links them per document.
+    Sentences are parsed in isolation, which can differ marginally from parsing
+    them in the context of the whole document.
+    """
+    def __init__(self, memo, parser, extractor=None, classifier=None):
+        self.memo = memo
+        self.parser = parser
+        self.extractor = extractor or UMLExtractor()
+        self.classifier = classifier or RelationshipClassifier()
+        self.version = self.rule_version()
+
+    def rule_version(self) -> str:
+        """Hash of the spaCy model and rule set; any change invalidates old entries."""
+        meta = getattr(self.parser.nlp, "meta", {}) or {}
+        fingerprint = {
+            "model": f"{meta.get('lang', '')}_{meta.get('name', '')}-{meta.get('version', '')}",
+            "rules": self.extractor.build_rules(),
+            "inheritance_cues": sorted(self.classifier.inheritance_cues),
+            "aggregation_cues": sorted(self.classifier.aggregation_cues)
+        }
+        encoded = json.dumps(fingerprint, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha1(encoded).hexdigest()[:16]
+
+    def normalize(self, sentence: str) -> str:
+        return re.sub(r"\s+", " ", sentence).strip()
+
+    def key(self, normalized: str) -> str:
+        return hashlib.sha1(f"{self.version}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def run(self, text: str, budget=None):
+        """
+        Returns (components, relationships) for cleaned text. A ResourceBudget
+        is checked after every parsed sentence; when it runs out the sentences
+        not parsed yet are left out (degrade) or BudgetExceeded is re-raised (skip).
+        """
+        sentences = [self.normalize(s) for s in split_sentences(text)]
+        sentences = [s for s in sentences if s]
+        keys = [self.key(s) for s in sentences]
+
+        cached = self.memo.get_many(keys)
+
+        # Parse only the sentences not seen before, in one batched pipe
+        pending = {}
+        for key, sentence in zip(keys, sentences):
+            if key not in cached and key not in pending:
+                pending[key] = sentence
+        if pending:
+            fresh = {}
+            try:
+                for key, doc in zip(pending, self.parser.nlp.pipe(pending.values())):
+                    fresh[key] = sentence_entry(doc, self.extractor, self.classifier)
+                    if budget is not None:
+                        budget.check("parse")
+            except BudgetExceeded as exc:
+                if budget.on_exceed == "skip":
+                    raise
+                budget.record("parse", f"{exc.reason}; parsed {len(fresh)}/{len(pending)} new sentence(s)")
+            self.memo.put_many(fresh)
+            cached.update(fresh)
+            keys = [key for key in keys if key in cached]
+
+        logger.info(
+            f"Sentence memo: {len(sentences) - len(pending)}/{len(sentences)} sentence(s) reused"
+        )
+        return self._combine([cached[key] for key in keys])
+
+    def _combine(self, entries: list):
+        accumulator = ModelAccumulator(self.classifier)
+        for entry in entries:
+            accumulator.add(entry)
+        return accumulator.snapshot()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    boilerplate = "The System shall log all transactions."
+    documents = [
+        f"The Library contains Books. {boilerplate}",
+        f"A Librarian is a User. {boilerplate}"
+    ]
+
+    parser = SRSParser()
+    memo = SentenceMemo(path=":memory:")
+    memoized = MemoizedExtractor(memo, parser)
+
+    for text in documents:
+        components, rels = memoized.run(clean_srs_text(text))
+        print(f"\nClasses: {components['classes']}")
+        print(f"Relationships: {rels}")
+
+    print(f"\nMemo stats: {memo.stats()}")
@@ -0,0 +1,124 @@
+import os
+import sys
+import time
+import logging
+import threading
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import UI_BATCH_SENTENCES
+from src.core.budget import split_sentences
+from src.nlp.clean_text import clean_srs_text
+from src.nlp.extractor import UMLExtractor
+from src.logic.classifier import RelationshipClassifier
+from src.logic.accumulator import sentence_entry, ModelAccumulator
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionJob:
+    """
+    Shared state between a UI session and the worker running its extraction:
+    progress counters, partial results and a cancellation flag.
+    All fields are guarded by a lock; the UI only ever reads snapshots.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self.state = "queued"   # queued -> running -> done | cancelled | failed
+        self.done = 0
+        self.total = 0
+        self.error = None
+        self.started = None
+        self.finished = None
+        self._components = {"classes": [], "attributes": [], "methods": []}
+        self._relationships = []
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def active(self) -> bool:
+        return self.state in ("queued", "running")
+
+    def progress(self) -> float:
+        with self._lock:
+            return self.done / self.total if self.total else 0.0
+
+    def snapshot(self):
+        """Returns (components, relationships) extracted so far."""
+        with self._lock:
+            return self._components, self._relationships
+
+    def _update(self, **fields):
+        with self._lock:
+            for name, value in fields.items():
+                setattr(self, name, value)
+
+
+def run_extraction_job(job: ExtractionJob, raw_text: str, parser, batch_sentences: int = UI_BATCH_SENTENCES):
+    """
+    Worker entry point: clean -> parse -> extract -> classify in sentence batches,
+    publishing partial results to `job` after every batch and stopping early
+    when the job is cancelled.
+    """
+    if job.cancelled:
+        job._update(state="cancelled", finished=time.time())
+        return job
+
+    job._update(state="running", started=time.time())
+    try:
+        # Per-job rule objects: compiled matchers are not shared between threads
+        extractor = UMLExtractor()
+        classifier = RelationshipClassifier()
+        accumulator = ModelAccumulator(classifier)
+
+        sentences = split_sentences(clean_srs_text(raw_text))
+        batches = [" ".join(sentences[i:i + batch_sentences]) for i in range(0, len(sentences), batch_sentences)]
+        job._update(total=len(sentences))
+
+        done = 0
+        for batch, doc in zip(batches, parser.nlp.pipe(batches, batch_size=1)):
+            if job.cancelled:
+                break
+            accumulator.add(sentence_entry(doc, extractor, classifier))
+            done = min(done + batch_sentences, len(sentences))
+            components, relationships = accumulator.snapshot()
+            job._update(done=done, _components=components, _relationships=relationships)
+
+        job._update(state="cancelled" if job.cancelled else "done", finished=time.time())
+    except Exception as exc:
+        logger.exception("Background extraction failed")
+        job._update(state="failed", error=str(exc), finished=time.time())
+    return job
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    from concurrent.futures import ThreadPoolExecutor
+    from src.nlp.parser import SRSParser
+
+    sample_text = """
+    The Library Management System shall allow a User to borrow books.
+    A Librarian is a User.
+    The Library contains Books.
+    """
+
+    pool = ThreadPoolExecutor(max_workers=2)
+    job = ExtractionJob()
+    pool.submit(run_extraction_job, job, sample_text, SRSParser(), 1)
+
+    while job.active:
+        print(f"[{job.state}] {job.progress():.0%}")
+        time.sleep(0.1)
+
+    components, rels = job.snapshot()
+    print(f"\nFinal state: {job.state}")
+    print(f"Classes: {components['classes']}")
+    print(f"Relationships: {rels}")
+    pool.shutdown()
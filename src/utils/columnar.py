@@ -0,0 +1,198 @@
+import os
+import sys
+import json
+import logging
+import tempfile
+
+import numpy as np
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logger = logging.getLogger(__name__)
+
+# One row per extracted fact: (doc_id, kind, subject, predicate, object).
+# Every document also gets one "document" row first (the document-id table),
+# so models without any fact survive a round trip.
+COLUMNS = ["doc_id", "kind", "subject", "predicate", "object"]
+KINDS = ["class", "attribute", "method", "relationship", "document"]
+DOCUMENT_KIND = KINDS.index("document")
+
+
+def flatten_model(full_data: dict) -> dict:
+    """
+    Converts the pipeline's JSON layout ({"components": ..., "relationships": ...})
+    into the flat layout used by the evaluator and ground truth files.
+    """
+    if "components" not in full_data:
+        return full_data
+    model = dict(full_data["components"])
+    model["relationships"] = full_data.get("relationships", [])
+    return model
+
+
+class ColumnarStore:
+    """
+    Stores extracted UML models for many documents in one columnar file.
+
+    - `.npz`: array-backed layout (int32 codes into a shared UTF-8 string table),
+      needs only NumPy.
+    - `.parquet` / `.feather`: the same table through pandas (requires pyarrow).
+    """
+    def __init__(self):
+        self.pandas_formats = {".parquet", ".feather"}
+
+    def iter_rows(self, models: dict):
+        """Yields a document row and one row per fact for a {doc_id: flat model} mapping."""
+        for doc_id, model in models.items():
+            yield (doc_id, DOCUMENT_KIND, "", "", "")
+            for cls in model.get("classes", []):
+                yield (doc_id, 0, cls, "", "")
+            for cls, attr in model.get("attributes", []):
+                yield (doc_id, 1, cls, attr, "")
+            for cls, method in model.get("methods", []):
+                yield (doc_id, 2, cls, method, "")
+            for source, rel_type, target in model.get("relationships", []):
+                yield (doc_id, 3, source, rel_type, target)
+
+    def to_dataframe(self, models: dict):
+        import pandas as pd
+
+        df = pd.DataFrame(list(self.iter_rows(models)), columns=COLUMNS)
+        df["kind"] = pd.Categorical.from_codes(df["kind"], categories=KINDS)
+        for col in ["doc_id", "subject", "predicate", "object"]:
+            df[col] = df[col].astype("category")
+        return df
+
+    def write(self, models: dict, path: str) -> str:
+        """Writes {doc_id: flat model} to `path`; the extension selects the format."""
+        ext = os.path.splitext(path)[1].lower()
+
+        if ext in self.pandas_formats:
+            df = self.to_dataframe(models)
+            try:
+                if ext == ".parquet":
+                    df.to_parquet(path, index=False)
+                else:
+                    df.to_feather(path)
+            except ImportError:
+                logger.error(f"Writing '{ext}' requires pyarrow. Please run: pip install pyarrow")
+                raise
+        else:
+            # np.savez_compressed appends .npz to any other name; report the file really written
+            if not path.endswith(".npz"):
+                path += ".npz"
+            self._write_npz(models, path)
+
+        logger.info(f"Stored {len(models)} model(s) in {path}")
+        return path
+
+    def load(self, path: str) -> dict:
+        """Loads a columnar file back into {doc_id: flat model} with tuple items."""
+        if not os.path.exists(path):
+            logger.error(f"Columnar file not found: {path}")
+            return {}
+
+        ext = os.path.splitext(path)[1].lower()
+        if ext in self.pandas_formats:
+            import pandas as pd
+
+            df = pd.read_parquet(path) if ext == ".parquet" else pd.read_feather(path)
+            kind_codes = pd.Categorical(df["kind"].astype(str), categories=KINDS).codes
+            columns = [df[col].astype(str).tolist() for col in ["doc_id", "subject", "predicate", "object"]]
+            return self._group(columns[0], kind_codes.tolist(), *columns[1:])
+
+        with np.load(path) as data:
+            strings = self._decode_strings(data["string_blob"], data["string_offsets"])
+            codes = {col: data[col] for col in COLUMNS}
+
+        # Resolve each column once through the string table instead of per item
+        lookup = np.array(strings, dtype=object)
+        return self._group(
+            lookup[codes["doc_id"]].tolist(),
+            codes["kind"].tolist(),
+            lookup[codes["subject"]].tolist(),
+            lookup[codes["predicate"]].tolist(),
+            lookup[codes["object"]].tolist()
+        )
+
+    def pack_json_files(self, json_paths: list, path: str) -> str:
+        """Packs existing `_components.json` outputs into one columnar file."""
+        models = {}
+        for json_path in json_paths:
+            doc_id = os.path.basename(json_path).replace("_components.json", "")
+            with open(json_path, "r", encoding="utf-8") as f:
+                models[doc_id] = flatten_model(json.load(f))
+        return self.write(models, path)
+
+    def _write_npz(self, models, path):
+        string_ids = {"": 0}
+        columns = {col: [] for col in COLUMNS}
+
+        for row in self.iter_rows(models):
+            for col, value in zip(COLUMNS, row):
+                if col == "kind":
+                    columns[col].append(value)
+                else:
+                    columns[col].append(string_ids.setdefault(value, len(string_ids)))
+
+        encoded = [s.encode("utf-8") for s in string_ids]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+
+        np.savez_compressed(
+            path,
+            string_blob=np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            string_offsets=offsets,
+            kind=np.array(columns["kind"], dtype=np.int8),
+            **{col: np.array(columns[col], dtype=np.int32) for col in COLUMNS if col != "kind"}
+        )
+
+    def _decode_strings(self, blob, offsets):
+        raw = blob.tobytes()
+        bounds = offsets.tolist()
+        return [raw[bounds[i]:bounds[i + 1]].decode("utf-8") for i in range(len(bounds) - 1)]
+
+    def _group(self, doc_ids, kinds, subjects, predicates, objects):
+        models = {}
+        for doc_id, kind, subject, predicate, obj in zip(doc_ids, kinds, subjects, predicates, objects):
+            model = models.get(doc_id)
+            if model is None:
+                model = models[doc_id] = {"classes": [], "attributes": [], "methods": [], "relationships": []}
+            if kind == DOCUMENT_KIND:
+                continue
+            if kind == 0:
+                model["classes"].append(subject)
+            elif kind == 1:
+                model["attributes"].append((subject, predicate))
+            elif kind == 2:
+                model["methods"].append((subject, predicate))
+            else:
+                model["relationships"].append((subject, predicate, obj))
+        return models
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    test_models = {
+        "sample_srs": {
+            "classes": ['Books', 'Librarian', 'Library', 'LibraryManagementSystem', 'User'],
+            "attributes": [('User', 'name'), ('User', 'email_address'), ('User', 'user_id')],
+            "methods": [('LibraryManagementSystem', 'allow'), ('User', 'borrow')],
+            "relationships": [
+                ('Librarian', 'Inheritance', 'User'),
+                ('Library', 'Aggregation', 'Books'),
+                ('LibraryManagementSystem', 'Association', 'Library')
+            ]
+        },
+        "empty_srs": {"classes": [], "attributes": [], "methods": [], "relationships": []}
+    }
+
+    store = ColumnarStore()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        out_path = store.write(test_models, os.path.join(tmp_dir, "corpus_components"))
+        loaded = store.load(out_path)
+
+    print("=== ROUND TRIP ===")
+    print(f"Identical: {loaded == test_models}")
@@ -0,0 +1,277 @@
+import os
+import re
+import sys
+import time
+import sqlite3
+import logging
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.config import INDEX_PATH, DEFAULT_CONFIDENCE
+from src.core.budget import split_sentences
+from src.logic.confidence import ConfidenceScorer
+
+logger = logging.getLogger(__name__)
+
+WORD_RE = re.compile(r"[A-Za-z0-9_]+")
+MAX_PHRASE_WORDS = 4
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sentences (
+    id INTEGER PRIMARY KEY,
+    doc_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS facts (
+    id INTEGER PRIMARY KEY,
+    doc_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    predicate TEXT NOT NULL DEFAULT '',
+    object TEXT NOT NULL DEFAULT '',
+    confidence REAL NOT NULL,
+    UNIQUE (doc_id, kind, subject, predicate, object)
+);
+CREATE TABLE IF NOT EXISTS mentions (
+    fact_id INTEGER NOT NULL REFERENCES facts(id) ON DELETE CASCADE,
+    sentence_id INTEGER NOT NULL REFERENCES sentences(id) ON DELETE CASCADE,
+    PRIMARY KEY (fact_id, sentence_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_facts_subject ON facts(kind, subject);
+CREATE INDEX IF NOT EXISTS idx_facts_object ON facts(kind, predicate, object);
+CREATE INDEX IF NOT EXISTS idx_facts_doc ON facts(doc_id);
+CREATE INDEX IF NOT EXISTS idx_sentences_doc ON sentences(doc_id);
+CREATE INDEX IF NOT EXISTS idx_mentions_sentence ON mentions(sentence_id);
+"""
+
+
+def sentence_spans(text: str) -> list:
+    """(start, end, sentence) character spans of the regex sentence split."""
+    spans, pos = [], 0
+    for sentence in split_sentences(text):
+        start = text.find(sentence, pos)
+        if start < 0:
+            continue
+        pos = start + len(sentence)
+        spans.append((start, pos, sentence))
+    return spans
+
+
+def _sentence_vocab(sentence: str):
+    """Lower-cased words and every concatenated run of up to MAX_PHRASE_WORDS words."""
+    words = [w.lower() for w in WORD_RE.findall(sentence)]
+    phrases = set()
+    for i in range(len(words)):
+        for j in range(i + 1, min(i + MAX_PHRASE_WORDS, len(words)) + 1):
+            phrases.add("".join(words[i:j]))
+    return words, phrases
+
+
+def locate_facts(text: str, full_data: dict):
+    """
+    Attributes each extracted fact to the sentences that support it:
+    a class where its (compound) name occurs, an attribute/method where its
+    class and member occur, a relationship where both classes occur.
+    Returns (sentence spans, {fact key: [sentence index, ...]}).
+    Fact keys are (kind, subject, predicate, object) with '' for unused parts.
+    """
+    components = full_data["components"]
+    spans = sentence_spans(text)
+
+    # Inverted index: word or concatenated phrase -> sentences containing it
+    postings = {}
+    words_of = []
+    for idx, (_, _, sentence) in enumerate(spans):
+        words, phrases = _sentence_vocab(sentence)
+        words_of.append(words)
+        for phrase in phrases:
+            postings.setdefault(phrase, []).append(idx)
+
+    def where(name):
+        return postings.get(name.lower(), [])
+
+    facts = {}
+    for cls in components["classes"]:
+        facts[("class", cls, "", "")] = list(where(cls))
+    for cls, attr in components["attributes"]:
+        attr_sents = set(where(attr))
+        facts[("attribute", cls, "", attr)] = [i for i in where(cls) if i in attr_sents]
+    for cls, method in components["methods"]:
+        # Methods are verb lemmas ("borrow" for "borrows")
+        lemma = method.lower()
+        facts[("method", cls, "", method)] = [
+            i for i in where(cls) if any(word.startswith(lemma) for word in words_of[i])
+        ]
+    for source, rel_type, target in full_data["relationships"]:
+        target_sents = set(where(target))
+        facts[("relationship", source, rel_type, target)] = [i for i in where(source) if i in target_sents]
+    return spans, facts
+
+
+def fact_confidences(full_data: dict) -> dict:
+    """
+    ConfidenceScorer scores (the ones shown in the UI) keyed like locate_facts.
+    Sentence support is not folded in; it is queryable through `mentions`.
+    """
+    components = full_data["components"]
+    scores = ConfidenceScorer().score_all(components, full_data["relationships"])
+    confidences = {}
+    for cls in components["classes"]:
+        confidences[("class", cls, "", "")] = scores["classes"].get(cls, DEFAULT_CONFIDENCE)
+    for cls, attr in components["attributes"]:
+        confidences[("attribute", cls, "", attr)] = scores["attributes"].get(f"{cls}.{attr}", DEFAULT_CONFIDENCE)
+    for cls, method in components["methods"]:
+        confidences[("method", cls, "", method)] = scores["methods"].get(f"{cls}.{method}()", DEFAULT_CONFIDENCE)
+    for source, rel_type, target in full_data["relationships"]:
+        confidences[("relationship", source, rel_type, target)] = scores["relationships"].get(
+            f"[{source}] --({rel_type})--> [{target}]", DEFAULT_CONFIDENCE
+        )
+    return confidences
+
+
+class ComponentIndex:
+    """
+    SQLite index of extracted components and relationships across a corpus,
+    with their ConfidenceScorer scores and source-sentence offsets (into the
+    cleaned text).
+    Re-indexing a document replaces its facts in one transaction.
+    """
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def upsert_document(self, name: str, text: str, full_data: dict):
+        """Indexes one document's model; replaces anything indexed under `name` before."""
+        spans, facts = locate_facts(text, full_data)
+        confidences = fact_confidences(full_data)
+        with self.conn:
+            self.conn.execute("DELETE FROM documents WHERE name = ?", (name,))
+            doc_id = self.conn.execute(
+                "INSERT INTO documents (name, indexed_at) VALUES (?, ?)", (name, time.time())
+            ).lastrowid
+            self._bulk_insert(doc_id, spans, facts, confidences)
+        logger.info(f"Indexed {len(facts)} fact(s) from {len(spans)} sentence(s) of '{name}'")
+
+    def _bulk_insert(self, doc_id, spans, facts, confidences):
+        # Row ids are assigned up front so every table is filled with one executemany
+        next_sentence = (self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM sentences").fetchone()[0]) + 1
+        next_fact = (self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM facts").fetchone()[0]) + 1
+
+        self.conn.executemany(
+            "INSERT INTO sentences (id, doc_id, start, end, text) VALUES (?, ?, ?, ?, ?)",
+            [(next_sentence + i, doc_id, start, end, sentence) for i, (start, end, sentence) in enumerate(spans)]
+        )
+        fact_rows, mention_rows = [], []
+        for offset, ((kind, subject, predicate, obj), located) in enumerate(facts.items()):
+            fact_id = next_fact + offset
+            confidence = confidences[(kind, subject, predicate, obj)]
+            fact_rows.append((fact_id, doc_id, kind, subject, predicate, obj, confidence))
+            mention_rows.extend((fact_id, next_sentence + idx) for idx in located)
+        self.conn.executemany(
+            "INSERT INTO facts (id, doc_id, kind, subject, predicate, object, confidence) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            fact_rows
+        )
+        self.conn.executemany("INSERT INTO mentions (fact_id, sentence_id) VALUES (?, ?)", mention_rows)
+
+    def remove_document(self, name: str):
+        with self.conn:
+            self.conn.execute("DELETE FROM documents WHERE name = ?", (name,))
+
+    # --- Query API ---
+
+    def facts(self, kind=None, subject=None, predicate=None, obj=None, document=None, min_confidence=0.0) -> list:
+        """Facts matching every given filter, as dicts."""
+        clauses, params = ["f.confidence >= ?"], [min_confidence]
+        for column, value in (("f.kind", kind), ("f.subject", subject), ("f.predicate", predicate),
+                              ("f.object", obj), ("d.name", document)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        rows = self.conn.execute(
+            "SELECT f.id, d.name, f.kind, f.subject, f.predicate, f.object, f.confidence "
+            "FROM facts f JOIN documents d ON d.id = f.doc_id "
+            f"WHERE {' AND '.join(clauses)} ORDER BY d.name, f.kind, f.subject, f.object", params
+        ).fetchall()
+        keys = ("id", "document", "kind", "subject", "predicate", "object", "confidence")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def documents_mentioning(self, class_name: str) -> list:
+        """Documents in which `class_name` was extracted as a class."""
+        rows = self.conn.execute(
+            "SELECT d.name FROM facts f JOIN documents d ON d.id = f.doc_id "
+            "WHERE f.kind = 'class' AND f.subject = ? ORDER BY d.name", (class_name,)
+        ).fetchall()
+        return [name for (name,) in rows]
+
+    def subclasses_of(self, class_name: str, transitive: bool = False) -> list:
+        """(document, class) pairs inheriting from `class_name`, optionally through several levels."""
+        if not transitive:
+            rows = self.conn.execute(
+                "SELECT d.name, f.subject FROM facts f JOIN documents d ON d.id = f.doc_id "
+                "WHERE f.kind = 'relationship' AND f.predicate = 'Inheritance' AND f.object = ? "
+                "ORDER BY d.name, f.subject", (class_name,)
+            ).fetchall()
+        else:
+            rows = self.conn.execute(
+                "WITH RECURSIVE sub(doc_id, name) AS ("
+                "  SELECT doc_id, subject FROM facts "
+                "  WHERE kind = 'relationship' AND predicate = 'Inheritance' AND object = ? "
+                "  UNION "
+                "  SELECT f.doc_id, f.subject FROM facts f JOIN sub ON f.doc_id = sub.doc_id AND f.object = sub.name "
+                "  WHERE f.kind = 'relationship' AND f.predicate = 'Inheritance'"
+                ") SELECT d.name, sub.name FROM sub JOIN documents d ON d.id = sub.doc_id ORDER BY d.name, sub.name",
+                (class_name,)
+            ).fetchall()
+        return [tuple(row) for row in rows]
+
+    def sentences_for(self, fact_id: int) -> list:
+        """Supporting sentences of a fact as (start, end, text), in document order."""
+        rows = self.conn.execute(
+            "SELECT s.start, s.end, s.text FROM mentions m JOIN sentences s ON s.id = m.sentence_id "
+            "WHERE m.fact_id = ? ORDER BY s.start", (fact_id,)
+        ).fetchall()
+        return [tuple(row) for row in rows]
+
+    def stats(self) -> dict:
+        count = lambda table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        return {table: count(table) for table in ("documents", "sentences", "facts", "mentions")}
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    text = "The Library Management System shall allow a User to borrow books. A Librarian is a User. The Library contains Books."
+    full_data = {
+        "components": {
+            "classes": ['Books', 'Librarian', 'Library', 'LibraryManagementSystem', 'User'],
+            "attributes": [('Library', 'Books')],
+            "methods": [('LibraryManagementSystem', 'allow'), ('User', 'borrow')]
+        },
+        "relationships": [('Librarian', 'Inheritance', 'User'), ('Library', 'Aggregation', 'Books')]
+    }
+
+    index = ComponentIndex(":memory:")
+    index.upsert_document("sample_srs.txt", text, full_data)
+
+    print(f"Documents mentioning User: {index.documents_mentioning('User')}")
+    print(f"Subclasses of User: {index.subclasses_of('User')}")
+    for fact in index.facts(kind="method"):
+        print(fact, index.sentences_for(fact["id"]))
+    print(f"Index stats: {index.stats()}")
@@ -0,0 +1,64 @@
+import math
+
+import pandas as pd
+import streamlit as st
+
+DEFAULT_PAGE_SIZE = 50
+
+SEARCH_COLUMNS = {
+    "classes": ["Class"],
+    "attributes": ["Class", "Attribute"],
+    "methods": ["Class", "Method"],
+    "relationships": ["Source", "Type", "Target"]
+}
+
+
+def build_model_tables(components: dict, relationships: list) -> dict:
+    """
+    Builds one DataFrame per panel, once per model. Each table carries a
+    lower-cased `_search` column so filtering is a single vectorized scan.
+    """
+    attributes = pd.DataFrame(components['attributes'], columns=["Class", "Attribute"])
+    methods = pd.DataFrame(components['methods'], columns=["Class", "Method"])
+    methods["Method"] = methods["Method"] + "()"
+    rels = pd.DataFrame(relationships, columns=["Source", "Type", "Target"])
+
+    classes = pd.DataFrame({"Class": components['classes']})
+    classes["Attributes"] = classes["Class"].map(attributes["Class"].value_counts()).fillna(0).astype(int)
+    classes["Methods"] = classes["Class"].map(methods["Class"].value_counts()).fillna(0).astype(int)
+
+    tables = {"classes": classes, "attributes": attributes, "methods": methods, "relationships": rels}
+    for name, df in tables.items():
+        text_cols = SEARCH_COLUMNS[name]
+        search = df[text_cols[0]].astype(str)
+        for col in text_cols[1:]:
+            search = search + " " + df[col].astype(str)
+        df["_search"] = search.str.lower()
+    return tables
+
+
+def filter_page(df, query: str, page: int, page_size: int = DEFAULT_PAGE_SIZE):
+    """Returns (rows of the requested page, number of matches, number of pages)."""
+    if query:
+        df = df[df["_search"].str.contains(query.lower(), regex=False)]
+    n_pages = max(1, math.ceil(len(df) / page_size))
+    page = min(max(page, 1), n_pages)
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size].drop(columns="_search"), len(df), n_pages
+
+
+def render_table_panel(df, key: str, page_size: int = DEFAULT_PAGE_SIZE):
+    """Searchable, paginated table; only the visible page is sent to the browser."""
+    if df.empty:
+        st.write("*None detected*")
+        return
+
+    query = st.text_input("Search", key=f"{key}_query", placeholder="Filter...", label_visibility="collapsed")
+    page = st.session_state.get(f"{key}_page", 1)
+    rows, matches, n_pages = filter_page(df, query, page, page_size)
+
+    st.dataframe(rows, hide_index=True, use_container_width=True)
+    if n_pages > 1:
+        st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=min(page, n_pages),
+                        step=1, key=f"{key}_page")
+    st.caption(f"{matches} of {len(df)} rows")
@@ -0,0 +1,152 @@
+import os
+import sys
+import json
+import time
+import logging
+import tracemalloc
+from contextlib import contextmanager
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.budget import current_rss_mb
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+def peak_rss_mb():
+    """Returns the process high-water RSS in MB (VmHWM), or None if unavailable."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_kb / 1024 if sys.platform != "darwin" else peak_kb / MB
+
+
+def reset_peak_rss():
+    """Resets VmHWM on Linux so each stage reports its own peak; no-op elsewhere."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class StageMemoryProfiler:
+    """
+    Records tracemalloc usage and RSS around each pipeline stage of one document
+    and attributes the top allocation sites that were still alive after the stage.
+    """
+    def __init__(self, document: str, top_n: int = 10, frames: int = 5):
+        self.document = document
+        self.top_n = top_n
+        self.frames = frames
+        self.stages = []
+        self._started_tracing = False
+        # Built once: compiling filters inside a stage would show up as allocations
+        self._filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__)
+        ]
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str):
+        self.start()
+        peak_reset = reset_peak_rss()
+        before = self._snapshot()
+        traced_before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        rss_before = current_rss_mb()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            traced_after, traced_peak = tracemalloc.get_traced_memory()
+            after = self._snapshot()
+            peak = peak_rss_mb()
+            rss_after = current_rss_mb()
+            self.stages.append({
+                "stage": name,
+                "seconds": round(seconds, 4),
+                "traced_delta_mb": round((traced_after - traced_before) / MB, 3),
+                "traced_peak_mb": round((traced_peak - traced_before) / MB, 3),
+                "rss_before_mb": self._round(rss_before),
+                "rss_after_mb": self._round(rss_after),
+                # Without a VmHWM reset this is the process-lifetime peak
+                "peak_rss_mb": self._round(peak),
+                "peak_rss_scope": "stage" if peak_reset else "process",
+                "top_allocations": self._top_sites(after, before)
+            })
+
+    def report(self) -> dict:
+        worst = max(self.stages, key=lambda s: s["traced_peak_mb"], default=None)
+        return {
+            "document": self.document,
+            "stages": self.stages,
+            "heaviest_stage": worst["stage"] if worst else None
+        }
+
+    def write(self, path: str) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=4)
+        logger.info(f"Memory profile saved to: {path}")
+        return path
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def _top_sites(self, after, before):
+        sites = []
+        for diff in after.compare_to(before, "traceback")[:self.top_n]:
+            if diff.size_diff <= 0:
+                continue
+            frame = diff.traceback[-1]  # Most recent frame (tracebacks are oldest-first)
+            sites.append({
+                "site": f"{frame.filename}:{frame.lineno}",
+                "size_kb": round(diff.size_diff / 1024, 1),
+                "count": diff.count_diff,
+                "traceback": [f"{f.filename}:{f.lineno}" for f in diff.traceback]
+            })
+        return sites
+
+    def _round(self, value):
+        return round(value, 1) if value is not None else None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    profiler = StageMemoryProfiler("demo", top_n=3)
+    with profiler.stage("allocate"):
+        blob = json.loads(json.dumps([str(i) * 10 for i in range(100_000)]))
+    with profiler.stage("release"):
+        del blob
+    profiler.stop()
+
+    print("=== MEMORY PROFILE ===")
+    for stage in profiler.report()["stages"]:
+        print(f"{stage['stage']:<10} peak={stage['traced_peak_mb']} MB  delta={stage['traced_delta_mb']} MB  "
+              f"rss={stage['rss_after_mb']} MB  sites={[s['site'] for s in stage['top_allocations']]}")
@@ -0,0 +1,96 @@
+import os
+import sys
+import json
+import logging
+
+# Ensure the root directory is in the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logger = logging.getLogger(__name__)
+
+COUNTERS = ("tokens_examined", "matches", "emitted", "seconds")
+
+# Rule ids of the classifier; the extractor's come from UMLExtractor.build_rules()
+CLASSIFIER_RULES = ("CUE_INHERITANCE", "CUE_AGGREGATION", "DEFAULT_ASSOCIATION")
+
+
+class RuleStats:
+    """
+    Optional per-rule instrumentation for UMLExtractor and RelationshipClassifier.
+
+    For every rule id it counts tokens examined, matches fired, items emitted
+    and seconds spent, per document and summed over the corpus, and keeps the
+    provenance of every emitted item (which rule(s) produced it). Pass one
+    instance as `stats=` to the extractor and classifier and call
+    start_document() before each document.
+    """
+    def __init__(self):
+        self.documents = {}   # document -> rule id -> counters
+        self.provenance = {}  # document -> kind -> item -> [rule ids]
+        self.current = None
+
+    def start_document(self, name: str):
+        self.current = name
+        self.documents[name] = {}
+        self.provenance[name] = {}
+
+    def _rules(self):
+        if self.current is None:
+            self.start_document("<unnamed>")
+        return self.documents[self.current]
+
+    def record(self, rule_id: str, tokens: int = 0, matches: int = 0, seconds: float = 0.0):
+        counters = self._rules().setdefault(rule_id, dict.fromkeys(COUNTERS, 0))
+        counters["tokens_examined"] += tokens
+        counters["matches"] += matches
+        counters["seconds"] += seconds
+
+    def emit(self, rule_id: str, kind: str, items):
+        """Records items emitted by a rule; an item emitted twice by the same rule counts once."""
+        self.record(rule_id)
+        counters = self._rules()[rule_id]
+        by_item = self.provenance[self.current].setdefault(kind, {})
+        for item in items:
+            rules = by_item.setdefault(item, [])
+            if rule_id not in rules:
+                rules.append(rule_id)
+                counters["emitted"] += 1
+
+    def rules_of(self, kind: str, item, document: str = None) -> list:
+        return self.provenance.get(document or self.current, {}).get(kind, {}).get(item, [])
+
+    def items_of(self, rule_id: str, kind: str, document: str = None) -> set:
+        """Items of one kind that `rule_id` emitted in a document."""
+        by_item = self.provenance.get(document or self.current, {}).get(kind, {})
+        return {item for item, rules in by_item.items() if rule_id in rules}
+
+    def corpus(self) -> dict:
+        """Counters summed over every document."""
+        totals = {}
+        for rules in self.documents.values():
+            for rule_id, counters in rules.items():
+                total = totals.setdefault(rule_id, dict.fromkeys(COUNTERS, 0))
+                for key in COUNTERS:
+                    total[key] += counters[key]
+        return totals
+
+    def provenance_json(self, document: str = None) -> dict:
+        """Provenance in a JSON-friendly layout: kind -> [[*item, [rule ids]], ...]."""
+        return {
+            kind: [[*(item if isinstance(item, tuple) else (item,)), rules] for item, rules in sorted(by_item.items())]
+            for kind, by_item in self.provenance.get(document or self.current, {}).items()
+        }
+
+    def report(self) -> dict:
+        def rounded(rules):
+            return {rule_id: dict(counters, seconds=round(counters["seconds"], 6))
+                    for rule_id, counters in sorted(rules.items())}
+        return {
+            "documents": {name: rounded(rules) for name, rules in self.documents.items()},
+            "corpus": rounded(self.corpus())
+        }
+
+    def write(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=4)
+        logger.info(f"Rule statistics for {len(self.documents)} document(s) saved to {path}")